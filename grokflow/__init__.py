@@ -18,7 +18,7 @@ from grokflow.validators import InputValidator, PathSanitizer
 from grokflow.session_manager import SessionManager, transactional_session
 from grokflow.rate_limiter import RateLimiter, get_rate_limiter
 from grokflow.api_client import GrokAPIClient, get_api_client
-from grokflow.dual_model import DualModelOrchestrator, SimpleExecutor, get_orchestrator
+from grokflow.dual_model import DualModelOrchestrator, SimpleExecutor, LLMCache, SemanticCache, get_orchestrator
 from grokflow.knowledge_base import KnowledgeBase, get_knowledge_base
 from grokflow.context_manager import ContextManager, get_context_manager
 from grokflow.undo_manager import UndoManager, get_undo_manager
@@ -61,6 +61,8 @@ __all__ = [
     'get_api_client',
     'DualModelOrchestrator',
     'SimpleExecutor',
+    'LLMCache',
+    'SemanticCache',
     'get_orchestrator',
     'KnowledgeBase',
     'get_knowledge_base',
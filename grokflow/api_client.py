@@ -8,11 +8,13 @@ Centralized API client for x.ai Grok models with:
 - Error handling and logging
 - Model validation
 - Cost tracking integration
+- Shared keep-alive connection pool (HTTP/2 when h2 is installed)
 """
 
 import os
+import threading
 import time
-from typing import Optional, Dict, List, Iterator, Any
+from typing import Optional, Dict, List, Iterator, Any, Iterable, Tuple
 from pathlib import Path
 
 import httpx
@@ -23,11 +25,75 @@ from grokflow.exceptions import (
     ModelNotAvailableError, APITimeoutError
 )
 from grokflow.logging_config import get_logger
-from grokflow.rate_limiter import get_rate_limiter
+from grokflow.rate_limiter import get_rate_limiter, get_api_throttle
+
+# h2 (optional) enables HTTP/2 multiplexing on the shared pool
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
 
 logger = get_logger('grokflow.api_client')
 
 
+# ==============================================================================
+# Shared HTTP Connection Pool
+# ==============================================================================
+
+# Default size of the shared pool (keep-alive and total connections)
+DEFAULT_MAX_CONNECTIONS = 32
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client(max_connections: int = DEFAULT_MAX_CONNECTIONS) -> httpx.Client:
+    """
+    Get the process-wide pooled HTTP client
+    
+    Every GrokAPIClient shares it, so TCP/TLS connections stay warm across
+    planner and executor calls and across get_api_client(force_new=True).
+    The pool is sized by the first caller.
+    
+    Args:
+        max_connections: Keep-alive and total connection limit
+        
+    Returns:
+        Shared httpx.Client
+    """
+    global _http_client
+    
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            # Transport retries cover connection failures only; API errors
+            # are retried by GrokAPIClient._execute_with_retry()
+            _http_client = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=H2_AVAILABLE,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=max_connections,
+                        max_connections=max_connections
+                    ),
+                    retries=2
+                )
+            )
+            logger.debug(
+                f"HTTP pool created: max_connections={max_connections}, http2={H2_AVAILABLE}"
+            )
+        return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client (a new one is created on next use)"""
+    global _http_client
+    
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
 class GrokAPIClient:
     """
     Centralized API client for x.ai Grok models
@@ -56,6 +122,18 @@ class GrokAPIClient:
         'grok-3-mini'     # Previous generation mini
     }
     
+    # Context windows in tokens (prompt + completion)
+    CONTEXT_WINDOWS = {
+        'grok-4-fast': 2_000_000,
+        'grok-4': 256_000,
+        'grok-beta': 131_072,
+        'grok-3': 131_072,
+        'grok-3-mini': 131_072
+    }
+    
+    # Headroom left for the prompt-size estimate being low
+    CONTEXT_SAFETY_TOKENS = 1024
+    
     # Default models for dual-model architecture
     DEFAULT_PLANNER = 'grok-beta'
     DEFAULT_EXECUTOR = 'grok-4-fast'
@@ -69,12 +147,17 @@ class GrokAPIClient:
     DEFAULT_TIMEOUT = 120.0
     STREAMING_TIMEOUT = 300.0
     
+    # How long a check_model_availability() probe result is reused
+    MODEL_CHECK_TTL = 300.0
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: str = "https://api.x.ai/v1",
         timeout: Optional[float] = None,
-        enable_rate_limiting: bool = True
+        enable_rate_limiting: bool = True,
+        http_client: Optional[httpx.Client] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS
     ):
         """
         Initialize API client
@@ -84,6 +167,9 @@ class GrokAPIClient:
             base_url: API base URL
             timeout: Request timeout in seconds
             enable_rate_limiting: Enable rate limiting
+            http_client: HTTP client to use (default: shared pool, which
+                close() leaves open)
+            max_connections: Size of the shared pool if this creates it
         """
         # Get API key
         self.api_key = api_key or os.environ.get("XAI_API_KEY")
@@ -93,19 +179,18 @@ class GrokAPIClient:
                 "or pass api_key parameter."
             )
         
-        # Initialize OpenAI client
+        # Initialize OpenAI client on a pooled HTTP client
+        self._shared_http_client = http_client is None
         self.client = OpenAI(
             api_key=self.api_key,
             base_url=base_url,
             timeout=timeout or self.DEFAULT_TIMEOUT,
-            http_client=httpx.Client(
-                limits=httpx.Limits(
-                    max_keepalive_connections=5,
-                    max_connections=10
-                )
-            )
+            http_client=http_client or get_http_client(max_connections)
         )
         
+        # model -> (available, checked at), see check_model_availability()
+        self._availability: Dict[str, Tuple[bool, float]] = {}
+        
         # Rate limiting
         self.enable_rate_limiting = enable_rate_limiting
         if enable_rate_limiting:
@@ -130,6 +215,24 @@ class GrokAPIClient:
                 f"Valid models: {', '.join(sorted(self.VALID_MODELS))}"
             )
     
+    def validate_models(self, models: Iterable[str]) -> None:
+        """
+        Validate several model names at once
+        
+        Args:
+            models: Model names to validate
+            
+        Raises:
+            ModelNotAvailableError: Naming every invalid model
+        """
+        invalid = sorted(set(models) - self.VALID_MODELS)
+        if invalid:
+            logger.error(f"Invalid models: {', '.join(invalid)}")
+            raise ModelNotAvailableError(
+                f"Model(s) {', '.join(repr(m) for m in invalid)} not available. "
+                f"Valid models: {', '.join(sorted(self.VALID_MODELS))}"
+            )
+    
     def chat_completion(
         self,
         messages: List[Dict[str, Any]],
@@ -179,7 +282,9 @@ class GrokAPIClient:
             **kwargs
         }
         
+        input_tokens = self._estimate_tokens(messages)
         if max_tokens:
+            max_tokens = self._budget_max_tokens(model, input_tokens, max_tokens)
             request_params['max_tokens'] = max_tokens
         
         logger.debug(
@@ -188,19 +293,63 @@ class GrokAPIClient:
         )
         
         # Execute with retry
-        return self._execute_with_retry(request_params, stream=stream)
+        return self._execute_with_retry(
+            request_params,
+            stream=stream,
+            estimated_tokens=input_tokens + (max_tokens or 0)
+        )
+    
+    def _budget_max_tokens(self, model: str, input_tokens: int, max_tokens: int) -> int:
+        """
+        Cap the completion budget at what the context window has left
+        
+        Args:
+            model: Model name
+            input_tokens: Estimated prompt tokens
+            max_tokens: Requested completion limit
+            
+        Returns:
+            max_tokens, lowered if prompt + completion would overflow
+        """
+        window = self.CONTEXT_WINDOWS.get(model)
+        if window is None:
+            return max_tokens
+        
+        available = window - input_tokens - self.CONTEXT_SAFETY_TOKENS
+        if available >= max_tokens:
+            return max_tokens
+        if available < 1:
+            # Prompt alone is too big; leave it to the API to reject
+            logger.warning(
+                f"Prompt (~{input_tokens} tokens) exceeds {model} context window ({window})"
+            )
+            return max_tokens
+        
+        logger.debug(f"max_tokens lowered from {max_tokens} to {available} for {model}")
+        return available
+    
+    @staticmethod
+    def _estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+        """Rough prompt token count (~4 characters per token)"""
+        chars = sum(len(str(m.get('content', ''))) for m in messages)
+        return chars // 4
     
     def _execute_with_retry(
         self,
         request_params: Dict[str, Any],
-        stream: bool = False
+        stream: bool = False,
+        estimated_tokens: int = 0
     ) -> Any:
         """
         Execute API request with exponential backoff retry
         
+        With rate limiting enabled, each attempt first waits on the model's
+        shared throttle, which backs off on 429s and recovers on success.
+        
         Args:
             request_params: Request parameters
             stream: Whether this is a streaming request
+            estimated_tokens: Token estimate for the throttle's TPM bucket
             
         Returns:
             API response or stream iterator
@@ -210,12 +359,19 @@ class GrokAPIClient:
         """
         last_error = None
         retry_delay = self.INITIAL_RETRY_DELAY
+        throttle = (
+            get_api_throttle(request_params['model']) if self.enable_rate_limiting else None
+        )
         
         for attempt in range(self.MAX_RETRIES):
+            if throttle is not None:
+                throttle.acquire(estimated_tokens)
             try:
                 # Make API call
                 response = self.client.chat.completions.create(**request_params)
                 
+                if throttle is not None:
+                    throttle.on_success()
                 logger.debug(f"API call succeeded on attempt {attempt + 1}")
                 return response
                 
@@ -226,6 +382,8 @@ class GrokAPIClient:
                 # Handle specific errors
                 if 'rate_limit' in str(e).lower() or '429' in str(e):
                     logger.warning(f"Rate limit error (attempt {attempt + 1}): {e}")
+                    if throttle is not None:
+                        throttle.on_rate_limited()
                     if attempt < self.MAX_RETRIES - 1:
                         time.sleep(retry_delay)
                         retry_delay = min(retry_delay * 2, self.MAX_RETRY_DELAY)
@@ -290,8 +448,9 @@ class GrokAPIClient:
             )
             
             for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
                     
         except Exception as e:
             logger.error(f"Streaming error: {e}", exc_info=True)
@@ -301,12 +460,19 @@ class GrokAPIClient:
         """
         Check if model is available
         
+        Probes with a minimal request; the answer is reused for
+        MODEL_CHECK_TTL seconds.
+        
         Args:
             model: Model name to check
             
         Returns:
             True if model is available
         """
+        cached = self._availability.get(model)
+        if cached is not None and time.monotonic() - cached[1] < self.MODEL_CHECK_TTL:
+            return cached[0]
+        
         try:
             self.validate_model(model)
             
@@ -318,11 +484,14 @@ class GrokAPIClient:
             )
             
             logger.info(f"Model {model} is available")
-            return True
+            available = True
             
         except Exception as e:
             logger.warning(f"Model {model} not available: {e}")
-            return False
+            available = False
+        
+        self._availability[model] = (available, time.monotonic())
+        return available
     
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -341,7 +510,9 @@ class GrokAPIClient:
         }
     
     def close(self) -> None:
-        """Close HTTP client connections"""
+        """Close HTTP client connections (the shared pool stays open)"""
+        if self._shared_http_client:
+            return
         try:
             self.client.close()
             logger.debug("API client closed")
@@ -351,6 +522,7 @@ class GrokAPIClient:
 
 # Global client instance
 _global_client: Optional[GrokAPIClient] = None
+_global_client_lock = threading.Lock()
 
 
 def get_api_client(
@@ -369,7 +541,11 @@ def get_api_client(
     """
     global _global_client
     
-    if _global_client is None or force_new:
-        _global_client = GrokAPIClient(api_key=api_key)
+    if _global_client is not None and not force_new:
+        return _global_client
     
-    return _global_client
+    with _global_client_lock:
+        # Another thread may have built it while we waited
+        if _global_client is None or force_new:
+            _global_client = GrokAPIClient(api_key=api_key)
+        return _global_client
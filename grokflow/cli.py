@@ -17,9 +17,11 @@ Features:
 - Input validation
 """
 
+import os
 import sys
 import time
-from typing import Optional, List, Dict, Any, Callable
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator
 from enum import Enum
 from pathlib import Path
 
@@ -85,13 +87,105 @@ class CLI:
         Initialize CLI
         
         Args:
-            use_colors: Enable colored output
+            use_colors: Enable colored output (off when stdout is not a
+                terminal or NO_COLOR is set)
             verbose: Enable verbose output
         """
-        self.use_colors = use_colors and sys.stdout.isatty()
+        # stdout the color decision was made for (see get_cli)
+        self._color_stream = sys.stdout
+        self.use_colors = (
+            use_colors
+            and sys.stdout.isatty()
+            and not os.environ.get('NO_COLOR')
+        )
         self.verbose = verbose
+        self._err_buf: Optional[List[str]] = None
+        self._sep_cache: Dict[tuple, str] = {}
+        
+        # Fixed (prefix, suffix) around each message kind; the icon and
+        # color codes never change for the lifetime of the instance
+        self._px: Dict[str, tuple] = {
+            'success': self._affixes(Icon.SUCCESS, Color.GREEN, True),
+            'warning': self._affixes(Icon.WARNING, Color.YELLOW, True),
+            'info': self._affixes(Icon.INFO, Color.CYAN, True),
+            'bullet': self._affixes(Icon.BULLET, Color.CYAN, False),
+            'arrow': self._affixes(Icon.ARROW, Color.BLUE, False),
+        }
+        # Encoded affixes for the stdout they were encoded for
+        self._px_stream: Any = None
+        self._px_b: Optional[Dict[str, tuple]] = None
         logger.debug(f"CLI initialized: colors={use_colors}, verbose={verbose}")
     
+    def _affixes(self, icon: Icon, color: Color, color_message: bool) -> tuple:
+        """Build (prefix, suffix) for '<icon> <message>' lines"""
+        prefix = self._colorize(icon.value, color) + ' '
+        suffix = '\n'
+        if color_message and self.use_colors:
+            prefix += color.value
+            suffix = Color.RESET.value + suffix
+        return prefix, suffix
+    
+    def _bind_stdout(self, stream: Any) -> None:
+        """Pre-encode the line affixes for byte-level writes to `stream`"""
+        self._px_stream = stream
+        self._px_b = None
+        
+        encoding = getattr(stream, 'encoding', None)
+        if (
+            not encoding
+            or getattr(stream, 'buffer', None) is None
+            or not hasattr(stream, 'write_through')
+        ):
+            return
+        
+        try:
+            errors = stream.errors or 'strict'
+            self._px_b = {
+                kind: (px.encode(encoding, errors), sx.encode(encoding, errors))
+                for kind, (px, sx) in self._px.items()
+            }
+        except (LookupError, UnicodeEncodeError) as e:
+            logger.debug(f"Byte-level stdout unavailable: {e}")
+    
+    def _write(self, kind: str, message: str, lead: str = '') -> None:
+        """
+        Write '<icon> <message>' line of the given kind to stdout
+        
+        On write-through or line-buffered streams (terminals, the daemon's
+        capture), pre-encoded affixes go straight to sys.stdout.buffer so
+        only the message payload is encoded per call; the text layer is
+        flushed first so earlier print() output stays in order. Other
+        streams (pipes, io.StringIO) get a plain text write, which their
+        own buffering already batches.
+        """
+        stream = sys.stdout
+        if stream is not self._px_stream:
+            self._bind_stdout(stream)
+        
+        if self._px_b is None or not (stream.write_through or stream.line_buffering):
+            prefix, suffix = self._px[kind]
+            stream.write(f"{lead}{prefix}{message}{suffix}")
+            return
+        
+        stream.flush()
+        prefix, suffix = self._px_b[kind]
+        out = stream.buffer
+        if lead:
+            out.write(lead.encode('ascii'))
+        out.write(prefix)
+        out.write(message.encode(stream.encoding, stream.errors or 'strict'))
+        out.write(suffix)
+        if stream.line_buffering:
+            out.flush()
+    
+    def _sep(self, char: str, length: int) -> str:
+        """Get (cached) separator line of `length` chars"""
+        key = (char, length)
+        sep = self._sep_cache.get(key)
+        if sep is None:
+            sep = self._sep_cache[key] = char * length
+        return sep
+    
     def _colorize(self, text: str, color: Color) -> str:
         """
         Colorize text
@@ -121,27 +215,69 @@ class CLI:
     
     def success(self, message: str) -> None:
         """Print success message"""
-        icon = self._colorize(Icon.SUCCESS.value, Color.GREEN)
-        msg = self._colorize(message, Color.GREEN)
-        print(f"{icon} {msg}")
+        self._write('success', message)
     
-    def error(self, message: str) -> None:
-        """Print error message"""
+    def _format_error(self, message: str) -> str:
+        """Format error line (icon + message)"""
         icon = self._colorize(Icon.ERROR.value, Color.RED)
         msg = self._colorize(message, Color.RED)
-        print(f"{icon} {msg}", file=sys.stderr)
+        return f"{icon} {msg}"
+    
+    def error(self, message: str) -> None:
+        """Print error message (buffered inside error_batching())"""
+        line = self._format_error(message)
+        if self._err_buf is not None:
+            self._err_buf.append(line)
+            return
+        print(line, file=sys.stderr)
+    
+    def error_batch(self, messages: Iterable[str]) -> None:
+        """
+        Print several error messages with a single stderr write
+        
+        Args:
+            messages: Error messages to print
+        """
+        lines = [self._format_error(m) for m in messages]
+        if not lines:
+            return
+        if self._err_buf is not None:
+            self._err_buf.extend(lines)
+            return
+        sys.stderr.write("\n".join(lines) + "\n")
+        sys.stderr.flush()
+    
+    @contextmanager
+    def error_batching(self) -> Iterator['CLI']:
+        """
+        Buffer error() calls and flush them in one write on exit
+        
+        Example:
+            >>> with cli.error_batching():
+            ...     for problem in problems:
+            ...         cli.error(problem)
+        """
+        if self._err_buf is not None:
+            # Already batching - outer block flushes
+            yield self
+            return
+        
+        self._err_buf = []
+        try:
+            yield self
+        finally:
+            lines, self._err_buf = self._err_buf, None
+            if lines:
+                sys.stderr.write("\n".join(lines) + "\n")
+                sys.stderr.flush()
     
     def warning(self, message: str) -> None:
         """Print warning message"""
-        icon = self._colorize(Icon.WARNING.value, Color.YELLOW)
-        msg = self._colorize(message, Color.YELLOW)
-        print(f"{icon} {msg}")
+        self._write('warning', message)
     
     def info(self, message: str) -> None:
         """Print info message"""
-        icon = self._colorize(Icon.INFO.value, Color.CYAN)
-        msg = self._colorize(message, Color.CYAN)
-        print(f"{icon} {msg}")
+        self._write('info', message)
     
     def debug(self, message: str) -> None:
         """Print debug message (only if verbose)"""
@@ -149,27 +285,49 @@ class CLI:
             msg = self._colorize(message, Color.DIM)
             print(f"  {msg}")
     
+    def format_header(self, title: str) -> str:
+        """Format header (title + '=' underline) as text"""
+        bold_title = self._colorize(title, Color.BOLD)
+        return f"\n{bold_title}\n{self._sep('=', len(title))}\n"
+    
+    def format_subheader(self, title: str) -> str:
+        """Format subheader (title + '-' underline) as text"""
+        bold_title = self._colorize(title, Color.BOLD)
+        return f"\n{bold_title}\n{self._sep('-', len(title))}\n"
+    
+    def format_bullet(self, message: str, indent: int = 0) -> str:
+        """Format bullet point line as text"""
+        prefix, suffix = self._px['bullet']
+        return f"{'  ' * indent}{prefix}{message}{suffix}"
+    
+    def bulk_write(self, text: str) -> None:
+        """
+        Write pre-formatted output with a single write + flush
+        
+        Build `text` with the format_* helpers (e.g. into an io.StringIO)
+        to emit many lines without a write per line.
+        
+        Args:
+            text: Text to write
+        """
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    
     def header(self, title: str) -> None:
         """Print header"""
-        bold_title = self._colorize(title, Color.BOLD)
-        print(f"\n{bold_title}")
-        print("=" * len(title))
+        sys.stdout.write(self.format_header(title))
     
     def subheader(self, title: str) -> None:
         """Print subheader"""
-        bold_title = self._colorize(title, Color.BOLD)
-        print(f"\n{bold_title}")
-        print("-" * len(title))
+        sys.stdout.write(self.format_subheader(title))
     
     def bullet(self, message: str, indent: int = 0) -> None:
         """Print bullet point"""
-        bullet = self._colorize(Icon.BULLET.value, Color.CYAN)
-        print(f"{'  ' * indent}{bullet} {message}")
+        self._write('bullet', message, lead='  ' * indent)
     
     def arrow(self, message: str) -> None:
         """Print arrow message"""
-        arrow = self._colorize(Icon.ARROW.value, Color.BLUE)
-        print(f"{arrow} {message}")
+        self._write('arrow', message)
     
     def confirm(self, message: str, default: bool = False) -> bool:
         """
@@ -233,45 +391,84 @@ class CLI:
             print(f"{marker} {i}. {choice}")
         
         while True:
-            try:
-                response = input(f"\nSelect [1-{len(choices)}]: ").strip()
-                if not response:
-                    return choices[default]
-                
-                index = int(response) - 1
-                if 0 <= index < len(choices):
-                    return choices[index]
-                else:
-                    self.error(f"Please enter a number between 1 and {len(choices)}")
-            except ValueError:
+            response = input(f"\nSelect [1-{len(choices)}]: ").strip()
+            if not response:
+                return choices[default]
+            
+            # isdecimal() accepts exactly what int() parses for unsigned input
+            if not response.isdecimal():
                 self.error("Please enter a valid number")
+                continue
+            
+            index = int(response) - 1
+            if 0 <= index < len(choices):
+                return choices[index]
+            else:
+                self.error(f"Please enter a number between 1 and {len(choices)}")
     
-    def table(self, headers: List[str], rows: List[List[str]]) -> None:
+    def format_table(
+        self,
+        headers: List[str],
+        rows: List[List[str]],
+        col_widths: Optional[List[int]] = None
+    ) -> str:
         """
-        Print formatted table
+        Format table as text
         
         Args:
             headers: Table headers
-            rows: Table rows
+            rows: Table rows (rows shorter than headers get empty cells)
+            col_widths: Precomputed column widths (covering headers and
+                cells); skips the measuring pass over all rows
+            
+        Returns:
+            Table text (one line per row, newline-terminated)
         """
-        # Calculate column widths
-        widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                widths[i] = max(widths[i], len(str(cell)))
+        if col_widths is not None:
+            widths = col_widths
+        else:
+            # Calculate column widths
+            widths = [len(h) for h in headers]
+            for row in rows:
+                for i, cell in enumerate(row):
+                    widths[i] = max(widths[i], len(str(cell)))
         
-        # Print header
-        header_row = " | ".join(
-            h.ljust(w) for h, w in zip(headers, widths)
-        )
-        print(self._colorize(header_row, Color.BOLD))
-        print("-" * len(header_row))
+        # One format spec for every row: each row is a single C-level
+        # str.format call instead of a ljust() per cell
+        fmt = " | ".join([f"{{!s:<{w}}}" for w in widths]).format
+        
+        # Header
+        header_row = fmt(*headers)
+        lines = [
+            self._colorize(header_row, Color.BOLD),
+            self._sep("-", len(header_row))
+        ]
+        
+        # Rows (short rows are padded with empty cells)
+        n = len(widths)
+        lines.extend([
+            fmt(*row) if len(row) >= n else fmt(*row, *('',) * (n - len(row)))
+            for row in rows
+        ])
+        
+        lines.append("")
+        return "\n".join(lines)
+    
+    def table(
+        self,
+        headers: List[str],
+        rows: List[List[str]],
+        col_widths: Optional[List[int]] = None
+    ) -> None:
+        """
+        Print formatted table (single write)
         
-        # Print rows
-        for row in rows:
-            print(" | ".join(
-                str(cell).ljust(w) for cell, w in zip(row, widths)
-            ))
+        Args:
+            headers: Table headers
+            rows: Table rows
+            col_widths: Precomputed column widths (see format_table)
+        """
+        self.bulk_write(self.format_table(headers, rows, col_widths))
     
     def progress_bar(
         self,
@@ -292,9 +489,24 @@ class CLI:
         Returns:
             Update function
         """
+        last_ns = 0
+        last_filled = -1
+        
         def update(current: int) -> None:
-            percent = current / total
-            filled = int(length * percent)
+            nonlocal last_ns, last_filled
+            filled = int(length * current / total)
+            now = time.monotonic_ns()
+            # Coalesce redundant redraws from tight loops (~30Hz max);
+            # the final update is always drawn
+            if (
+                filled == last_filled
+                and now - last_ns < _PROGRESS_REDRAW_NS
+                and current < total
+            ):
+                return
+            last_ns = now
+            last_filled = filled
+            
             bar = '█' * filled + '-' * (length - filled)
             
             status = f"{prefix} |{bar}| {current}/{total} {suffix}"
@@ -305,6 +517,60 @@ class CLI:
         
         return update
     
+    def progress_bar_numba(
+        self,
+        total: int,
+        prefix: str = "",
+        suffix: str = "",
+        length: int = 50
+    ) -> Callable[[int], None]:
+        """
+        Create progress bar rendered by a Numba-compiled kernel
+        
+        Intended for numeric loops that call update() millions of times.
+        The bar is rendered into a preallocated byte buffer and written to
+        stdout only when the filled bucket changes. Falls back to
+        progress_bar() when numba is not installed or stdout has no
+        binary buffer.
+        
+        Args:
+            total: Total items
+            prefix: Prefix text
+            suffix: Suffix text
+            length: Bar length
+            
+        Returns:
+            Update function
+        """
+        kernel = _get_bar_kernel()
+        out = getattr(sys.stdout, 'buffer', None)
+        if kernel is None or out is None:
+            return self.progress_bar(total, prefix=prefix, suffix=suffix, length=length)
+        
+        import numpy as np
+        
+        # Filled cells are 3-byte UTF-8 '█', empty cells are 1-byte '-'
+        bar_buffer = np.empty(length * 3, dtype=np.uint8)
+        head = f"\r{prefix} |".encode('utf-8')
+        last_filled = -1
+        
+        def update(current: int) -> None:
+            nonlocal last_filled
+            filled = int(length * current / total)
+            if filled == last_filled and current < total:
+                return
+            last_filled = filled
+            
+            n = kernel(bar_buffer, filled, length)
+            out.write(head)
+            out.write(bar_buffer[:n].tobytes())
+            out.write(f"| {current}/{total} {suffix}".encode('utf-8'))
+            if current >= total:
+                out.write(b"\n")  # New line when complete
+            out.flush()
+        
+        return update
+    
     def spinner(self, message: str = "Processing") -> 'Spinner':
         """
         Create spinner
@@ -318,6 +584,50 @@ class CLI:
         return Spinner(message, self.use_colors)
 
 
+# Minimum interval between progress bar redraws of the same bucket
+_PROGRESS_REDRAW_NS = 33_000_000
+
+# Numba progress bar kernel: None = not loaded yet, False = unavailable
+_bar_kernel: Any = None
+
+
+def _get_bar_kernel() -> Optional[Callable[..., int]]:
+    """
+    Compile (once) the Numba kernel used by CLI.progress_bar_numba
+
+    numba is optional and imported on first use only, so plain CLI
+    startup does not pay for it.
+
+    Returns:
+        Compiled kernel, or None if numba is not installed
+    """
+    global _bar_kernel
+
+    if _bar_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            logger.debug("numba not installed, using plain progress bar")
+            _bar_kernel = False
+        else:
+            @numba.njit(cache=True)
+            def _render_bar(buf, filled, length):
+                n = 0
+                for _ in range(filled):
+                    buf[n] = 0xE2
+                    buf[n + 1] = 0x96
+                    buf[n + 2] = 0x88
+                    n += 3
+                for _ in range(length - filled):
+                    buf[n] = 0x2D
+                    n += 1
+                return n
+
+            _bar_kernel = _render_bar
+
+    return _bar_kernel or None
+
+
 class Spinner:
     """
     Spinner context manager
@@ -364,6 +674,10 @@ class Spinner:
         self.frame_index += 1
 
 
+# "Error: <Type>\nMessage: " prefix per exception class
+_ERROR_PREFIXES: Dict[type, str] = {}
+
+
 class ErrorFormatter:
     """
     Enhanced error message formatting
@@ -392,21 +706,16 @@ class ErrorFormatter:
         Returns:
             Formatted error message
         """
-        lines = []
+        prefix = _ERROR_PREFIXES.get(type(error))
+        if prefix is None:
+            prefix = _ERROR_PREFIXES[type(error)] = f"Error: {type(error).__name__}\nMessage: "
         
-        # Error type and message
-        lines.append(f"Error: {type(error).__name__}")
-        lines.append(f"Message: {str(error)}")
-        
-        # Context
+        out = f"{prefix}{error}"
         if context:
-            lines.append(f"Context: {context}")
-        
-        # Suggestion
+            out += f"\nContext: {context}"
         if suggestion:
-            lines.append(f"Suggestion: {suggestion}")
-        
-        return "\n".join(lines)
+            out += f"\nSuggestion: {suggestion}"
+        return out
     
     @staticmethod
     def format_validation_error(field: str, value: Any, reason: str) -> str:
@@ -427,6 +736,10 @@ def get_cli(use_colors: bool = True, verbose: bool = False) -> CLI:
     """
     Get global CLI instance
     
+    A new instance is made when sys.stdout has been replaced since the
+    last one was built (e.g. per request in the daemon), so colors follow
+    the stream actually being written to.
+    
     Args:
         use_colors: Enable colored output
         verbose: Enable verbose output
@@ -436,7 +749,7 @@ def get_cli(use_colors: bool = True, verbose: bool = False) -> CLI:
     """
     global _global_cli
     
-    if _global_cli is None:
+    if _global_cli is None or _global_cli._color_stream is not sys.stdout:
         _global_cli = CLI(use_colors=use_colors, verbose=verbose)
     
     return _global_cli
@@ -16,25 +16,106 @@ Usage:
 """
 
 import argparse
+import functools
+import io
+import json
+import os
+import re
+import shutil
 import sys
 import subprocess
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple, Any, Callable, Union, TYPE_CHECKING
 
 from grokflow.logging_config import get_logger
-from grokflow.cli import CLI, get_cli, Color
-from grokflow.undo_manager import get_undo_manager
-from grokflow.session_manager import SessionManager
-from grokflow.pattern_alerts import (
-    PatternAlertManager, get_alert_manager,
-    AlertSeverity, AlertStatus
-)
-from grokflow.test_suggester import TestSuggester, get_test_suggester
-from grokflow.knowledge_base import get_knowledge_base
+
+# orjson (optional) speeds up session export/import serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Subsystems are imported where they are used, so that e.g. `grokflow undo`
+# or `grokflow --help` doesn't pay for loading alerts/test suggestion code.
+if TYPE_CHECKING:
+    from grokflow.cli import Color
+    from grokflow.session_manager import SessionManager
+    from grokflow.pattern_alerts import PatternAlertManager
+    from grokflow.test_suggester import TestSuggester
+    from grokflow.undo_manager import UndoManager
 
 logger = get_logger('grokflow.commands')
 
 
+def _json_dumps_compact(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+
+# Git paths of Python files whose basename isn't a test_ module
+_PY_NOT_TEST = re.compile(r'(?:^|/)(?!test_)[^/]+\.py$')
+_PY_NOT_TEST_B = re.compile(_PY_NOT_TEST.pattern.encode('ascii'))
+
+# Our descriptors are non-inheritable (PEP 446), so on Linux the child's
+# close-fds pass is skipped; other platforms keep the default
+_CLOSE_FDS = sys.platform != 'linux'
+
+
+@functools.lru_cache(maxsize=None)
+def _git_executable() -> Optional[str]:
+    """Resolve the git binary once per process (None if not on PATH)"""
+    return shutil.which('git')
+
+# Severity -> Color, built on first use (keeps pattern_alerts/cli imports lazy)
+_SEVERITY_COLOR: Optional[Dict[Any, 'Color']] = None
+_DEFAULT_SEVERITY_COLOR: Optional['Color'] = None
+
+
+def _severity_color(severity: Any) -> 'Color':
+    """Get the display color for an alert severity"""
+    global _SEVERITY_COLOR, _DEFAULT_SEVERITY_COLOR
+    if _SEVERITY_COLOR is None:
+        from grokflow.cli import Color
+        from grokflow.pattern_alerts import AlertSeverity
+
+        _SEVERITY_COLOR = {
+            AlertSeverity.CRITICAL: Color.RED,
+            AlertSeverity.HIGH: Color.YELLOW,
+            AlertSeverity.WARNING: Color.YELLOW,
+            AlertSeverity.INFO: Color.CYAN
+        }
+        _DEFAULT_SEVERITY_COLOR = Color.WHITE
+    return _SEVERITY_COLOR.get(severity, _DEFAULT_SEVERITY_COLOR)
+
+
+# Severity -> upper-case label for alert tables, built on first use
+_SEV_UPPER: Optional[Dict[Any, str]] = None
+
+
+def _severity_labels() -> Dict[Any, str]:
+    """Get the AlertSeverity -> upper-case label mapping"""
+    global _SEV_UPPER
+    if _SEV_UPPER is None:
+        from grokflow.pattern_alerts import AlertSeverity
+
+        _SEV_UPPER = {sev: sev.value.upper() for sev in AlertSeverity}
+    return _SEV_UPPER
+
 class GrokFlowCommands:
     """
     Command handlers for GrokFlow CLI
@@ -46,42 +127,78 @@ class GrokFlowCommands:
     - Test suggestions
     """
 
-    def __init__(self, workspace: Optional[Path] = None):
+    __slots__ = (
+        'workspace',
+        'cli',
+        '_session_manager',
+        '_alert_manager',
+        '_test_suggester',
+        '_undo_manager',
+    )
+
+    def __init__(self, workspace: Optional[Union[str, Path]] = None):
         """
         Initialize command handler
 
         Args:
             workspace: Workspace path (defaults to current directory)
         """
-        self.workspace = workspace or Path.cwd()
+        from grokflow.cli import get_cli
+
+        # Resolved per instance, never cached: the daemon chdirs per request
+        self.workspace = Path(workspace) if workspace is not None else Path.cwd()
         self.cli = get_cli()
-        self._session_manager: Optional[SessionManager] = None
-        self._alert_manager: Optional[PatternAlertManager] = None
-        self._test_suggester: Optional[TestSuggester] = None
+        self._session_manager: Optional['SessionManager'] = None
+        self._alert_manager: Optional['PatternAlertManager'] = None
+        self._test_suggester: Optional['TestSuggester'] = None
+        self._undo_manager: Optional['UndoManager'] = None
 
     @property
-    def session_manager(self) -> SessionManager:
+    def session_manager(self) -> 'SessionManager':
         """Get session manager (lazy initialization)"""
         if self._session_manager is None:
+            from grokflow.session_manager import SessionManager
+
             session_file = self.workspace / '.grokflow' / 'session.json'
             self._session_manager = SessionManager(session_file)
         return self._session_manager
 
     @property
-    def alert_manager(self) -> PatternAlertManager:
+    def alert_manager(self) -> 'PatternAlertManager':
         """Get alert manager (lazy initialization)"""
         if self._alert_manager is None:
+            from grokflow.knowledge_base import get_knowledge_base
+            from grokflow.pattern_alerts import get_alert_manager
+
+            # Reuse the process-wide manager (e.g. across invocations served
+            # by the daemon), reloading alerts if another process changed them
             kb = get_knowledge_base()
-            self._alert_manager = get_alert_manager(knowledge_base=kb, force_new=True)
+            self._alert_manager = get_alert_manager(knowledge_base=kb)
+            self._alert_manager.refresh()
         return self._alert_manager
 
     @property
-    def test_suggester(self) -> TestSuggester:
+    def test_suggester(self) -> 'TestSuggester':
         """Get test suggester (lazy initialization)"""
         if self._test_suggester is None:
-            self._test_suggester = get_test_suggester(self.workspace, force_new=True)
+            from grokflow.test_suggester import get_test_suggester
+
+            suggester = get_test_suggester(self.workspace)
+            if suggester.workspace_path != self.workspace:
+                # Cached instance belongs to another workspace
+                suggester = get_test_suggester(self.workspace, force_new=True)
+            self._test_suggester = suggester
         return self._test_suggester
 
+    @property
+    def undo_manager(self) -> 'UndoManager':
+        """Get undo manager (lazy initialization)"""
+        if self._undo_manager is None:
+            from grokflow.undo_manager import get_undo_manager
+
+            self._undo_manager = get_undo_manager()
+        return self._undo_manager
+
     # ==========================================================================
     # Undo/Redo Commands
     # ==========================================================================
@@ -97,7 +214,7 @@ class GrokFlowCommands:
         Returns:
             Exit code (0 = success)
         """
-        undo_manager = get_undo_manager()
+        undo_manager = self.undo_manager
 
         if not undo_manager.can_undo():
             self.cli.warning("Nothing to undo")
@@ -131,7 +248,7 @@ class GrokFlowCommands:
         Returns:
             Exit code (0 = success)
         """
-        undo_manager = get_undo_manager()
+        undo_manager = self.undo_manager
 
         if not undo_manager.can_redo():
             self.cli.warning("Nothing to redo")
@@ -164,7 +281,7 @@ class GrokFlowCommands:
         Returns:
             Exit code (0 = success)
         """
-        undo_manager = get_undo_manager()
+        undo_manager = self.undo_manager
 
         undo_history = undo_manager.get_undo_history()
         redo_history = undo_manager.get_redo_history()
@@ -173,18 +290,23 @@ class GrokFlowCommands:
             self.cli.info("No history available")
             return 0
 
+        # Build the whole listing, then emit it with one write
+        buf = io.StringIO()
+        write, bullet = buf.write, self.cli.format_bullet
+
         # Show undo history
         if undo_history:
-            self.cli.header("Undo Stack (oldest first)")
+            write(self.cli.format_header("Undo Stack (oldest first)"))
             for i, desc in enumerate(undo_history[-limit:], 1):
-                self.cli.bullet(f"{i}. {desc}")
+                write(bullet(f"{i}. {desc}"))
 
         # Show redo history
         if redo_history:
-            self.cli.header("Redo Stack (most recent first)")
+            write(self.cli.format_header("Redo Stack (most recent first)"))
             for i, desc in enumerate(reversed(redo_history[-limit:]), 1):
-                self.cli.bullet(f"{i}. {desc}")
+                write(bullet(f"{i}. {desc}"))
 
+        self.cli.bulk_write(buf.getvalue())
         return 0
 
     # ==========================================================================
@@ -209,10 +331,11 @@ class GrokFlowCommands:
             Exit code (0 = success)
         """
         try:
-            result = self.session_manager.export_session(
+            result = self.session_manager.export_session_stream(
                 Path(output_path),
                 include_conversation=not no_conversation,
-                include_context=not no_context
+                include_context=not no_context,
+                dumps=_json_dumps_compact
             )
             self.cli.success(f"Session exported to {result['export_path']}")
             items = result['items_exported']
@@ -248,7 +371,8 @@ class GrokFlowCommands:
             result = self.session_manager.import_session(
                 Path(input_path),
                 merge=merge,
-                workspace_override=workspace_path
+                workspace_override=workspace_path,
+                loads=_json_loads
             )
             mode = "merged" if merge else "replaced"
             self.cli.success(f"Session {mode} from {result['import_path']}")
@@ -310,6 +434,8 @@ class GrokFlowCommands:
         Returns:
             Exit code (0 = success)
         """
+        from grokflow.pattern_alerts import AlertSeverity, AlertStatus
+
         try:
             if active_only:
                 alerts = self.alert_manager.get_active_alerts()
@@ -325,21 +451,27 @@ class GrokFlowCommands:
                 self.cli.info("No alerts found")
                 return 0
 
-            self.cli.header(f"Pattern Alerts ({len(alerts)} found)")
 
             # Display as table
             headers = ['ID', 'Severity', 'Status', 'Pattern', 'Frequency']
-            rows = []
-            for alert in alerts:
-                rows.append([
-                    alert.id[:12] + '...',
-                    alert.severity.value.upper(),
-                    alert.status.value,
-                    alert.pattern_type[:30],
-                    str(alert.frequency)
-                ])
+            sev_upper = _severity_labels()
+            rows = [
+                (
+                    a.id[:12] + '...',
+                    sev_upper[a.severity],
+                    a.status.value,
+                    a.pattern_type[:30],
+                    str(a.frequency)
+                )
+                for a in alerts
+            ]
+            # Column widths: max cell length per column, computed in C
+            widths = [max(map(len, col)) for col in zip(headers, *rows)]
 
-            self.cli.table(headers, rows)
+            self.cli.bulk_write(
+                self.cli.format_header(f"Pattern Alerts ({len(alerts)} found)")
+                + self.cli.format_table(headers, rows, col_widths=widths)
+            )
             return 0
 
         except ValueError as e:
@@ -362,20 +494,15 @@ class GrokFlowCommands:
 
             if new_alerts:
                 self.cli.success(f"Found {len(new_alerts)} new alert(s)")
+                print_, bullet = self.cli.print, self.cli.bullet
+                sev_upper = _severity_labels()
                 for alert in new_alerts:
-                    severity_color = {
-                        AlertSeverity.CRITICAL: Color.RED,
-                        AlertSeverity.HIGH: Color.YELLOW,
-                        AlertSeverity.WARNING: Color.YELLOW,
-                        AlertSeverity.INFO: Color.CYAN
-                    }.get(alert.severity, Color.WHITE)
-
-                    self.cli.print(
-                        f"[{alert.severity.value.upper()}] {alert.pattern_type}",
-                        color=severity_color
+                    print_(
+                        f"[{sev_upper[alert.severity]}] {alert.pattern_type}",
+                        color=_severity_color(alert.severity)
                     )
                     if alert.recommended_action:
-                        self.cli.bullet(f"Action: {alert.recommended_action}", indent=1)
+                        bullet(f"Action: {alert.recommended_action}", indent=1)
             else:
                 self.cli.info("No new alerts")
 
@@ -560,9 +687,16 @@ class GrokFlowCommands:
             # Show untested files
             untested = self.test_suggester.find_untested_files()
             if untested:
-                self.cli.subheader(f"Untested Files ({len(untested)})")
+                # Strip the workspace prefix as a string rather than via
+                # Path.relative_to, and emit the listing with one write
+                ws_prefix = os.path.join(str(self.workspace), '')
+                cut = len(ws_prefix)
+                buf = io.StringIO()
+                buf.write(self.cli.format_subheader(f"Untested Files ({len(untested)})"))
                 for path in untested[:10]:
-                    self.cli.bullet(str(path.relative_to(self.workspace)))
+                    p = str(path)
+                    buf.write(self.cli.format_bullet(p[cut:] if p.startswith(ws_prefix) else p))
+                self.cli.bulk_write(buf.getvalue())
                 if len(untested) > 10:
                     self.cli.info(f"... and {len(untested) - 10} more")
 
@@ -575,36 +709,20 @@ class GrokFlowCommands:
         """
         Get list of modified files from git
 
+        Uses pygit2 in-process when available, otherwise `git diff`.
+
         Returns:
             List of modified file paths
         """
         try:
-            # Get uncommitted changes (staged + unstaged)
-            result = subprocess.run(
-                ['git', 'diff', '--name-only', 'HEAD'],
-                capture_output=True,
-                text=True,
-                cwd=self.workspace
-            )
-
-            if result.returncode != 0:
-                # Try without HEAD (for new repos)
-                result = subprocess.run(
-                    ['git', 'diff', '--name-only'],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.workspace
-                )
-
-            files = [f.strip() for f in result.stdout.split('\n') if f.strip()]
-
-            # Filter to Python files
-            py_files = [
-                str(self.workspace / f) for f in files
-                if f.endswith('.py') and not f.startswith('test_')
-            ]
+            files = self._git_diff_names_pygit2()
+            if files is None:
+                py_files = self._git_diff_py_files_subprocess()
+            else:
+                # Filter to Python files
+                py_files = [f for f in files if _PY_NOT_TEST.search(f)]
 
-            return py_files
+            return [str(self.workspace / f) for f in py_files]
 
         except FileNotFoundError:
             logger.warning("git not found")
@@ -613,13 +731,158 @@ class GrokFlowCommands:
             logger.error(f"Failed to get git modified files: {e}")
             return []
 
+    def _git_diff_names_pygit2(self) -> Optional[List[str]]:
+        """
+        List changed paths (like `git diff --name-only HEAD`) via pygit2
+
+        Returns:
+            Changed paths, or None if pygit2 is unavailable or fails
+        """
+        try:
+            import pygit2
+        except ImportError:
+            return None
+
+        try:
+            repo_path = pygit2.discover_repository(str(self.workspace))
+            if repo_path is None:
+                return None
+            repo = pygit2.Repository(repo_path)
+
+            # Unstaged changes (index -> workdir)
+            deltas = list(repo.diff().deltas)
+            # Staged changes (HEAD -> index), if there is a HEAD yet
+            if not repo.head_is_unborn:
+                head_tree = repo.head.peel(pygit2.Tree)
+                deltas.extend(head_tree.diff_to_index(repo.index).deltas)
+
+            return list(dict.fromkeys(d.new_file.path for d in deltas))
+
+        except (pygit2.GitError, KeyError, ValueError) as e:
+            logger.debug(f"pygit2 diff failed, falling back to git: {e}")
+            return None
+
+    def _git_diff_py_files_subprocess(self) -> List[str]:
+        """
+        List changed non-test Python paths by running `git diff --name-only`
+
+        Output is kept as bytes and filtered before decoding, so only the
+        kept paths are decoded.
 
-def create_parser() -> argparse.ArgumentParser:
+        Returns:
+            Changed Python paths (excluding test_ modules)
+        """
+        git = _git_executable()
+        if git is None:
+            logger.warning("git not found")
+            return []
+
+        # Get uncommitted changes (staged + unstaged); -z gives raw,
+        # unquoted paths separated by NUL
+        result = subprocess.run(
+            [git, 'diff', '--name-only', '-z', 'HEAD'],
+            capture_output=True,
+            cwd=self.workspace,
+            close_fds=_CLOSE_FDS
+        )
+
+        if result.returncode != 0:
+            # Try without HEAD (for new repos)
+            result = subprocess.run(
+                [git, 'diff', '--name-only', '-z'],
+                capture_output=True,
+                cwd=self.workspace,
+                close_fds=_CLOSE_FDS
+            )
+
+        return [
+            f.decode('utf-8', 'surrogateescape')
+            for f in result.stdout.split(b'\0')
+            if _PY_NOT_TEST_B.search(f)
+        ]
+
+
+    # ==========================================================================
+    # Daemon Commands
+    # ==========================================================================
+
+    def cmd_daemon_start(self, foreground: bool = False) -> int:
+        """
+        Start the command daemon
+
+        Args:
+            foreground: Serve in this process instead of forking
+
+        Returns:
+            Exit code (0 = success)
+        """
+        from grokflow import daemon
+
+        if not daemon.DAEMON_SUPPORTED:
+            self.cli.error("Daemon mode requires Unix sockets and fork()")
+            return 1
+        if daemon.is_running(_DAEMON_SOCKET):
+            self.cli.warning(f"Daemon already running on {_DAEMON_SOCKET}")
+            return 1
+
+        try:
+            if foreground:
+                self.cli.info(f"Serving on {_DAEMON_SOCKET} (Ctrl+C to stop)")
+                daemon.serve(_DAEMON_SOCKET, main)
+                return 0
+
+            pid = daemon.start_background(_DAEMON_SOCKET, main)
+            self.cli.success(f"Daemon started (pid {pid}) on {_DAEMON_SOCKET}")
+            return 0
+        except (OSError, RuntimeError) as e:
+            self.cli.error(f"Failed to start daemon: {e}")
+            return 1
+
+    def cmd_daemon_stop(self) -> int:
+        """
+        Stop the command daemon
+
+        Returns:
+            Exit code (0 = success)
+        """
+        from grokflow import daemon
+
+        if daemon.stop(_DAEMON_SOCKET):
+            self.cli.success("Daemon stopped")
+            return 0
+        self.cli.warning("No daemon running")
+        return 1
+
+    def cmd_daemon_status(self) -> int:
+        """
+        Show whether the command daemon is running
+
+        Returns:
+            Exit code (0 = running, 1 = not running)
+        """
+        from grokflow import daemon
+
+        if daemon.is_running(_DAEMON_SOCKET):
+            self.cli.success(f"Daemon running on {_DAEMON_SOCKET}")
+            return 0
+        self.cli.info("Daemon not running")
+        return 1
+
+
+# ==============================================================================
+# Argument Parser
+# ==============================================================================
+#
+# Each invocation runs exactly one (sub)command, so main() sniffs the command
+# name from argv and only builds that subparser. create_parser() without a
+# command still builds the full tree (used for top-level --help).
+
+def _make_root_parser() -> Tuple[argparse.ArgumentParser, Any]:
     """
-    Create argument parser for CLI
+    Create root parser with global options
 
     Returns:
-        Configured ArgumentParser
+        Tuple of (parser, subparsers action)
     """
     parser = argparse.ArgumentParser(
         prog='grokflow',
@@ -637,12 +900,15 @@ def create_parser() -> argparse.ArgumentParser:
     )
 
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    return parser, subparsers
 
-    # ==========================================================================
-    # Undo/Redo Commands
-    # ==========================================================================
 
-    # undo
+# ==========================================================================
+# Undo/Redo Commands
+# ==========================================================================
+
+def _build_undo(subparsers: Any, subcommand: Optional[str] = None) -> None:
+    """Add `undo` subparser"""
     undo_parser = subparsers.add_parser('undo', help='Undo command(s)')
     undo_parser.add_argument(
         '--batch', '-b',
@@ -658,7 +924,9 @@ def create_parser() -> argparse.ArgumentParser:
         help='Undo all commands'
     )
 
-    # redo
+
+def _build_redo(subparsers: Any, subcommand: Optional[str] = None) -> None:
+    """Add `redo` subparser"""
     redo_parser = subparsers.add_parser('redo', help='Redo command(s)')
     redo_parser.add_argument(
         '--batch', '-b',
@@ -674,7 +942,9 @@ def create_parser() -> argparse.ArgumentParser:
         help='Redo all commands'
     )
 
-    # history
+
+def _build_history(subparsers: Any, subcommand: Optional[str] = None) -> None:
+    """Add `history` subparser"""
     history_parser = subparsers.add_parser('history', help='Show undo/redo history')
     history_parser.add_argument(
         '--limit', '-l',
@@ -683,14 +953,13 @@ def create_parser() -> argparse.ArgumentParser:
         help='Maximum entries to show'
     )
 
-    # ==========================================================================
-    # Session Commands
-    # ==========================================================================
 
-    session_parser = subparsers.add_parser('session', help='Session management')
-    session_subparsers = session_parser.add_subparsers(dest='session_command')
+# ==========================================================================
+# Session Commands
+# ==========================================================================
 
-    # session export
+def _build_session_export(session_subparsers: Any) -> None:
+    """Add `session export` subparser"""
     export_parser = session_subparsers.add_parser('export', help='Export session')
     export_parser.add_argument('output', help='Output file path')
     export_parser.add_argument(
@@ -704,7 +973,9 @@ def create_parser() -> argparse.ArgumentParser:
         help='Exclude context files'
     )
 
-    # session import
+
+def _build_session_import(session_subparsers: Any) -> None:
+    """Add `session import` subparser"""
     import_parser = session_subparsers.add_parser('import', help='Import session')
     import_parser.add_argument('input', help='Input file path')
     import_parser.add_argument(
@@ -718,26 +989,51 @@ def create_parser() -> argparse.ArgumentParser:
         help='Override workspace path'
     )
 
-    # session info
+
+def _build_session_info(session_subparsers: Any) -> None:
+    """Add `session info` subparser"""
     session_subparsers.add_parser('info', help='Show session information')
 
-    # ==========================================================================
-    # Alert Commands
-    # ==========================================================================
 
-    alerts_parser = subparsers.add_parser('alerts', help='Pattern alerts management')
-    alerts_subparsers = alerts_parser.add_subparsers(dest='alerts_command')
+_SESSION_BUILDERS: Dict[str, Callable[[Any], None]] = {
+    'export': _build_session_export,
+    'import': _build_session_import,
+    'info': _build_session_info,
+}
+
+
+def _build_session(subparsers: Any, subcommand: Optional[str] = None) -> None:
+    """Add `session` subparser (only `subcommand` if it is known)"""
+    session_parser = subparsers.add_parser('session', help='Session management')
+    session_subparsers = session_parser.add_subparsers(dest='session_command')
 
-    # alerts list
+    if subcommand in _SESSION_BUILDERS:
+        _SESSION_BUILDERS[subcommand](session_subparsers)
+    else:
+        for build in _SESSION_BUILDERS.values():
+            build(session_subparsers)
+
+
+# ==========================================================================
+# Alert Commands
+# ==========================================================================
+
+# Mirror AlertStatus / AlertSeverity values (pattern_alerts is imported lazily)
+_STATUS_CHOICES = ('new', 'acknowledged', 'in_progress', 'resolved', 'dismissed')
+_SEVERITY_CHOICES = ('info', 'warning', 'high', 'critical')
+
+
+def _build_alerts_list(alerts_subparsers: Any) -> None:
+    """Add `alerts list` subparser"""
     list_parser = alerts_subparsers.add_parser('list', help='List alerts')
     list_parser.add_argument(
         '--status', '-s',
-        choices=['new', 'acknowledged', 'in_progress', 'resolved', 'dismissed'],
+        choices=_STATUS_CHOICES,
         help='Filter by status'
     )
     list_parser.add_argument(
         '--severity',
-        choices=['info', 'warning', 'high', 'critical'],
+        choices=_SEVERITY_CHOICES,
         help='Filter by severity'
     )
     list_parser.add_argument(
@@ -746,28 +1042,63 @@ def create_parser() -> argparse.ArgumentParser:
         help='Show only active alerts'
     )
 
-    # alerts check
+
+def _build_alerts_check(alerts_subparsers: Any) -> None:
+    """Add `alerts check` subparser"""
     alerts_subparsers.add_parser('check', help='Check for new alerts')
 
-    # alerts acknowledge
+
+def _build_alerts_acknowledge(alerts_subparsers: Any) -> None:
+    """Add `alerts acknowledge` subparser"""
     ack_parser = alerts_subparsers.add_parser('acknowledge', help='Acknowledge alert')
     ack_parser.add_argument('alert_id', help='Alert ID')
 
-    # alerts resolve
+
+def _build_alerts_resolve(alerts_subparsers: Any) -> None:
+    """Add `alerts resolve` subparser"""
     resolve_parser = alerts_subparsers.add_parser('resolve', help='Resolve alert')
     resolve_parser.add_argument('alert_id', help='Alert ID')
 
-    # alerts dismiss
+
+def _build_alerts_dismiss(alerts_subparsers: Any) -> None:
+    """Add `alerts dismiss` subparser"""
     dismiss_parser = alerts_subparsers.add_parser('dismiss', help='Dismiss alert')
     dismiss_parser.add_argument('alert_id', help='Alert ID')
 
-    # alerts summary
+
+def _build_alerts_summary(alerts_subparsers: Any) -> None:
+    """Add `alerts summary` subparser"""
     alerts_subparsers.add_parser('summary', help='Show alert summary')
 
-    # ==========================================================================
-    # Test Suggestion Commands
-    # ==========================================================================
 
+_ALERTS_BUILDERS: Dict[str, Callable[[Any], None]] = {
+    'list': _build_alerts_list,
+    'check': _build_alerts_check,
+    'acknowledge': _build_alerts_acknowledge,
+    'resolve': _build_alerts_resolve,
+    'dismiss': _build_alerts_dismiss,
+    'summary': _build_alerts_summary,
+}
+
+
+def _build_alerts(subparsers: Any, subcommand: Optional[str] = None) -> None:
+    """Add `alerts` subparser (only `subcommand` if it is known)"""
+    alerts_parser = subparsers.add_parser('alerts', help='Pattern alerts management')
+    alerts_subparsers = alerts_parser.add_subparsers(dest='alerts_command')
+
+    if subcommand in _ALERTS_BUILDERS:
+        _ALERTS_BUILDERS[subcommand](alerts_subparsers)
+    else:
+        for build in _ALERTS_BUILDERS.values():
+            build(alerts_subparsers)
+
+
+# ==========================================================================
+# Test Suggestion Commands
+# ==========================================================================
+
+def _build_suggest_tests(subparsers: Any, subcommand: Optional[str] = None) -> None:
+    """Add `suggest-tests` subparser"""
     suggest_parser = subparsers.add_parser('suggest-tests', help='Suggest tests to run')
     suggest_parser.add_argument(
         'files',
@@ -791,98 +1122,298 @@ def create_parser() -> argparse.ArgumentParser:
         help='Exclude integration tests'
     )
 
-    # coverage
+
+def _build_coverage(subparsers: Any, subcommand: Optional[str] = None) -> None:
+    """Add `coverage` subparser"""
     subparsers.add_parser('coverage', help='Show test coverage map')
 
+
+# ==========================================================================
+# Daemon Commands
+# ==========================================================================
+
+def _build_daemon(subparsers: Any, subcommand: Optional[str] = None) -> None:
+    """Add `daemon` subparser"""
+    daemon_parser = subparsers.add_parser(
+        'daemon', help='Keep a warm process to speed up repeated commands'
+    )
+    daemon_subparsers = daemon_parser.add_subparsers(dest='daemon_command')
+    start_parser = daemon_subparsers.add_parser('start', help='Start the daemon')
+    start_parser.add_argument(
+        '--foreground', '-f',
+        action='store_true',
+        help='Serve in the foreground instead of detaching'
+    )
+    daemon_subparsers.add_parser('stop', help='Stop the daemon')
+    daemon_subparsers.add_parser('status', help='Show daemon status')
+
+
+_SUBPARSER_BUILDERS: Dict[str, Callable[[Any, Optional[str]], None]] = {
+    'undo': _build_undo,
+    'redo': _build_redo,
+    'history': _build_history,
+    'session': _build_session,
+    'alerts': _build_alerts,
+    'suggest-tests': _build_suggest_tests,
+    'coverage': _build_coverage,
+    'daemon': _build_daemon,
+}
+
+# Root options that consume the following token as their value
+_ROOT_VALUE_OPTIONS = ('--workspace', '-w')
+
+
+def _sniff_subcommand(argv: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the (sub)command named in argv without parsing it
+
+    Args:
+        argv: Command line arguments (without program name)
+
+    Returns:
+        Tuple of (command, nested subcommand); command is None when it is
+        missing, unknown, or preceded by --help, i.e. whenever the full
+        parser is needed
+    """
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if token in ('-h', '--help', '--'):
+            return None, None
+        if token in _ROOT_VALUE_OPTIONS:
+            i += 2
+            continue
+        if token.startswith('-'):
+            i += 1
+            continue
+
+        if token not in _SUBPARSER_BUILDERS:
+            return None, None
+        subcommand = argv[i + 1] if i + 1 < len(argv) else None
+        if subcommand is not None and subcommand.startswith('-'):
+            subcommand = None
+        return token, subcommand
+
+    return None, None
+
+
+def create_parser(
+    command: Optional[str] = None,
+    subcommand: Optional[str] = None
+) -> argparse.ArgumentParser:
+    """
+    Create argument parser for CLI
+
+    Args:
+        command: Only build the subparser for this command (all if None)
+        subcommand: Only build this nested session/alerts subparser
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser, subparsers = _make_root_parser()
+
+    build = _SUBPARSER_BUILDERS.get(command) if command else None
+    if build is not None:
+        build(subparsers, subcommand)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers, None)
+
     return parser
 
 
-def main(argv: Optional[List[str]] = None) -> int:
+# ==============================================================================
+# Parser Cache
+# ==============================================================================
+
+
+@functools.lru_cache(maxsize=64)
+def load_parser(
+    command: Optional[str] = None,
+    subcommand: Optional[str] = None
+) -> argparse.ArgumentParser:
     """
-    Main entry point for CLI
+    Get argument parser, building it once per process
+
+    A long-lived process (the daemon) reuses the parser for each
+    (command, subcommand) instead of replaying every add_argument() call;
+    one-shot runs still only build the invoked subparser. Parsing does
+    not modify the parser, so sharing it is safe.
 
     Args:
-        argv: Command line arguments (defaults to sys.argv)
+        command: Only build the subparser for this command (all if None)
+        subcommand: Only build this nested session/alerts subparser
 
     Returns:
-        Exit code
+        Configured ArgumentParser
+    """
+    return create_parser(command, subcommand)
+
+
+# ==============================================================================
+# Command Dispatch
+# ==============================================================================
+
+# (command, subcommand) -> handler(args, commands). Commands without
+# subcommands use None as the second element.
+DISPATCH: Dict[Tuple[str, Optional[str]], Callable[[argparse.Namespace, GrokFlowCommands], int]] = {
+    ('undo', None): lambda a, c: c.cmd_undo(count=a.batch, all_=a.all_),
+    ('redo', None): lambda a, c: c.cmd_redo(count=a.batch, all_=a.all_),
+    ('history', None): lambda a, c: c.cmd_history(limit=a.limit),
+    ('session', 'export'): lambda a, c: c.cmd_session_export(
+        a.output,
+        no_conversation=a.no_conversation,
+        no_context=a.no_context
+    ),
+    ('session', 'import'): lambda a, c: c.cmd_session_import(
+        a.input,
+        merge=a.merge,
+        workspace=a.workspace
+    ),
+    ('session', 'info'): lambda a, c: c.cmd_session_info(),
+    ('alerts', 'list'): lambda a, c: c.cmd_alerts_list(
+        status=a.status,
+        severity=a.severity,
+        active_only=a.active
+    ),
+    ('alerts', 'check'): lambda a, c: c.cmd_alerts_check(),
+    ('alerts', 'acknowledge'): lambda a, c: c.cmd_alerts_acknowledge(a.alert_id),
+    ('alerts', 'resolve'): lambda a, c: c.cmd_alerts_resolve(a.alert_id),
+    ('alerts', 'dismiss'): lambda a, c: c.cmd_alerts_dismiss(a.alert_id),
+    ('alerts', 'summary'): lambda a, c: c.cmd_alerts_summary(),
+    ('suggest-tests', None): lambda a, c: c.cmd_suggest_tests(
+        files=a.files if a.files else None,
+        from_git=a.from_git,
+        top=a.top,
+        include_integration=not a.no_integration
+    ),
+    ('coverage', None): lambda a, c: c.cmd_suggest_coverage(),
+    ('daemon', 'start'): lambda a, c: c.cmd_daemon_start(foreground=a.foreground),
+    ('daemon', 'stop'): lambda a, c: c.cmd_daemon_stop(),
+    ('daemon', 'status'): lambda a, c: c.cmd_daemon_status(),
+}
+
+
+def _help_fallback(parser: argparse.ArgumentParser, command: str) -> int:
     """
-    parser = create_parser()
-    args = parser.parse_args(argv)
+    Show help for a command that has no matching handler
 
-    if not args.command:
+    Args:
+        parser: Parser used for this invocation
+        command: Top-level command name
+
+    Returns:
+        Exit code (1)
+    """
+    if command in ('session', 'alerts', 'daemon'):
+        # Exits via SystemExit after printing the subcommand help
+        parser.parse_args([command, '--help'])
+    else:
         parser.print_help()
-        return 0
+    return 1
 
-    # Initialize commands handler
-    workspace = Path(args.workspace) if args.workspace else None
-    commands = GrokFlowCommands(workspace=workspace)
 
-    # Route to appropriate command handler
-    try:
-        if args.command == 'undo':
-            return commands.cmd_undo(count=args.batch, all_=args.all_)
+# Socket a `grokflow daemon` listens on
+_DAEMON_SOCKET = Path.home() / '.grokflow' / 'daemon.sock'
 
-        elif args.command == 'redo':
-            return commands.cmd_redo(count=args.batch, all_=args.all_)
 
-        elif args.command == 'history':
-            return commands.cmd_history(limit=args.limit)
+def _find_daemon_socket(argv: List[str]) -> Optional[Path]:
+    """
+    Get the daemon socket to forward this invocation to, if any
 
-        elif args.command == 'session':
-            if args.session_command == 'export':
-                return commands.cmd_session_export(
-                    args.output,
-                    no_conversation=args.no_conversation,
-                    no_context=args.no_context
-                )
-            elif args.session_command == 'import':
-                return commands.cmd_session_import(
-                    args.input,
-                    merge=args.merge,
-                    workspace=args.workspace
-                )
-            elif args.session_command == 'info':
-                return commands.cmd_session_info()
-            else:
-                parser.parse_args(['session', '--help'])
-                return 1
+    `daemon` subcommands always run locally, and GROKFLOW_NO_DAEMON=1
+    disables forwarding entirely.
 
-        elif args.command == 'alerts':
-            if args.alerts_command == 'list':
-                return commands.cmd_alerts_list(
-                    status=args.status,
-                    severity=args.severity,
-                    active_only=args.active
-                )
-            elif args.alerts_command == 'check':
-                return commands.cmd_alerts_check()
-            elif args.alerts_command == 'acknowledge':
-                return commands.cmd_alerts_acknowledge(args.alert_id)
-            elif args.alerts_command == 'resolve':
-                return commands.cmd_alerts_resolve(args.alert_id)
-            elif args.alerts_command == 'dismiss':
-                return commands.cmd_alerts_dismiss(args.alert_id)
-            elif args.alerts_command == 'summary':
-                return commands.cmd_alerts_summary()
-            else:
-                parser.parse_args(['alerts', '--help'])
-                return 1
+    Args:
+        argv: Command line arguments
 
-        elif args.command == 'suggest-tests':
-            return commands.cmd_suggest_tests(
-                files=args.files if args.files else None,
-                from_git=args.from_git,
-                top=args.top,
-                include_integration=not args.no_integration
-            )
+    Returns:
+        Socket path, or None to run in this process
+    """
+    if os.environ.get('GROKFLOW_NO_DAEMON') == '1':
+        return None
+    if _sniff_subcommand(argv)[0] == 'daemon':
+        return None
+    if not os.path.exists(_DAEMON_SOCKET):
+        return None
+    return _DAEMON_SOCKET
 
-        elif args.command == 'coverage':
-            return commands.cmd_suggest_coverage()
 
-        else:
+def _fast_path_args(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse the common `undo`/`redo` invocations without building a parser
+
+    Recognizes `undo`, `redo`, optionally followed by `--batch N`/`-b N`
+    or `--all`/`-a`. Anything else returns None and goes through argparse.
+
+    Args:
+        argv: Command line arguments
+
+    Returns:
+        Namespace equivalent to what argparse would produce, or None
+    """
+    if not argv or argv[0] not in ('undo', 'redo'):
+        return None
+
+    batch, all_ = 1, False
+    rest = argv[1:]
+    if len(rest) == 2 and rest[0] in ('--batch', '-b') and rest[1].isdecimal():
+        batch = int(rest[1])
+    elif len(rest) == 1 and rest[0] in ('--all', '-a'):
+        all_ = True
+    elif rest:
+        return None
+
+    return argparse.Namespace(
+        workspace=None, verbose=False, command=argv[0], batch=batch,
+        all_=all_
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for CLI
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        Exit code
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+        # Hand the invocation to a running daemon, if any
+        socket_path = _find_daemon_socket(argv)
+        if socket_path is not None:
+            from grokflow.daemon import forward
+
+            code = forward(socket_path, argv, os.getcwd())
+            if code is not None:
+                return code
+
+    parser = None
+    args = _fast_path_args(argv)
+    if args is None:
+        command, subcommand = _sniff_subcommand(argv)
+        parser = load_parser(command, subcommand)
+        args = parser.parse_args(argv)
+
+        if not args.command:
             parser.print_help()
-            return 1
+            return 0
+
+    # Initialize commands handler
+    commands = GrokFlowCommands(workspace=args.workspace or None)
+
+    # Route to appropriate command handler
+    key = (args.command, getattr(args, f'{args.command}_command', None))
+    handler = DISPATCH.get(key)
+    try:
+        if handler is None:
+            return _help_fallback(parser, args.command)
+        return handler(args, commands)
 
     except KeyboardInterrupt:
         print("\nInterrupted")
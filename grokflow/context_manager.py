@@ -17,9 +17,23 @@ Features:
 - Relevance scoring
 """
 
+import atexit
+import fnmatch
+import functools
+import heapq
+import io
+import json
+import operator
 import os
-from typing import List, Dict, Optional, Set, Tuple
-from pathlib import Path
+import re
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Callable, List, Dict, FrozenSet, Iterable, Iterator, NamedTuple, Optional, Pattern, Set,
+    Tuple, Union
+)
+from pathlib import Path, PurePath
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -30,9 +44,217 @@ from grokflow.logging_config import get_logger
 logger = get_logger('grokflow.context_manager')
 
 
+def _normalize_newlines(text: str) -> str:
+    """Translate \\r\\n and \\r to \\n, as text-mode open() does"""
+    if '\r' not in text:
+        return text
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+# O_BINARY only exists (and matters) on Windows
+_O_RDONLY = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+_HAVE_READV = hasattr(os, 'readv')
+
+
+def _read_file_bytes(path: Path, size: int, limit: int) -> bytes:
+    """
+    Read a file with os.read, normally in a single call
+    
+    Asks for one byte more than the stat size; only if the file grew is
+    it read further (up to `limit` + 1 bytes, so callers can detect
+    oversized files).
+    
+    Args:
+        path: File path
+        size: Expected size (from stat)
+        limit: Maximum size callers accept
+        
+    Returns:
+        File contents
+    """
+    fd = os.open(path, _O_RDONLY)
+    try:
+        want = min(size, limit) + 1
+        data = os.read(fd, want)
+        if len(data) < want:
+            return data
+        
+        # File grew since it was stat'ed
+        chunks = [data]
+        total = len(data)
+        while total <= limit:
+            chunk = os.read(fd, 1 << 20)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            total += len(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _read_utf8_text(path: str, size: int) -> Optional[str]:
+    """
+    Fast reader for source types that are UTF-8 in practice
+    
+    One os.read of the stat size (plus a byte to notice growth) and a
+    strict UTF-8 decode, with no sniffing or encoding fallback. Returns
+    None whenever the generic path has to decide instead: read errors, a
+    file that grew, or bytes that aren't valid UTF-8.
+    """
+    try:
+        fd = os.open(path, _O_RDONLY)
+        try:
+            data = os.read(fd, size + 1)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+    
+    if len(data) > size:
+        return None
+    try:
+        return _normalize_newlines(data.decode('utf-8'))
+    except UnicodeDecodeError:
+        return None
+
+
+# Specialized readers for the most common text suffixes (all of which are in
+# ContextManager.TEXT_EXTENSIONS); other suffixes take the generic path
+_FAST_READERS: Dict[str, Callable[[str, int], Optional[str]]] = dict.fromkeys(
+    ('.py', '.js', '.ts', '.jsx', '.tsx', '.md', '.json', '.txt',
+     '.yaml', '.yml', '.toml', '.html', '.css', '.sh'),
+    _read_utf8_text
+)
+
+
+def _name_and_suffix(path: str) -> Tuple[str, str]:
+    """(Path.name, Path.suffix) of a file path, without building a Path"""
+    name = os.path.basename(path)
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name, name[i:]
+    return name, ''
+
+
+def _readinto_file(path: Path, buf: bytearray) -> int:
+    """Read the start of a file into `buf` with one read call"""
+    fd = os.open(path, _O_RDONLY)
+    try:
+        if _HAVE_READV:
+            return os.readv(fd, [buf])
+        with open(fd, 'rb', buffering=0, closefd=False) as f:
+            return f.readinto(buf)
+    finally:
+        os.close(fd)
+
+
+def _sniff_binary(head: Union[bytes, bytearray], n: Optional[int] = None) -> bool:
+    """Check a file's leading bytes (first `n` of `head`) for binary data"""
+    if n is None:
+        n = len(head)
+    if head.find(b'\x00', 0, n) != -1:
+        return True
+    with memoryview(head) as view, view[:n] as data:
+        try:
+            str(data, 'utf-8')
+            return False
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut off at the end of `head` is fine
+            return e.reason != 'unexpected end of data'
+
+
+def _decode_fallback(data, strict: bool) -> Tuple[str, str]:
+    """
+    Decode bytes that are not valid UTF-8
+    
+    Args:
+        data: Bytes-like file contents
+        strict: Try legacy encodings instead of replacing bad bytes
+        
+    Returns:
+        Tuple of (text, encoding); encoding is 'utf-8-replace' when
+        undecodable bytes were replaced with U+FFFD
+    """
+    if not strict:
+        return str(data, 'utf-8', 'replace'), 'utf-8-replace'
+    
+    # latin-1 maps every byte, so later entries are only a safety net
+    for enc in ['latin-1', 'cp1252', 'iso-8859-1']:
+        try:
+            return str(data, enc), enc
+        except UnicodeDecodeError:
+            continue
+    return str(data, 'utf-8', 'replace'), 'utf-8-replace'
+
+
+def _compile_globs(patterns: List[str]) -> Optional[Pattern]:
+    """Compile glob patterns into one regex (None if there are none)"""
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(p) for p in patterns))
+
+
+_GLOB_CHARS = frozenset('*?[')
+
+
+class _ScanFilters(NamedTuple):
+    """Compiled exclude/include patterns for a directory scan"""
+    exclude_names: FrozenSet[str]       # literal names, e.g. 'node_modules'
+    exclude_glob: Optional[Pattern]     # name globs, e.g. '*.pyc'
+    exclude_paths: Tuple[str, ...]      # patterns with '/', for Path.match()
+    include_glob: Optional[Pattern]
+    include_paths: Tuple[str, ...]
+    
+    def excludes_name(self, name: str) -> bool:
+        """Check an entry name against the name-only exclude patterns"""
+        if name in self.exclude_names:
+            return True
+        return self.exclude_glob is not None and self.exclude_glob.match(name) is not None
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_filters(
+    exclude_patterns: Tuple[str, ...],
+    include_patterns: Tuple[str, ...]
+) -> _ScanFilters:
+    """
+    Split scan patterns into name sets, name regexes and path patterns
+    
+    Patterns without a '/' only need the entry name: plain names (the
+    usual directory excludes) go into a frozenset, globs into one union
+    regex. The rest are kept for Path.match(). Cached, so repeated scans
+    with the same patterns compile nothing.
+    
+    Args:
+        exclude_patterns: Patterns to exclude (glob)
+        include_patterns: Patterns to include (glob)
+        
+    Returns:
+        _ScanFilters
+    """
+    exclude_by_name = [p for p in exclude_patterns if '/' not in p]
+    return _ScanFilters(
+        exclude_names=frozenset(
+            p for p in exclude_by_name if _GLOB_CHARS.isdisjoint(p)
+        ),
+        exclude_glob=_compile_globs(
+            [p for p in exclude_by_name if not _GLOB_CHARS.isdisjoint(p)]
+        ),
+        exclude_paths=tuple(p for p in exclude_patterns if '/' in p),
+        include_glob=_compile_globs([p for p in include_patterns if '/' not in p]),
+        include_paths=tuple(p for p in include_patterns if '/' in p),
+    )
+
+
 @dataclass
 class FileContext:
-    """Context for a single file"""
+    """
+    Context for a single file
+    
+    `path` is stored as a string; the Path object is only built (once) when
+    `path` is read. `path_str` gives the string without building one.
+    """
     path: Path
     content: str
     size: int
@@ -43,12 +265,17 @@ class FileContext:
     metadata: Dict[str, any] = field(default_factory=dict)
     
     def __str__(self) -> str:
-        return f"FileContext({self.path}, {self.size} bytes)"
+        return f"FileContext({self._path}, {self.size} bytes)"
+    
+    @property
+    def path_str(self) -> str:
+        """File path as a string"""
+        return self._path
     
     def to_dict(self) -> Dict[str, any]:
         """Convert to dictionary"""
         return {
-            'path': str(self.path),
+            'path': self._path,
             'content': self.content,
             'size': self.size,
             'is_binary': self.is_binary,
@@ -59,6 +286,114 @@ class FileContext:
         }
 
 
+def _get_file_context_path(self: FileContext) -> Path:
+    path = self._path_obj
+    if path is None:
+        path = self._path_obj = Path(self._path)
+    return path
+
+
+def _set_file_context_path(self: FileContext, value: Union[str, Path]) -> None:
+    if isinstance(value, PurePath):
+        self._path, self._path_obj = str(value), value
+    else:
+        self._path, self._path_obj = os.fspath(value), None
+
+
+# Installed after @dataclass so `path` stays a regular required field (the
+# generated __init__ assigns through the setter)
+FileContext.path = property(
+    _get_file_context_path, _set_file_context_path, doc="File path"
+)
+
+
+class _LazyFileContext(FileContext):
+    """
+    FileContext for a large text file, read and decoded on first access
+    
+    Until `content` is read the file costs nothing but this object (no
+    open descriptor or mapping is kept), so contexts that are scored or
+    filtered and then dropped never read it, and scans of many large files
+    don't run into the open-file limit. The file is read by path; a debug
+    message notes when it changed since it was stat'ed.
+    
+    `encoding` reads 'utf-8' until the content has been decoded.
+    """
+    
+    def __init__(
+        self,
+        version: Tuple[int, int],
+        strict_encoding: bool,
+        max_size: int,
+        **kwargs
+    ):
+        self._version = version
+        self._strict_encoding = strict_encoding
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._content: Optional[str] = None
+        super().__init__(content=None, **kwargs)
+    
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            with self._lock:
+                if self._content is None:
+                    self._content = self._decode()
+        return self._content
+    
+    @content.setter
+    def content(self, value: Optional[str]) -> None:
+        # None comes from the dataclass __init__ and keeps the content lazy
+        if value is not None:
+            self._content = value
+    
+    def _decode(self) -> str:
+        """Read and decode the file (caller holds the lock)"""
+        try:
+            st = os.stat(self._path)
+            if (st.st_mtime_ns, st.st_size) != self._version:
+                logger.debug(f"File changed since it was scanned, reading current: {self._path}")
+            data = _read_file_bytes(self._path, st.st_size, self._max_size)
+        except OSError as e:
+            raise ContextError(f"Failed to read file: {e}") from e
+        
+        if len(data) > self._max_size:
+            raise ContextError(
+                f"File too large: {self._path} (grew past max {self._max_size})"
+            )
+        
+        try:
+            text = str(data, 'utf-8')
+        except UnicodeDecodeError:
+            # Same fallback as eager reads
+            text, self.encoding = _decode_fallback(data, self._strict_encoding)
+        return _normalize_newlines(text)
+
+
+@dataclass
+class _FileColumns:
+    """
+    Per-file keys stored column-wise, parallel to WorkspaceContext.files
+    
+    Only values fixed when a file is added live here; mutable fields
+    (relevance_score, metadata, ...) are always read from the FileContext.
+    """
+    owners: List[FileContext] = field(default_factory=list)
+    paths: List[str] = field(default_factory=list)
+    suffixes: List[str] = field(default_factory=list)
+    # suffix -> indices into the columns, in order
+    by_suffix: Dict[str, List[int]] = field(default_factory=dict)
+    
+    def append(self, file_context: FileContext) -> None:
+        path = file_context.path_str
+        suffix = _name_and_suffix(path)[1]
+        self.by_suffix.setdefault(suffix, []).append(len(self.owners))
+        self.owners.append(file_context)
+        self.paths.append(path)
+        self.suffixes.append(suffix)
+
+
 @dataclass
 class WorkspaceContext:
     """Context for entire workspace"""
@@ -68,30 +403,82 @@ class WorkspaceContext:
     file_count: int = 0
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     metadata: Dict[str, any] = field(default_factory=dict)
+    _columns: _FileColumns = field(
+        default_factory=_FileColumns, init=False, repr=False, compare=False
+    )
     
     def add_file(self, file_context: FileContext) -> None:
         """Add file to workspace context"""
         self.files.append(file_context)
+        self._columns.append(file_context)
         self.total_size += file_context.size
         self.file_count += 1
     
+    def _columns_current(self) -> bool:
+        """Check the columns still mirror `files` (not edited directly)"""
+        owners = self._columns.owners
+        return len(owners) == len(self.files) and all(map(operator.is_, owners, self.files))
+    
+    def _current_columns(self) -> _FileColumns:
+        """Get the columns, rebuilding them if `files` was edited directly"""
+        if not self._columns_current():
+            columns = _FileColumns()
+            for f in self.files:
+                columns.append(f)
+            self._columns = columns
+        return self._columns
+    
     def get_files_by_extension(self, extension: str) -> List[FileContext]:
         """Get files by extension"""
-        return [f for f in self.files if f.path.suffix == extension]
+        indices = self._current_columns().by_suffix.get(extension, ())
+        files = self.files
+        return [files[i] for i in indices]
+    
+    def iter_total_content(self) -> Iterator[str]:
+        """
+        Yield the pieces of get_total_content() without joining them
+        
+        Lets callers stream the concatenated context (e.g. to a file or
+        request body) without building one large string.
+        """
+        first = True
+        for f in self.files:
+            if f.is_binary:
+                continue
+            if not first:
+                yield "\n\n"
+            first = False
+            yield f"=== {f.path_str} ===\n"
+            yield f.content
     
     def get_total_content(self) -> str:
         """Get concatenated content of all files"""
-        return "\n\n".join([
-            f"=== {f.path} ===\n{f.content}"
-            for f in self.files
-            if not f.is_binary
-        ])
+        buf = io.StringIO()
+        buf.writelines(self.iter_total_content())
+        return buf.getvalue()
     
     def to_dict(self) -> Dict[str, any]:
         """Convert to dictionary"""
+        paths = self._current_columns().paths
+        
+        # One comprehension over the columns instead of a to_dict() call
+        # per file (same keys as FileContext.to_dict())
+        files = [
+            {
+                'path': path,
+                'content': f.content,
+                'size': f.size,
+                'is_binary': f.is_binary,
+                'encoding': f.encoding,
+                'last_modified': f.last_modified,
+                'relevance_score': f.relevance_score,
+                'metadata': f.metadata
+            }
+            for path, f in zip(paths, self.files)
+        ]
         return {
             'workspace_path': str(self.workspace_path),
-            'files': [f.to_dict() for f in self.files],
+            'files': files,
             'total_size': self.total_size,
             'file_count': self.file_count,
             'created_at': self.created_at,
@@ -99,6 +486,149 @@ class WorkspaceContext:
         }
 
 
+class _CacheShard:
+    """One lock-protected LRU stripe of the ContextManager file cache"""
+    
+    __slots__ = ('entries', 'size', 'max_files', 'max_bytes', 'lock')
+    
+    def __init__(self, max_files: int, max_bytes: int):
+        self.entries: 'OrderedDict[str, Tuple[Tuple[int, int], FileContext]]' = OrderedDict()
+        self.size = 0
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+    
+    def get(self, key: str, version: Tuple[int, int]) -> Optional[FileContext]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != version:
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+    
+    def put(self, key: str, version: Tuple[int, int], file_context: FileContext) -> None:
+        with self.lock:
+            entries = self.entries
+            old = entries.pop(key, None)
+            if old is not None:
+                self.size -= old[1].size
+            entries[key] = (version, file_context)
+            self.size += file_context.size
+            
+            while entries and (
+                len(entries) > self.max_files or self.size > self.max_bytes
+            ):
+                _, (_, evicted) = entries.popitem(last=False)
+                self.size -= evicted.size
+    
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
+class _BinaryCache:
+    """
+    Persistent binary/text verdicts for files of unknown type
+    
+    Maps absolute path -> [mtime_ns, size, is_binary]; an entry only
+    answers for the same mtime and size, so changed files are re-sniffed.
+    Saved as JSON by ContextManager.clear_cache() and at interpreter exit.
+    There is one instance per file (see _get_binary_cache()), and saving
+    merges into what is on disk, so other processes' verdicts are kept.
+    """
+    
+    # Oldest entries are dropped past this many paths
+    MAX_ENTRIES = 50000
+    
+    def __init__(self, path: Path):
+        """
+        Load the cache
+        
+        Args:
+            path: JSON file backing the cache
+        """
+        self.path = Path(path)
+        self._entries: Dict[str, List] = {}
+        self._recorded: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        self._entries = self._read()
+        logger.debug(f"Loaded {len(self._entries)} binary verdicts")
+    
+    def _read(self) -> Dict[str, List]:
+        """Read verdicts from disk (a missing or corrupt file gives {})"""
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f).get('entries', {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Failed to load binary cache: {e}")
+            return {}
+        return entries if isinstance(entries, dict) else {}
+    
+    def save(self) -> None:
+        """Merge verdicts recorded since the last save into the file"""
+        with self._lock:
+            if not self._recorded:
+                return
+            recorded = self._recorded
+            self._recorded = {}
+            
+            entries = self._read()
+            for key, entry in recorded.items():
+                entries.pop(key, None)
+                entries[key] = entry
+            for key in list(entries)[:max(0, len(entries) - self.MAX_ENTRIES)]:
+                del entries[key]
+            self._entries = dict(entries)
+            
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'w') as f:
+                    json.dump({'entries': entries}, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Failed to save binary cache: {e}")
+    
+    def lookup(self, key: str, version: Tuple[int, int]) -> Optional[bool]:
+        """Get the verdict for `key` at `version` (mtime_ns, size), if known"""
+        entry = self._recorded.get(key) or self._entries.get(key)
+        if entry is None or entry[0] != version[0] or entry[1] != version[1]:
+            return None
+        return entry[2]
+    
+    def record(self, key: str, version: Tuple[int, int], is_binary: bool) -> None:
+        """Remember the verdict for `key` at `version`"""
+        with self._lock:
+            self._recorded[key] = [version[0], version[1], is_binary]
+
+
+# One _BinaryCache per file, shared by every ContextManager using it
+_binary_caches: Dict[Path, _BinaryCache] = {}
+_binary_caches_lock = threading.Lock()
+
+
+def _get_binary_cache(path: Path) -> _BinaryCache:
+    """Get the shared _BinaryCache for `path`, loading it on first use"""
+    path = Path(path).absolute()
+    with _binary_caches_lock:
+        cache = _binary_caches.get(path)
+        if cache is None:
+            cache = _binary_caches[path] = _BinaryCache(path)
+        return cache
+
+
+@atexit.register
+def _save_binary_caches() -> None:
+    """Save every binary cache that was used (runs once at exit)"""
+    with _binary_caches_lock:
+        caches = list(_binary_caches.values())
+    for cache in caches:
+        cache.save()
+
+
 class ContextManager:
     """
     Manages context for workspace and files
@@ -139,16 +669,56 @@ class ContextManager:
         '.sql', '.graphql', '.proto'
     }
     
+    # Default excludes for directory scans
+    DEFAULT_EXCLUDE_PATTERNS = (
+        '*.pyc', '__pycache__', '.git', '.svn', '.hg',
+        'node_modules', 'venv', 'env', '.venv',
+        '*.egg-info', 'dist', 'build', '.pytest_cache',
+        '.mypy_cache', '.tox', 'htmlcov', '.coverage'
+    )
+    
+    # Bytes inspected when sniffing files of unknown type
+    SNIFF_BYTES = 4096
+    
+    # Files smaller than this are read into a reusable per-thread buffer;
+    # larger text files are read and decoded on first access
+    POOLED_READ_BYTES = 256 * 1024
+    
+    # Directory scans hand files to worker threads in batches of up to
+    # this many files
+    READ_BATCH_SIZE = 256
+    
     # Default limits
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
     MAX_CONTEXT_SIZE = 100 * 1024 * 1024  # 100MB
     MAX_FILES = 1000
     
+    # File context cache bounds (least recently used entries go first)
+    MAX_CACHED_FILES = 2048
+    MAX_CACHE_BYTES = 64 * 1024 * 1024  # 64MB
+    
+    # Cache striping: up to CACHE_SHARDS shards, each allowed at least
+    # MIN_SHARD_FILES entries and MIN_SHARD_BYTES of content
+    CACHE_SHARDS = 16
+    MIN_SHARD_FILES = 64
+    MIN_SHARD_BYTES = 1024 * 1024
+    
+    # Default location for persisted binary/text verdicts (see _BinaryCache)
+    BINARY_CACHE_PATH = Path.home() / '.grokflow' / 'cache' / 'binary_cache.json'
+    
+    # Threads for reading files during directory scans (I/O bound)
+    MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    
     def __init__(
         self,
         max_file_size: int = MAX_FILE_SIZE,
         max_context_size: int = MAX_CONTEXT_SIZE,
-        max_files: int = MAX_FILES
+        max_files: int = MAX_FILES,
+        max_workers: int = MAX_WORKERS,
+        max_cached_files: int = MAX_CACHED_FILES,
+        max_cache_bytes: int = MAX_CACHE_BYTES,
+        strict_encoding: bool = False,
+        binary_cache_path: Optional[Path] = None
     ):
         """
         Initialize context manager
@@ -157,13 +727,46 @@ class ContextManager:
             max_file_size: Maximum size for single file
             max_context_size: Maximum total context size
             max_files: Maximum number of files
+            max_workers: Reader threads for directory scans (1 = serial)
+            max_cached_files: Maximum number of cached file contexts
+            max_cache_bytes: Maximum total size of cached file contexts
+            strict_encoding: Decode non-UTF-8 files with legacy encodings
+                (latin-1, ...) instead of UTF-8 with replacement characters
+            binary_cache_path: JSON file persisting binary/text verdicts for
+                unknown file types across runs, e.g. BINARY_CACHE_PATH
+                (None = don't persist)
         """
         self.max_file_size = max_file_size
         self.max_context_size = max_context_size
         self.max_files = max_files
+        self.max_workers = max(1, max_workers)
+        self.strict_encoding = strict_encoding
+        
+        # LRU cache of file contexts: abs path -> ((mtime_ns, size), context).
+        # Used from reader threads, so it is split into independently locked
+        # shards, each evicting within its share of the limits. Small limits
+        # get fewer shards so LRU order stays meaningful.
+        self.max_cached_files = max_cached_files
+        self.max_cache_bytes = max_cache_bytes
+        num_shards = max(1, min(
+            self.CACHE_SHARDS,
+            max_cached_files // self.MIN_SHARD_FILES,
+            max_cache_bytes // self.MIN_SHARD_BYTES
+        ))
+        self._cache_shards = [
+            _CacheShard(
+                -(-max_cached_files // num_shards),
+                -(-max_cache_bytes // num_shards)
+            )
+            for _ in range(num_shards)
+        ]
+        
+        # Per-thread reusable read buffers (see _thread_buffer)
+        self._buffers = threading.local()
         
-        # Cache for file contexts
-        self._cache: Dict[str, FileContext] = {}
+        self._binary_cache = (
+            _get_binary_cache(binary_cache_path) if binary_cache_path is not None else None
+        )
         
         logger.info(
             f"ContextManager initialized: "
@@ -187,31 +790,164 @@ class ContextManager:
         if file_path.suffix.lower() in self.TEXT_EXTENSIONS:
             return False
         
-        # Check file content (read first 8KB)
+        # Check file content (first SNIFF_BYTES, into this thread's buffer),
+        # unless it was sniffed before at the same mtime and size
+        buf = self._thread_buffer('sniff', self.SNIFF_BYTES)
         try:
-            with open(file_path, 'rb') as f:
-                chunk = f.read(8192)
+            if self._binary_cache is not None:
+                st = os.stat(file_path)
+                key = str(file_path.absolute())
+                version = (st.st_mtime_ns, st.st_size)
+                is_binary = self._binary_cache.lookup(key, version)
+                if is_binary is None:
+                    is_binary = _sniff_binary(buf, _readinto_file(file_path, buf))
+                    self._binary_cache.record(key, version, is_binary)
+                return is_binary
+            n = _readinto_file(file_path, buf)
+        except OSError as e:
+            logger.warning(f"Error checking if binary: {file_path}: {e}")
+            return True
+        
+        return _sniff_binary(buf, n)
+    
+    def _thread_buffer(self, name: str, size: int) -> bytearray:
+        """Get this thread's reusable read buffer `name` (created on first use)"""
+        buf = getattr(self._buffers, name, None)
+        if buf is None:
+            buf = bytearray(size)
+            setattr(self._buffers, name, buf)
+        return buf
+    
+    def _read_and_classify(
+        self,
+        file_path: str,
+        size: int,
+        name: str,
+        suffix: str
+    ) -> Tuple[bool, str, str]:
+        """
+        Read a file once and decide whether it is binary
+        
+        Known binary extensions are never opened. Otherwise one os.open()
+        and (normally) one read serve both the content and, for unknown
+        extensions, the binary sniff over the first SNIFF_BYTES. Files
+        under POOLED_READ_BYTES are read into a per-thread buffer.
+        
+        Args:
+            file_path: Path to file
+            size: File size from stat
+            name: File name
+            suffix: Lowercased file suffix
             
-            # Check for null bytes
-            if b'\x00' in chunk:
-                return True
+        Returns:
+            Tuple of (is_binary, content, encoding)
             
-            # Try to decode as text
-            try:
-                chunk.decode('utf-8')
-                return False
-            except UnicodeDecodeError:
-                return True
-                
-        except Exception as e:
-            logger.warning(f"Error checking if binary: {file_path}: {e}")
+        Raises:
+            ContextError: If a text file cannot be read
+        """
+        placeholder = f"<binary file: {name}>"
+        
+        if suffix in self.BINARY_EXTENSIONS:
+            return True, placeholder, 'utf-8'
+        known_text = suffix in self.TEXT_EXTENSIONS
+        
+        try:
+            if size < self.POOLED_READ_BYTES:
+                # Small file: read into this thread's buffer, no allocation
+                raw = self._thread_buffer('read', self.POOLED_READ_BYTES)
+                n = _readinto_file(file_path, raw)
+                if n == len(raw):
+                    # Grew past the buffer since it was stat'ed
+                    raw = _read_file_bytes(file_path, size, self.max_file_size)
+                    n = len(raw)
+            else:
+                raw = _read_file_bytes(file_path, size, self.max_file_size)
+                n = len(raw)
+        except OSError as e:
+            if not known_text:
+                logger.warning(f"Error checking if binary: {file_path}: {e}")
+                return True, placeholder, 'utf-8'
+            logger.error(f"Error reading file: {file_path}: {e}")
+            raise ContextError(f"Failed to read file: {e}") from e
+        
+        if n > self.max_file_size:
+            raise ContextError(
+                f"File too large: {file_path} (grew past max {self.max_file_size})"
+            )
+        
+        content, encoding = self._decode_file_bytes(raw, n, known_text)
+        if content is None:
+            return True, placeholder, 'utf-8'
+        return False, content, encoding
+    
+    def _sniff_large_file(self, file_path: str, suffix: str) -> Optional[bool]:
+        """
+        Classify a large file for lazy reading
+        
+        Only the first SNIFF_BYTES of a file of unknown type are read, so a
+        large binary costs one small read rather than a full one. Nothing
+        stays open afterwards.
+        
+        Args:
+            file_path: Path to file
+            suffix: Lowercased file suffix
+            
+        Returns:
+            True if binary, False if text (read on first access), None if
+            the file can't be opened (the caller then falls back to
+            _read_and_classify(), which reports the error)
+        """
+        if suffix in self.BINARY_EXTENSIONS:
             return True
+        
+        try:
+            fd = os.open(file_path, _O_RDONLY)
+            try:
+                if suffix in self.TEXT_EXTENSIONS:
+                    return False
+                head = os.read(fd, self.SNIFF_BYTES)
+            finally:
+                os.close(fd)
+        except OSError:
+            return None
+        return _sniff_binary(head)
+    
+    def _decode_file_bytes(
+        self,
+        raw: Union[bytes, bytearray],
+        n: int,
+        known_text: bool
+    ) -> Tuple[Optional[str], str]:
+        """
+        Decode the first `n` bytes of `raw` as text
+        
+        Args:
+            raw: Buffer holding the file contents
+            n: Number of valid bytes in `raw`
+            known_text: Extension is a known text type (skips the sniff)
+            
+        Returns:
+            Tuple of (content, encoding); content is None for binary data
+        """
+        if not known_text and raw.find(b'\x00', 0, min(n, self.SNIFF_BYTES)) != -1:
+            return None, 'utf-8'
+        
+        with memoryview(raw) as view, view[:n] as data:
+            try:
+                return _normalize_newlines(str(data, 'utf-8')), 'utf-8'
+            except UnicodeDecodeError as e:
+                if not known_text and e.start < self.SNIFF_BYTES:
+                    return None, 'utf-8'
+            
+            text, encoding = _decode_fallback(data, self.strict_encoding)
+        return _normalize_newlines(text), encoding
     
     def build_file_context(
         self,
         file_path: Path,
         validate: bool = True,
-        use_cache: bool = True
+        use_cache: bool = True,
+        stat_result: Optional[os.stat_result] = None
     ) -> FileContext:
         """
         Build context for single file
@@ -220,6 +956,8 @@ class ContextManager:
             file_path: Path to file
             validate: Validate file path
             use_cache: Use cached context if available
+            stat_result: Already-known stat of the file (e.g. from a
+                directory scan); skips the stat calls for size and mtime
             
         Returns:
             FileContext object
@@ -239,102 +977,336 @@ class ContextManager:
         
         file_path = Path(file_path)
         
-        # Check cache
-        cache_key = str(file_path.absolute())
-        if use_cache and cache_key in self._cache:
-            logger.debug(f"Using cached context: {file_path}")
-            return self._cache[cache_key]
+        if stat_result is None:
+            try:
+                stat_result = os.stat(file_path)
+            except FileNotFoundError:
+                raise ContextError(f"File not found: {file_path}")
+            except OSError as e:
+                raise ContextError(f"Failed to stat file: {e}") from e
+        
+        return self._build_file_context(
+            file_path, stat_result, str(file_path.absolute()), use_cache
+        )
+    
+    def _build_file_context(
+        self,
+        file_path: Union[str, Path],
+        stat_result: os.stat_result,
+        cache_key: str,
+        use_cache: bool = True
+    ) -> FileContext:
+        """
+        Build context for a stat'ed file
         
-        # Check if file exists
-        if not file_path.exists():
-            raise ContextError(f"File not found: {file_path}")
+        Directory scans call this directly with path strings, so no Path
+        object is built per file.
+        
+        Args:
+            file_path: Normalized path to file (as str(Path(...)) gives it)
+            stat_result: Stat of the file
+            cache_key: Absolute path of the file
+            use_cache: Use cached context if available
+            
+        Returns:
+            FileContext object
+            
+        Raises:
+            ContextError: If context building fails
+        """
+        path_str = str(file_path)
+        
+        # Check cache (entries are only valid for the same mtime and size)
+        version = (stat_result.st_mtime_ns, stat_result.st_size)
+        if use_cache:
+            cached = self._cache_get(cache_key, version)
+            if cached is not None:
+                logger.debug(f"Using cached context: {path_str}")
+                return cached
         
         # Check file size
-        file_size = file_path.stat().st_size
+        file_size = stat_result.st_size
         if file_size > self.max_file_size:
-            logger.warning(f"File too large: {file_path} ({file_size} bytes)")
+            logger.warning(f"File too large: {path_str} ({file_size} bytes)")
             raise ContextError(
-                f"File too large: {file_path} ({file_size} bytes, max {self.max_file_size})"
+                f"File too large: {path_str} ({file_size} bytes, max {self.max_file_size})"
             )
         
-        # Check if binary
-        is_binary = self.is_binary_file(file_path)
-        
-        # Read content
-        content = ""
-        encoding = "utf-8"
-        
-        if not is_binary:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                # Try different encodings
-                for enc in ['latin-1', 'cp1252', 'iso-8859-1']:
-                    try:
-                        with open(file_path, 'r', encoding=enc) as f:
-                            content = f.read()
-                        encoding = enc
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                else:
-                    # Give up, treat as binary
-                    is_binary = True
-                    content = f"<binary file: {file_path.name}>"
-            except Exception as e:
-                logger.error(f"Error reading file: {file_path}: {e}")
-                raise ContextError(f"Failed to read file: {e}") from e
-        else:
-            content = f"<binary file: {file_path.name}>"
-        
         # Get last modified time
         last_modified = datetime.fromtimestamp(
-            file_path.stat().st_mtime
+            stat_result.st_mtime
         ).isoformat()
+        name, extension = _name_and_suffix(path_str)
+        metadata = {
+            'extension': extension,
+            'name': name
+        }
         
-        # Create context
-        file_context = FileContext(
-            path=file_path,
-            content=content,
-            size=file_size,
-            is_binary=is_binary,
-            encoding=encoding,
-            last_modified=last_modified,
-            metadata={
-                'extension': file_path.suffix,
-                'name': file_path.name
-            }
+        # Unknown extensions are sniffed; skip the read for files already
+        # sniffed as binary at this mtime and size
+        suffix = extension.lower()
+        sniffed = (
+            self._binary_cache is not None
+            and suffix not in self.BINARY_EXTENSIONS
+            and suffix not in self.TEXT_EXTENSIONS
         )
+        known_binary = sniffed and self._binary_cache.lookup(cache_key, version) is True
+        
+        # Large text files: sniff now, read and decode on first access
+        lazy = False
+        content = None
+        if known_binary:
+            is_binary, content, encoding = True, f"<binary file: {name}>", 'utf-8'
+        elif file_size >= self.POOLED_READ_BYTES:
+            sniff = self._sniff_large_file(path_str, suffix)
+            if sniff:
+                is_binary, content, encoding = True, f"<binary file: {name}>", 'utf-8'
+            else:
+                lazy = sniff is not None
+        else:
+            # Common source types: plain UTF-8 read, no sniffing
+            fast_reader = _FAST_READERS.get(suffix)
+            if fast_reader is not None:
+                content = fast_reader(path_str, file_size)
+                is_binary, encoding = False, 'utf-8'
+        
+        if lazy:
+            file_context = _LazyFileContext(
+                version,
+                self.strict_encoding,
+                self.max_file_size,
+                path=file_path,
+                size=file_size,
+                last_modified=last_modified,
+                metadata=metadata
+            )
+        else:
+            if content is None:
+                # Sniff and read content with a single open
+                is_binary, content, encoding = self._read_and_classify(
+                    path_str, file_size, name, suffix
+                )
+            
+            # Create context
+            file_context = FileContext(
+                path=file_path,
+                content=content,
+                size=file_size,
+                is_binary=is_binary,
+                encoding=encoding,
+                last_modified=last_modified,
+                metadata=metadata
+            )
+        
+        if sniffed and not known_binary:
+            self._binary_cache.record(cache_key, version, file_context.is_binary)
         
         # Cache it
         if use_cache:
-            self._cache[cache_key] = file_context
+            self._cache_put(cache_key, version, file_context)
         
-        logger.debug(f"Built file context: {file_path} ({file_size} bytes)")
+        logger.debug(f"Built file context: {path_str} ({file_size} bytes)")
         return file_context
     
-    def build_directory_context(
+    def _iter_files(
+        self,
+        root: str,
+        exclude_patterns: List[str],
+        include_patterns: Optional[List[str]],
+        recursive: bool = True
+    ) -> Iterator[os.DirEntry]:
+        """
+        Walk `root` with os.scandir, yielding files that pass the filters
+        
+        Patterns without a '/' are matched against entry names, so
+        excluded directories (e.g. node_modules) are pruned without being
+        entered. Patterns with a '/' are matched against the file path with
+        Path.match(). Symlinked files are included, symlinked directories
+        are not descended into. Files are not stat'ed here; callers stat
+        only the entries they end up processing.
+        
+        Args:
+            root: Directory to walk
+            exclude_patterns: Patterns to exclude (glob)
+            include_patterns: Patterns to include (glob)
+            recursive: Descend into subdirectories
+            
+        Yields:
+            Directory entries of matching files
+        """
+        filters = _compile_filters(
+            tuple(exclude_patterns), tuple(include_patterns or ())
+        )
+        exclude_paths = filters.exclude_paths
+        include_glob, include_paths = filters.include_glob, filters.include_paths
+        excludes_name = filters.excludes_name
+        
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.warning(f"Cannot scan directory {current}: {e}")
+                continue
+            
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                # Excluded directories are pruned here, never scanned
+                if excludes_name(name):
+                    continue
+                
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                
+                if exclude_paths or include_paths:
+                    pure = PurePath(entry.path)
+                    if any(pure.match(pat) for pat in exclude_paths):
+                        continue
+                else:
+                    pure = None
+                
+                if include_patterns:
+                    included = include_glob is not None and include_glob.match(name)
+                    if not included and pure is not None:
+                        included = any(pure.match(pat) for pat in include_paths)
+                    if not included:
+                        continue
+                
+                yield entry
+            
+            # Depth-first, in directory order
+            stack.extend(reversed(subdirs))
+    
+    def _try_build(
+        self,
+        file_path: str,
+        entry: os.DirEntry,
+        abs_path: str
+    ) -> Tuple[str, object]:
+        """Build a file context, returning the ContextError instead of raising"""
+        try:
+            # On the worker thread, so stats overlap like the reads do
+            st = entry.stat()
+        except OSError as e:
+            return file_path, ContextError(f"Cannot stat {file_path}: {e}")
+        try:
+            return file_path, self._build_file_context(file_path, st, abs_path)
+        except ContextError as e:
+            return file_path, e
+    
+    def _try_build_batch(
+        self,
+        batch: List[Tuple[str, os.DirEntry, str]]
+    ) -> List[Tuple[str, object]]:
+        """Build a batch of file contexts in one worker task"""
+        return [self._try_build(*item) for item in batch]
+    
+    def _batch_files(
+        self,
+        files: List[Tuple[str, os.DirEntry, str]],
+        workers: int
+    ) -> Iterator[List[Tuple[str, os.DirEntry, str]]]:
+        """
+        Split files into consecutive read batches
+        
+        Batches hold up to READ_BATCH_SIZE files, and shrink for small
+        scans so every worker still gets several batches.
+        
+        Args:
+            files: (path, entry, absolute path) triples
+            workers: Number of pool threads
+            
+        Yields:
+            Lists of (path, entry, absolute path) triples
+        """
+        limit = max(1, min(self.READ_BATCH_SIZE, len(files) // (workers * 4)))
+        for start in range(0, len(files), limit):
+            yield files[start:start + limit]
+    
+    def _iter_file_contexts(
+        self,
+        files: List[Tuple[str, os.DirEntry, str]]
+    ) -> Iterator[Tuple[str, object]]:
+        """
+        Build file contexts on a thread pool, yielding in input order
+        
+        Files are submitted in batches (see _batch_files) so small source
+        files don't pay per-task executor overhead. At most 2 * max_workers
+        batches are in flight, so stopping early (closing the generator)
+        wastes little work.
+        
+        Args:
+            files: (path, entry, absolute path) triples
+            
+        Yields:
+            Tuples of (path, FileContext or ContextError)
+        """
+        workers = min(self.max_workers, len(files))
+        if workers <= 1:
+            for item in files:
+                yield self._try_build(*item)
+            return
+        
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='grokflow-context'
+        )
+        pending: deque = deque()
+        todo = self._batch_files(files, workers)
+        try:
+            for batch in todo:
+                pending.append(executor.submit(self._try_build_batch, batch))
+                if len(pending) >= 2 * workers:
+                    break
+            while pending:
+                future: Future = pending.popleft()
+                for batch in todo:
+                    pending.append(executor.submit(self._try_build_batch, batch))
+                    break
+                yield from future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    def iter_directory_context(
         self,
         directory_path: Path,
         recursive: bool = True,
         exclude_patterns: Optional[List[str]] = None,
         include_patterns: Optional[List[str]] = None
-    ) -> WorkspaceContext:
+    ) -> Iterator[FileContext]:
         """
-        Build context for directory
+        Yield file contexts for a directory one at a time
         
+        Same files, order and limits as build_directory_context(), but
+        callers that process files one by one never hold every file's
+        content at once. Closing the iterator early cancels queued reads.
+
+        File paths are directory_path joined with each relative path, as
+        Path.glob() does: the root is not resolved, so 'sub/..' yields
+        'sub/../x.py'. Pass a resolved path for canonical paths.
+
         Args:
             directory_path: Path to directory
             recursive: Include subdirectories
             exclude_patterns: Patterns to exclude (glob)
             include_patterns: Patterns to include (glob)
             
-        Returns:
-            WorkspaceContext object
+        Yields:
+            FileContext objects
             
         Raises:
-            ContextError: If context building fails
+            ContextError: If the directory doesn't exist
         """
         directory_path = Path(directory_path)
         
@@ -346,35 +1318,12 @@ class ContextManager:
         
         # Default excludes
         if exclude_patterns is None:
-            exclude_patterns = [
-                '*.pyc', '__pycache__', '.git', '.svn', '.hg',
-                'node_modules', 'venv', 'env', '.venv',
-                '*.egg-info', 'dist', 'build', '.pytest_cache',
-                '.mypy_cache', '.tox', 'htmlcov', '.coverage'
-            ]
-        
-        workspace_ctx = WorkspaceContext(workspace_path=directory_path)
+            exclude_patterns = self.DEFAULT_EXCLUDE_PATTERNS
         
-        # Get all files
-        if recursive:
-            pattern = '**/*'
-        else:
-            pattern = '*'
-        
-        files_to_process = []
-        for file_path in directory_path.glob(pattern):
-            if not file_path.is_file():
-                continue
-            
-            # Check exclude patterns
-            if any(file_path.match(pat) for pat in exclude_patterns):
-                continue
-            
-            # Check include patterns
-            if include_patterns and not any(file_path.match(pat) for pat in include_patterns):
-                continue
-            
-            files_to_process.append(file_path)
+        root = str(directory_path)
+        files_to_process = list(self._iter_files(
+            root, exclude_patterns, include_patterns, recursive
+        ))
         
         # Check file count limit
         if len(files_to_process) > self.max_files:
@@ -383,22 +1332,70 @@ class ContextManager:
             )
             files_to_process = files_to_process[:self.max_files]
         
-        # Build context for each file
-        for file_path in files_to_process:
-            try:
-                file_ctx = self.build_file_context(file_path, validate=False)
-                workspace_ctx.add_file(file_ctx)
+        # Cache keys are absolute paths: resolve the root once and swap it in,
+        # rather than a getcwd() per file in Path.absolute(). File paths are
+        # kept as str(Path(...)) would give them, which only differs for a
+        # '.' root ('./a.py' -> 'a.py').
+        if directory_path.is_absolute():
+            files_to_process = [(e.path, e, e.path) for e in files_to_process]
+        else:
+            abs_root, n = str(directory_path.absolute()), len(root)
+            strip = 2 if root == '.' else 0
+            files_to_process = [
+                (e.path[strip:], e, abs_root + e.path[n:]) for e in files_to_process
+            ]
+        
+        # Build context for each file (read in parallel, yielded in order)
+        total_size = 0
+        results = self._iter_file_contexts(files_to_process)
+        try:
+            for file_path, file_ctx in results:
+                if isinstance(file_ctx, ContextError):
+                    logger.warning(f"Skipping file {file_path}: {file_ctx}")
+                    continue
+                
+                total_size += file_ctx.size
+                yield file_ctx
                 
                 # Check total size limit
-                if workspace_ctx.total_size > self.max_context_size:
+                if total_size > self.max_context_size:
                     logger.warning(
-                        f"Context size limit reached: {workspace_ctx.total_size} bytes"
+                        f"Context size limit reached: {total_size} bytes"
                     )
                     break
-                    
-            except ContextError as e:
-                logger.warning(f"Skipping file {file_path}: {e}")
-                continue
+        finally:
+            # Cancels reads still queued once the size limit is hit
+            results.close()
+    
+    def build_directory_context(
+        self,
+        directory_path: Path,
+        recursive: bool = True,
+        exclude_patterns: Optional[List[str]] = None,
+        include_patterns: Optional[List[str]] = None
+    ) -> WorkspaceContext:
+        """
+        Build context for directory
+        
+        Args:
+            directory_path: Path to directory
+            recursive: Include subdirectories
+            exclude_patterns: Patterns to exclude (glob)
+            include_patterns: Patterns to include (glob)
+            
+        Returns:
+            WorkspaceContext object
+            
+        Raises:
+            ContextError: If context building fails
+        """
+        directory_path = Path(directory_path)
+        workspace_ctx = WorkspaceContext(workspace_path=directory_path)
+        
+        for file_ctx in self.iter_directory_context(
+            directory_path, recursive, exclude_patterns, include_patterns
+        ):
+            workspace_ctx.add_file(file_ctx)
         
         logger.info(
             f"Built directory context: {directory_path} "
@@ -485,23 +1482,11 @@ class ContextManager:
         Returns:
             Optimized workspace context
         """
-        max_size = max_size or self.max_context_size
-        
-        # Filter by relevance
-        relevant_files = [
-            f for f in workspace_ctx.files
-            if f.relevance_score >= relevance_threshold
-        ]
-        
-        # Sort by relevance (descending)
-        relevant_files.sort(key=lambda f: f.relevance_score, reverse=True)
-        
-        # Build optimized context
         optimized = WorkspaceContext(workspace_path=workspace_ctx.workspace_path)
         
-        for file_ctx in relevant_files:
-            if optimized.total_size + file_ctx.size > max_size:
-                break
+        for file_ctx in self.optimize_context_stream(
+            workspace_ctx.files, max_size, relevance_threshold
+        ):
             optimized.add_file(file_ctx)
         
         logger.info(
@@ -511,9 +1496,80 @@ class ContextManager:
         
         return optimized
     
+    def optimize_context_stream(
+        self,
+        files: Iterable[FileContext],
+        max_size: Optional[int] = None,
+        relevance_threshold: float = 0.5
+    ) -> List[FileContext]:
+        """
+        Select the files optimize_context() would keep from a stream
+        
+        Files are taken by descending relevance (ties in input order) until
+        the next one would exceed `max_size`. Only the files that currently
+        make the cut are held, in a min-heap, so this can consume
+        iter_directory_context() without materializing the whole directory.
+        
+        Args:
+            files: File contexts, e.g. from iter_directory_context()
+            max_size: Maximum size (bytes)
+            relevance_threshold: Minimum relevance score
+            
+        Returns:
+            Selected files, most relevant first
+        """
+        max_size = max_size or self.max_context_size
+        
+        # Entries are (relevance, -arrival) so the heap top is the file that
+        # would be taken last. `cutoff` is the rank of the best file dropped
+        # so far: the selection stops there, so nothing ranked below it can
+        # be taken again.
+        heap: List[Tuple[float, int, FileContext]] = []
+        cutoff: Optional[Tuple[float, int]] = None
+        total = 0
+        
+        for i, file_ctx in enumerate(files):
+            score = file_ctx.relevance_score
+            if score < relevance_threshold:
+                continue
+            rank = (score, -i)
+            if cutoff is not None and rank < cutoff:
+                continue
+            
+            heapq.heappush(heap, (score, -i, file_ctx))
+            total += file_ctx.size
+            while total > max_size:
+                score, neg_i, dropped = heapq.heappop(heap)
+                total -= dropped.size
+                cutoff = (score, neg_i)
+        
+        heap.sort(reverse=True, key=operator.itemgetter(0, 1))
+        return [file_ctx for _, _, file_ctx in heap]
+    
+    def _cache_shard(self, key: str) -> _CacheShard:
+        """Pick the cache shard for `key`"""
+        shards = self._cache_shards
+        return shards[hash(key) % len(shards)]
+    
+    def _cache_get(self, key: str, version: Tuple[int, int]) -> Optional[FileContext]:
+        """Get a cached context if it matches `version` (mtime_ns, size)"""
+        return self._cache_shard(key).get(key, version)
+    
+    def _cache_put(
+        self,
+        key: str,
+        version: Tuple[int, int],
+        file_context: FileContext
+    ) -> None:
+        """Cache a context, evicting least recently used entries over budget"""
+        self._cache_shard(key).put(key, version, file_context)
+    
     def clear_cache(self) -> None:
-        """Clear file context cache"""
-        self._cache.clear()
+        """Clear file context cache (and save persisted binary verdicts)"""
+        for shard in self._cache_shards:
+            shard.clear()
+        if self._binary_cache is not None:
+            self._binary_cache.save()
         logger.debug("Context cache cleared")
     
     def get_cache_stats(self) -> Dict[str, any]:
@@ -523,9 +1579,10 @@ class ContextManager:
         Returns:
             Cache statistics
         """
+        shards = self._cache_shards
         return {
-            'cached_files': len(self._cache),
-            'cache_size': sum(ctx.size for ctx in self._cache.values())
+            'cached_files': sum(len(shard.entries) for shard in shards),
+            'cache_size': sum(shard.size for shard in shards)
         }
 
 
@@ -536,7 +1593,8 @@ _global_context_manager: Optional[ContextManager] = None
 def get_context_manager(
     max_file_size: Optional[int] = None,
     max_context_size: Optional[int] = None,
-    force_new: bool = False
+    force_new: bool = False,
+    binary_cache_path: Optional[Path] = None
 ) -> ContextManager:
     """
     Get global context manager instance
@@ -545,6 +1603,8 @@ def get_context_manager(
         max_file_size: Maximum file size
         max_context_size: Maximum context size
         force_new: Force new instance
+        binary_cache_path: Persist binary/text verdicts to this file
+            (e.g. ContextManager.BINARY_CACHE_PATH); off by default
         
     Returns:
         ContextManager instance
@@ -558,6 +1618,8 @@ def get_context_manager(
         if max_context_size:
             kwargs['max_context_size'] = max_context_size
         
-        _global_context_manager = ContextManager(**kwargs)
+        _global_context_manager = ContextManager(
+            binary_cache_path=binary_cache_path, **kwargs
+        )
     
     return _global_context_manager
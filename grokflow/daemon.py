@@ -0,0 +1,390 @@
+"""
+GrokFlow Command Daemon
+
+Keeps a warm process around so repeated `grokflow` invocations skip
+interpreter startup and module imports:
+- `grokflow daemon start` serves commands on a Unix socket
+- Later invocations forward argv, cwd, environment and whether stdout is
+  a terminal, and replay the captured output
+- Requests are handled one at a time (handlers chdir into the caller's cwd
+  and run with the caller's environment)
+- stdin is not forwarded; commands served this way must not prompt
+- `GROKFLOW_NO_DAEMON=1` disables forwarding
+
+Protocol: every message is a 4-byte big-endian length followed by a UTF-8
+JSON object. Requests are {"argv": [...], "cwd": "...", "env": {...},
+"isatty": bool} or {"op": "shutdown"}; responses are {"exit": int,
+"stdout": str, "stderr": str}, with output bytes carried via
+surrogateescape.
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from grokflow.logging_config import get_logger
+
+logger = get_logger('grokflow.daemon')
+
+# Length prefix for each message
+_HEADER = struct.Struct('>I')
+
+# Upper bound on a single message (guards against garbage on the socket)
+_MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+# How long a client waits for the daemon to accept a connection
+_CONNECT_TIMEOUT = 0.5
+
+DAEMON_SUPPORTED = hasattr(socket, 'AF_UNIX') and hasattr(os, 'fork')
+
+
+# ==============================================================================
+# Wire Protocol
+# ==============================================================================
+
+def _send_message(sock: socket.socket, payload: Dict[str, Any]) -> None:
+    """Send one length-prefixed JSON message"""
+    data = json.dumps(payload).encode('utf-8')
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly `size` bytes or raise ConnectionError"""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Connection closed mid-message")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def _recv_message(sock: socket.socket) -> Dict[str, Any]:
+    """Receive one length-prefixed JSON message"""
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    if size > _MAX_MESSAGE_SIZE:
+        raise ValueError(f"Message too large: {size} bytes")
+    return json.loads(_recv_exact(sock, size))
+
+
+def _bytes_to_wire(data: bytes) -> str:
+    return data.decode('utf-8', 'surrogateescape')
+
+
+def _wire_to_bytes(text: str) -> bytes:
+    return text.encode('utf-8', 'surrogateescape')
+
+
+# ==============================================================================
+# Server
+# ==============================================================================
+
+class _CapturedStream(io.TextIOWrapper):
+    """Text capture stream reporting the client's isatty() state"""
+
+    def __init__(self, buffer: io.BytesIO, tty: bool = False):
+        super().__init__(buffer, encoding='utf-8', write_through=True)
+        self._tty = tty
+
+    def isatty(self) -> bool:
+        return self._tty
+
+
+@contextlib.contextmanager
+def _client_environ(env: Optional[Dict[str, str]]):
+    """Run with os.environ replaced by `env` (unchanged if None)"""
+    if env is None:
+        yield
+        return
+    saved = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+def run_captured(
+    entry: Callable[[List[str]], int],
+    argv: List[str],
+    cwd: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    isatty: bool = False
+) -> Tuple[int, bytes, bytes]:
+    """
+    Run a CLI entry point with stdout/stderr captured
+
+    Args:
+        entry: Entry point taking argv and returning an exit code
+        argv: Command line arguments
+        cwd: Directory to run in (restored afterwards)
+        env: Environment to run with (restored afterwards)
+        isatty: What the captured stdout/stderr report from isatty(), so
+            color decisions follow the client's terminal
+
+    Returns:
+        Tuple of (exit code, stdout bytes, stderr bytes)
+    """
+    out_buf, err_buf = io.BytesIO(), io.BytesIO()
+    out = _CapturedStream(out_buf, isatty)
+    err = _CapturedStream(err_buf, isatty)
+
+    prev_cwd = os.getcwd()
+    try:
+        if cwd:
+            os.chdir(cwd)
+        with _client_environ(env), \
+                contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                code = entry(list(argv))
+            except SystemExit as e:
+                # argparse --help / usage errors
+                if e.code is None or isinstance(e.code, int):
+                    code = e.code or 0
+                else:
+                    err.write(f"{e.code}\n")
+                    code = 1
+            except Exception as e:
+                logger.error(f"Daemon command failed: {e}", exc_info=True)
+                err.write(f"Error: {e}\n")
+                code = 1
+    finally:
+        os.chdir(prev_cwd)
+
+    out.flush()
+    err.flush()
+    return code or 0, out_buf.getvalue(), err_buf.getvalue()
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    """Handle one forwarded invocation per connection"""
+
+    def handle(self) -> None:
+        try:
+            request = _recv_message(self.request)
+        except (ConnectionError, ValueError, struct.error) as e:
+            logger.warning(f"Dropping malformed daemon request: {e}")
+            return
+
+        if request.get('op') == 'shutdown':
+            _send_message(self.request, {'exit': 0, 'stdout': '', 'stderr': ''})
+            # shutdown() blocks until serve_forever() returns, so it can't
+            # run on the serving thread
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+
+        code, out, err = run_captured(
+            self.server.entry,
+            request.get('argv', []),
+            request.get('cwd'),
+            env=request.get('env'),
+            isatty=bool(request.get('isatty'))
+        )
+        try:
+            _send_message(self.request, {
+                'exit': code,
+                'stdout': _bytes_to_wire(out),
+                'stderr': _bytes_to_wire(err),
+            })
+        except OSError as e:
+            logger.warning(f"Client went away before reply: {e}")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server running CLI invocations in-process"""
+
+    def __init__(self, socket_path: Path, entry: Callable[[List[str]], int]):
+        """
+        Bind the daemon socket
+
+        Args:
+            socket_path: Socket file to create (stale files are replaced)
+            entry: CLI entry point taking argv and returning an exit code
+        """
+        self.socket_path = Path(socket_path)
+        self.entry = entry
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        # Socket is only usable by the owner
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+        logger.info(f"Daemon listening on {self.socket_path}")
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def serve(socket_path: Path, entry: Callable[[List[str]], int]) -> None:
+    """
+    Serve requests in the foreground until shut down
+
+    Args:
+        socket_path: Socket file path
+        entry: CLI entry point taking argv and returning an exit code
+    """
+    with DaemonServer(socket_path, entry) as server:
+        server.serve_forever()
+    logger.info("Daemon stopped")
+
+
+def start_background(
+    socket_path: Path,
+    entry: Callable[[List[str]], int],
+    wait: float = 5.0
+) -> int:
+    """
+    Fork a detached daemon process and wait for it to accept connections
+
+    Args:
+        socket_path: Socket file path
+        entry: CLI entry point taking argv and returning an exit code
+        wait: Seconds to wait for the socket to come up
+
+    Returns:
+        PID of the daemon process
+
+    Raises:
+        RuntimeError: If the daemon doesn't come up in time
+    """
+    pid = os.fork()
+    if pid == 0:
+        # Child: detach from the terminal and serve until shutdown
+        code = 0
+        try:
+            os.setsid()
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            serve(socket_path, entry)
+        except BaseException:
+            code = 1
+        finally:
+            os._exit(code)
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if is_running(socket_path):
+            return pid
+        time.sleep(0.02)
+    raise RuntimeError(f"Daemon did not start listening on {socket_path}")
+
+
+# ==============================================================================
+# Client
+# ==============================================================================
+
+def _connect(socket_path: Path) -> Optional[socket.socket]:
+    """Connect to the daemon, or None if nothing is listening"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(_CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    # Commands may legitimately run for a long time
+    sock.settimeout(None)
+    return sock
+
+
+def is_running(socket_path: Path) -> bool:
+    """Check whether a daemon accepts connections on `socket_path`"""
+    sock = _connect(socket_path)
+    if sock is None:
+        return False
+    sock.close()
+    return True
+
+
+def forward(socket_path: Path, argv: List[str], cwd: str) -> Optional[int]:
+    """
+    Run an invocation in the daemon and replay its output
+
+    The command runs with this process's environment and sees stdout as
+    a terminal if ours is one. Only a failed connect returns None; once
+    the request is sent the command may have run, so later failures are
+    reported, not retried.
+
+    Args:
+        socket_path: Socket file path
+        argv: Command line arguments
+        cwd: Caller's working directory
+
+    Returns:
+        Exit code, or None if no daemon is listening
+    """
+    sock = _connect(socket_path)
+    if sock is None:
+        return None
+
+    try:
+        with sock:
+            _send_message(sock, {
+                'argv': argv,
+                'cwd': cwd,
+                'env': dict(os.environ),
+                'isatty': sys.stdout.isatty(),
+            })
+            reply = _recv_message(sock)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"grokflow: daemon request failed: {e}", file=sys.stderr)
+        return 1
+
+    for stream, key in ((sys.stdout, 'stdout'), (sys.stderr, 'stderr')):
+        data = _wire_to_bytes(reply.get(key, ''))
+        if not data:
+            continue
+        stream.flush()
+        buffer = getattr(stream, 'buffer', None)
+        if buffer is not None:
+            buffer.write(data)
+            buffer.flush()
+        else:
+            stream.write(data.decode('utf-8', 'replace'))
+    return int(reply.get('exit', 1))
+
+
+def stop(socket_path: Path) -> bool:
+    """
+    Ask a running daemon to shut down
+
+    Args:
+        socket_path: Socket file path
+
+    Returns:
+        True if a daemon acknowledged the request
+    """
+    sock = _connect(socket_path)
+    if sock is None:
+        return False
+    try:
+        with sock:
+            _send_message(sock, {'op': 'shutdown'})
+            _recv_message(sock)
+    except (OSError, ValueError, struct.error):
+        return False
+    return True
@@ -11,18 +11,57 @@ Features:
 - Context optimization
 - Fallback handling
 - Performance tracking
+- Response caching for deterministic requests
+- Speculative execution (executor drafts while the planner plans)
+- Planner/executor pipelining (executor starts on a partial plan)
+- Batched prompts (several requests per API call)
+- Planner context compression (outline/truncation of large context)
 """
 
-from typing import List, Dict, Optional, Any, Iterator
-from dataclasses import dataclass
+import ast
+import asyncio
+import hashlib
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Iterator, Callable, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
 
 from grokflow.api_client import GrokAPIClient, get_api_client
 from grokflow.exceptions import APIError, ModelNotAvailableError
 from grokflow.logging_config import get_logger
+from grokflow.performance import LRUCache
+
+# orjson (optional) speeds up cache-key serialization of long conversations
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 logger = get_logger('grokflow.dual_model')
 
+# Planner instructions go first as a fixed system message (never appended
+# to the user's message), so every planner call starts with the same bytes
+# and the provider's prompt-prefix cache can be reused across turns
+PLANNER_SYSTEM_MSG = {
+    'role': 'system',
+    'content': (
+        "Analyze the user's request and create a detailed execution plan. "
+        "Break down the task into clear steps."
+    )
+}
+
+# Follows the plan turn in every executor call (shared; never modified)
+EXECUTOR_INSTRUCTION_MSG = {
+    'role': 'user',
+    'content': "Now implement this plan. Provide the complete solution."
+}
+
 
 class ModelRole(Enum):
     """Model role in dual-model architecture"""
@@ -30,9 +69,13 @@ class ModelRole(Enum):
     EXECUTOR = "executor"
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ModelConfig:
-    """Configuration for a model"""
+    """Configuration for a model (immutable; use dataclasses.replace)"""
     name: str
     role: ModelRole
     temperature: float = 0.7
@@ -42,6 +85,441 @@ class ModelConfig:
         return f"{self.name} ({self.role.value})"
 
 
+class LLMCache:
+    """
+    Exact-match cache for non-streaming chat completions
+    
+    Keys are the SHA-256 of (model, messages, temperature, max_tokens).
+    Only temperature-0 requests are cached unless `cache_nondeterministic`
+    is set, since sampled responses are not expected to repeat.
+    
+    The backend is any object with get(key) -> value-or-None and
+    set(key, value); by default an in-memory LRUCache.
+    
+    Example:
+        >>> cache = LLMCache(max_size=256, ttl=3600)
+        >>> orchestrator = DualModelOrchestrator(response_cache=cache)
+    """
+    
+    def __init__(
+        self,
+        backend: Optional[Any] = None,
+        max_size: int = 256,
+        ttl: Optional[int] = None,
+        cache_nondeterministic: bool = False
+    ):
+        """
+        Initialize response cache
+        
+        Args:
+            backend: Cache backend (default: in-memory LRUCache)
+            max_size: Maximum entries for the default backend
+            ttl: Time-to-live in seconds for the default backend
+            cache_nondeterministic: Also cache requests with temperature > 0
+        """
+        self.backend = backend if backend is not None else LRUCache(max_size=max_size, ttl=ttl)
+        self.cache_nondeterministic = cache_nondeterministic
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int]
+    ) -> str:
+        """Build the cache key for a request"""
+        request = {
+            'model': model,
+            'messages': messages,
+            'temperature': temperature,
+            'max_tokens': max_tokens
+        }
+        if ORJSON_AVAILABLE:
+            try:
+                payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+            except TypeError:
+                payload = json.dumps(request, sort_keys=True).encode('utf-8')
+        else:
+            payload = json.dumps(request, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(payload).hexdigest()
+    
+    def complete(
+        self,
+        client: GrokAPIClient,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """
+        Get a completion's content, from the cache when possible
+        
+        Args:
+            client: API client used on a miss
+            messages: Message list
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens
+            
+        Returns:
+            Response content
+        """
+        cacheable = temperature == 0 or self.cache_nondeterministic
+        if cacheable:
+            key = self.make_key(model, messages, temperature, max_tokens)
+            content = self.backend.get(key)
+            if content is not None:
+                self.hits += 1
+                logger.debug("Response cache hit: %s", model)
+                return content
+            self.misses += 1
+        
+        content = client.chat_completion(
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=False
+        ).choices[0].message.content
+        if cacheable and content is not None:
+            self.backend.set(key, content)
+        return content
+    
+    def clear(self) -> None:
+        """Clear cached responses (default backend only)"""
+        if hasattr(self.backend, 'clear'):
+            self.backend.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counts"""
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+class SemanticCache:
+    """
+    Similarity cache for final responses, keyed by prompt embeddings
+    
+    Catches near-duplicate requests ("Fix main.py bug" / "Debug main.py")
+    that never hit an exact-match cache. Embeddings are unit vectors kept
+    in one float32 matrix, so a lookup is a single matrix-vector product.
+    The least recently used entry is replaced once `max_entries` is hit.
+    
+    Only the prompt is embedded. Anything that must match exactly (the
+    orchestrator passes a hash of the context) goes in `scope`: long
+    contexts would otherwise be truncated by the encoder, and requests
+    differing only past the cut-off would share a response.
+    
+    The embedding engine (GUKSEmbeddingEngine by default) is only loaded
+    on first use.
+    
+    Example:
+        >>> orchestrator = DualModelOrchestrator(semantic_cache=SemanticCache())
+    """
+    
+    def __init__(
+        self,
+        engine: Optional[Any] = None,
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None
+    ):
+        """
+        Initialize semantic cache
+        
+        Args:
+            engine: Object with a SentenceTransformer-style `model.encode`
+                (default: GUKSEmbeddingEngine, created lazily)
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum cached responses
+            ttl: Seconds a response stays valid (None = no expiration)
+        """
+        self._engine = engine
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        
+        self._lock = threading.Lock()
+        self._last_query: Optional[tuple] = None
+        self.clear()
+    
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        with self._lock:
+            self._vectors = None  # (max_entries, dim), allocated on first set()
+            self._created = None
+            self._last_used = None
+            self._scopes = None
+            self._responses: List[Optional[str]] = [None] * self.max_entries
+            self._count = 0
+            self._tick = 0
+    
+    def _embed(self, text: str) -> Any:
+        """Embed `text` as a unit float32 vector (the last query is reused)"""
+        with self._lock:
+            last = self._last_query
+        if last is not None and last[0] == text:
+            return last[1]
+        
+        import numpy as np
+        
+        if self._engine is None:
+            from grokflow.guks import GUKSEmbeddingEngine
+            self._engine = GUKSEmbeddingEngine()
+        
+        vector = np.asarray(
+            self._engine.model.encode([text], normalize_embeddings=True)[0],
+            dtype=np.float32
+        )
+        with self._lock:
+            self._last_query = (text, vector)
+        return vector
+    
+    def get(self, text: str, scope: str = '') -> Optional[str]:
+        """
+        Find a cached response for a similar request
+        
+        Args:
+            text: Request text (compared by similarity)
+            scope: Key the entry must match exactly (e.g. a context hash)
+            
+        Returns:
+            Cached response, or None if nothing is similar enough
+        """
+        vector = self._embed(text)
+        
+        with self._lock:
+            n = self._count
+            if n:
+                scores = self._vectors[:n] @ vector
+                if self.ttl is not None:
+                    expired = self._created[:n] < time.time() - self.ttl
+                    scores[expired] = -1.0
+                scores[self._scopes[:n] != scope] = -1.0
+                best = int(scores.argmax())
+                if scores[best] >= self.threshold:
+                    self._tick += 1
+                    self._last_used[best] = self._tick
+                    self.hits += 1
+                    logger.debug("Semantic cache hit (similarity %.3f)", scores[best])
+                    return self._responses[best]
+        
+        self.misses += 1
+        return None
+    
+    def set(self, text: str, response: str, scope: str = '') -> None:
+        """
+        Cache the response for a request
+        
+        Args:
+            text: Request text (compared by similarity)
+            response: Response to return for similar requests
+            scope: Key later requests must match exactly (e.g. a context hash)
+        """
+        import numpy as np
+        
+        vector = self._embed(text)
+        
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+                self._created = np.zeros(self.max_entries)
+                self._last_used = np.zeros(self.max_entries, dtype=np.int64)
+                self._scopes = np.full(self.max_entries, '', dtype=object)
+            
+            if self._count < self.max_entries:
+                i = self._count
+                self._count += 1
+            else:
+                i = int(self._last_used.argmin())
+            
+            self._tick += 1
+            self._vectors[i] = vector
+            self._created[i] = time.time()
+            self._last_used[i] = self._tick
+            self._responses[i] = response
+            self._scopes[i] = scope
+    
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counts and size"""
+        return {'hits': self.hits, 'misses': self.misses, 'size': self._count}
+
+
+# ==============================================================================
+# Context Compression
+# ==============================================================================
+
+# Default planner context budget, in estimated tokens (~4 characters each)
+PLANNER_CONTEXT_TOKENS = 2000
+
+
+def _python_outline(source: str) -> Optional[str]:
+    """Imports and class/def header lines of Python source, or None"""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+    
+    lines = source.splitlines()
+    header_lines = set()
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            header_lines.update(range(node.lineno, node.end_lineno + 1))
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            # Whole signature, up to the first body statement
+            header_end = max(node.lineno, node.body[0].lineno - 1)
+            header_lines.update(range(node.lineno, header_end + 1))
+    
+    if not header_lines:
+        return None
+    return "\n".join(lines[n - 1] for n in sorted(header_lines))
+
+
+def compress_context(context: str, max_tokens: int = PLANNER_CONTEXT_TOKENS) -> str:
+    """
+    Shrink context to roughly `max_tokens` for planning
+    
+    Python source is reduced to its outline (imports and class/def lines);
+    anything else, or an outline that is still too long, keeps its head
+    and tail around an omission marker.
+    
+    Args:
+        context: Context text
+        max_tokens: Token budget (estimated at 4 characters per token)
+        
+    Returns:
+        Context unchanged if within budget, otherwise a compressed version
+    """
+    max_chars = max_tokens * 4
+    if len(context) <= max_chars:
+        return context
+    
+    outline = _python_outline(context)
+    if outline is not None:
+        outline = f"[Outline of {context.count(chr(10)) + 1}-line Python source]\n{outline}"
+        if len(outline) <= max_chars:
+            return outline
+    
+    head = max_chars * 2 // 3
+    tail = max_chars - head
+    omitted = len(context) - head - tail
+    return (
+        f"{context[:head]}\n"
+        f"... [{omitted} characters omitted] ...\n"
+        f"{context[-tail:]}"
+    )
+
+
+# ==============================================================================
+# Batch Processing
+# ==============================================================================
+
+# Prompts packed into one API call by default
+DEFAULT_BATCH_ROWS = 5
+
+
+def _format_batch_prompt(prompts: List[str]) -> str:
+    """Pack prompts into one numbered request with a JSON reply contract"""
+    rows = "\n\n".join(f"[{i}] {prompt}" for i, prompt in enumerate(prompts, 1))
+    return (
+        f"Process the following {len(prompts)} requests independently. "
+        "Reply with only a JSON object mapping each request number to its "
+        'response, e.g. {"1": "...", "2": "..."}.\n\n'
+        f"{rows}"
+    )
+
+
+def _parse_batch_response(text: str, count: int) -> Optional[List[str]]:
+    """
+    Split a batched reply into per-prompt responses
+    
+    Args:
+        text: Model reply (may wrap the JSON in prose or a code fence)
+        count: Number of prompts in the batch
+        
+    Returns:
+        Responses in prompt order, or None if the reply breaks the contract
+    """
+    start, end = text.find('{'), text.rfind('}')
+    if start < 0 or end < start:
+        return None
+    try:
+        data = json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    
+    responses = []
+    for i in range(1, count + 1):
+        value = data.get(str(i))
+        if value is None:
+            return None
+        responses.append(value if isinstance(value, str) else json.dumps(value))
+    return responses
+
+
+def _run_batch(
+    complete: Callable[[str], Optional[str]],
+    prompts: List[str],
+    batch_rows: int,
+    max_concurrency: int
+) -> List[Optional[str]]:
+    """
+    Answer prompts in packed groups, running groups concurrently
+    
+    A group whose reply can't be parsed is split in half and retried, down
+    to single prompts sent as-is.
+    
+    Args:
+        complete: Sends one user message and returns the reply text
+        prompts: Prompts to answer
+        batch_rows: Prompts per API call
+        max_concurrency: Maximum API calls in flight
+        
+    Returns:
+        Responses in prompt order
+    """
+    results: List[Optional[str]] = [None] * len(prompts)
+    
+    def run_group(indices: List[int]) -> None:
+        if len(indices) == 1:
+            results[indices[0]] = complete(prompts[indices[0]])
+            return
+        
+        reply = complete(_format_batch_prompt([prompts[i] for i in indices]))
+        responses = _parse_batch_response(reply, len(indices)) if reply else None
+        if responses is None:
+            logger.warning("Unparseable reply for batch of %d, splitting", len(indices))
+            middle = len(indices) // 2
+            run_group(indices[:middle])
+            run_group(indices[middle:])
+            return
+        
+        for i, response in zip(indices, responses):
+            results[i] = response
+    
+    batch_rows = max(1, batch_rows)
+    groups = [
+        list(range(start, min(start + batch_rows, len(prompts))))
+        for start in range(0, len(prompts), batch_rows)
+    ]
+    if len(groups) <= 1 or max_concurrency <= 1:
+        for group in groups:
+            run_group(group)
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(groups))) as pool:
+            # list() re-raises the first failure
+            list(pool.map(run_group, groups))
+    
+    logger.info("Batch of %d prompts done in %d groups", len(prompts), len(groups))
+    return results
+
+
 class DualModelOrchestrator:
     """
     Orchestrates dual-model architecture
@@ -83,12 +561,24 @@ class DualModelOrchestrator:
     PLANNER_FALLBACKS = ['grok-beta', 'grok-4']
     EXECUTOR_FALLBACKS = ['grok-4-fast', 'grok-4']
     
+    # Pipelining: start the executor once the streamed plan has this many
+    # characters up to a paragraph break, and keep its result if the final
+    # plan grew by at most this fraction past that point
+    PIPELINE_MIN_CHARS = 200
+    PIPELINE_TOLERANCE = 0.1
+    
     def __init__(
         self,
         api_client: Optional[GrokAPIClient] = None,
         planner_config: Optional[ModelConfig] = None,
         executor_config: Optional[ModelConfig] = None,
-        enable_planner: bool = True
+        enable_planner: bool = True,
+        response_cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        speculative: bool = False,
+        plan_timeout: float = 10.0,
+        pipeline_planner: bool = False,
+        planner_context_tokens: Optional[int] = PLANNER_CONTEXT_TOKENS
     ):
         """
         Initialize dual-model orchestrator
@@ -98,30 +588,49 @@ class DualModelOrchestrator:
             planner_config: Planner model configuration
             executor_config: Executor model configuration
             enable_planner: Enable planner model (if False, executor only)
+            response_cache: Cache for non-streaming planner/executor calls
+            semantic_cache: Similarity cache for whole non-streaming requests
+                without conversation history
+            speculative: Run the executor without a plan while the planner
+                works (non-streaming requests only)
+            plan_timeout: Seconds to wait for the plan before settling for
+                the speculative draft
+            pipeline_planner: Stream the plan and start the executor on its
+                first paragraphs (non-streaming requests only)
+            planner_context_tokens: Context budget for the planner (larger
+                context is compressed, the executor still sees all of it;
+                None = no compression)
         """
         self.client = api_client or get_api_client()
         self.planner_config = planner_config or self.DEFAULT_PLANNER_CONFIG
         self.executor_config = executor_config or self.DEFAULT_EXECUTOR_CONFIG
         self.enable_planner = enable_planner
+        self.response_cache = response_cache
+        self.semantic_cache = semantic_cache
+        self.speculative = speculative
+        self.plan_timeout = plan_timeout
+        self.pipeline_planner = pipeline_planner
+        self.planner_context_tokens = planner_context_tokens
+        self._pool: Optional[ThreadPoolExecutor] = None
         
         # Verify models are available
         self._verify_models()
         
         logger.info(
-            f"DualModelOrchestrator initialized: "
-            f"planner={self.planner_config.name}, "
-            f"executor={self.executor_config.name}, "
-            f"planner_enabled={enable_planner}"
+            "DualModelOrchestrator initialized: "
+            "planner=%s, executor=%s, planner_enabled=%s",
+            self.planner_config.name, self.executor_config.name, enable_planner
         )
     
     def _verify_models(self) -> None:
         """Verify configured models are available"""
+        models = [self.executor_config.name]
+        if self.enable_planner:
+            models.append(self.planner_config.name)
         try:
-            if self.enable_planner:
-                self.client.validate_model(self.planner_config.name)
-            self.client.validate_model(self.executor_config.name)
+            self.client.validate_models(models)
         except ModelNotAvailableError as e:
-            logger.error(f"Model validation failed: {e}")
+            logger.error("Model validation failed: %s", e)
             raise
     
     def process_request(
@@ -143,7 +652,16 @@ class DualModelOrchestrator:
         Returns:
             Response from executor model
         """
-        logger.info(f"Processing request: {user_prompt[:100]}...")
+        logger.info("Processing request: %.100s...", user_prompt)
+        
+        # Near-duplicate of an earlier standalone request?
+        cache_key = self._semantic_cache_key(
+            user_prompt, context, conversation_history, stream
+        )
+        if cache_key is not None:
+            cached = self.semantic_cache.get(*cache_key)
+            if cached is not None:
+                return cached
         
         # Build messages
         messages = self._build_messages(
@@ -152,6 +670,133 @@ class DualModelOrchestrator:
             conversation_history=conversation_history
         )
         
+        planner_messages = self._build_planner_messages(
+            user_prompt, context, conversation_history, messages
+        )
+        
+        result = self._run_request(messages, stream, planner_messages)
+        if cache_key is not None and result is not None:
+            self.semantic_cache.set(cache_key[0], result, cache_key[1])
+        return result
+    
+    async def aprocess_request(
+        self,
+        user_prompt: str,
+        context: Optional[str] = None,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> str:
+        """
+        Process a non-streaming request from async code
+        
+        With the planner enabled, the planner and a speculative executor
+        draft run concurrently (see _arun_speculative).
+        
+        Args:
+            user_prompt: User's request/prompt
+            context: Optional context (code, files, etc.)
+            conversation_history: Previous conversation messages
+            
+        Returns:
+            Response from executor model
+        """
+        logger.info("Processing request: %.100s...", user_prompt)
+        
+        cache_key = self._semantic_cache_key(
+            user_prompt, context, conversation_history, False
+        )
+        if cache_key is not None:
+            cached = await self._in_thread(self.semantic_cache.get, *cache_key)
+            if cached is not None:
+                return cached
+        
+        messages = self._build_messages(
+            user_prompt=user_prompt,
+            context=context,
+            conversation_history=conversation_history
+        )
+        
+        if self.enable_planner:
+            planner_messages = self._build_planner_messages(
+                user_prompt, context, conversation_history, messages
+            )
+            result = await self._arun_speculative(messages, planner_messages)
+        else:
+            result = await self._in_thread(
+                self._execute_with_model, messages, self.executor_config
+            )
+        
+        if cache_key is not None and result is not None:
+            await self._in_thread(
+                self.semantic_cache.set, cache_key[0], result, cache_key[1]
+            )
+        return result
+    
+    def process_batch(
+        self,
+        prompts: List[str],
+        context: Optional[str] = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        max_concurrency: int = 8
+    ) -> List[Optional[str]]:
+        """
+        Answer many independent prompts with few API calls
+        
+        Prompts are packed `batch_rows` at a time into one executor call
+        with a numbered JSON reply contract. The planner is skipped: batch
+        items are meant to be small, uniform tasks (classify N files,
+        summarize N diffs).
+        
+        Args:
+            prompts: Independent prompts
+            context: Optional context shared by every prompt (sent once
+                per call)
+            batch_rows: Prompts per API call (1 = no packing)
+            max_concurrency: Maximum API calls in flight
+            
+        Returns:
+            Responses in prompt order
+        """
+        def complete(content: str) -> Optional[str]:
+            messages = self._build_messages(user_prompt=content, context=context)
+            return self._execute_with_model(messages, self.executor_config)
+        
+        return _run_batch(complete, prompts, batch_rows, max_concurrency)
+    
+    def _semantic_cache_key(
+        self,
+        user_prompt: str,
+        context: Optional[str],
+        conversation_history: Optional[List[Dict[str, str]]],
+        stream: bool
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Semantic cache (text, scope) for a request, or None to bypass it
+        
+        The prompt is matched by similarity and the context exactly (by
+        hash), so requests with different context never share a response.
+        """
+        if self.semantic_cache is None or stream or conversation_history:
+            return None
+        scope = hashlib.sha256(context.encode('utf-8')).hexdigest() if context else ''
+        return user_prompt, scope
+    
+    def _run_request(
+        self,
+        messages: List[Dict[str, str]],
+        stream: bool,
+        planner_messages: Optional[List[Dict[str, str]]] = None
+    ) -> Any:
+        """
+        Run the planner/executor flow for built messages
+        
+        Args:
+            messages: Message list from _build_messages()
+            stream: Enable streaming response
+            planner_messages: Planner's view of the request (default: messages)
+            
+        Returns:
+            Response from executor model
+        """
         # If planner disabled, go straight to executor
         if not self.enable_planner:
             logger.debug("Planner disabled, using executor only")
@@ -161,12 +806,24 @@ class DualModelOrchestrator:
                 stream=stream
             )
         
+        if self.speculative and not stream:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._arun_speculative(messages, planner_messages))
+            # Called from inside an event loop: asyncio.run() would fail,
+            # async callers should use aprocess_request() instead
+            logger.debug("Event loop running, skipping speculative execution")
+        
+        if self.pipeline_planner and not stream:
+            return self._run_pipelined(messages, planner_messages)
+        
         # Step 1: Planner analyzes and creates plan
         try:
-            plan = self._create_plan(messages)
-            logger.debug(f"Plan created: {plan[:200]}...")
+            plan = self._create_plan(planner_messages or messages)
+            logger.debug("Plan created: %.200s...", plan)
         except Exception as e:
-            logger.warning(f"Planner failed, falling back to executor: {e}")
+            logger.warning("Planner failed, falling back to executor: %s", e)
             # Fallback to executor only
             return self._execute_with_model(
                 messages=messages,
@@ -186,6 +843,155 @@ class DualModelOrchestrator:
             stream=stream
         )
     
+    async def _arun_speculative(
+        self,
+        messages: List[Dict[str, str]],
+        planner_messages: Optional[List[Dict[str, str]]] = None
+    ) -> str:
+        """
+        Overlap the planner with a plan-less executor draft
+        
+        A plan that arrives within `plan_timeout` while the draft is still
+        running wins: the draft is abandoned and the executor runs with the
+        plan, as in the sequential flow. Otherwise (draft finished first,
+        planner slow or failing) the draft is returned, saving the planner
+        round-trip. The blocking client calls run in worker threads, so an
+        abandoned call finishes in the background and its result is dropped.
+        
+        Args:
+            messages: Message list from _build_messages()
+            planner_messages: Planner's view of the request (default: messages)
+            
+        Returns:
+            Response from executor model
+        """
+        plan_task = asyncio.create_task(
+            self._in_thread(self._create_plan, planner_messages or messages)
+        )
+        draft_task = asyncio.create_task(
+            self._in_thread(self._execute_with_model, messages, self.executor_config)
+        )
+        
+        await asyncio.wait(
+            {plan_task, draft_task},
+            timeout=self.plan_timeout,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        if not draft_task.done() and plan_task.done() and plan_task.exception() is None:
+            draft_task.cancel()
+            plan = plan_task.result()
+            logger.debug("Plan arrived before draft: %.200s...", plan)
+            executor_messages = self._build_executor_messages(
+                original_messages=messages,
+                plan=plan
+            )
+            return await self._in_thread(
+                self._execute_with_model, executor_messages, self.executor_config
+            )
+        
+        if plan_task.done() and plan_task.exception() is not None:
+            logger.warning("Planner failed, using executor draft: %s", plan_task.exception())
+        else:
+            plan_task.cancel()
+            logger.info("Using speculative executor draft (planner not needed)")
+        return await draft_task
+    
+    async def _in_thread(self, func: Any, *args: Any) -> Any:
+        """
+        Run a blocking call on the orchestrator's worker pool
+        
+        A private pool rather than asyncio.to_thread(): asyncio.run() joins
+        the default executor on exit, which would make process_request()
+        wait for abandoned planner calls.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._worker_pool(), func, *args
+        )
+    
+    def _worker_pool(self) -> ThreadPoolExecutor:
+        """Get the pool for background model calls (created on first use)"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix='grokflow-worker'
+            )
+        return self._pool
+    
+    def _run_pipelined(
+        self,
+        messages: List[Dict[str, str]],
+        planner_messages: Optional[List[Dict[str, str]]] = None
+    ) -> str:
+        """
+        Stream the plan and start the executor before the planner finishes
+        
+        The executor is launched in the background on the plan text up to
+        the first paragraph break past PIPELINE_MIN_CHARS. When the plan is
+        complete, that result is kept if the plan grew by at most
+        PIPELINE_TOLERANCE since; otherwise it is dropped and the executor
+        runs on the full plan, as in the sequential flow. Streamed plans
+        bypass the response cache.
+        
+        Args:
+            messages: Message list from _build_messages()
+            planner_messages: Planner's view of the request (default: messages)
+            
+        Returns:
+            Response from executor model
+        """
+        early = None
+        early_plan_size = 0
+        parts: List[str] = []
+        size = 0
+        
+        try:
+            chunks = self.client.stream_completion(
+                messages=[PLANNER_SYSTEM_MSG, *(planner_messages or messages)],
+                model=self.planner_config.name,
+                temperature=self.planner_config.temperature,
+                max_tokens=self.planner_config.max_tokens
+            )
+            for chunk in chunks:
+                parts.append(chunk)
+                size += len(chunk)
+                
+                if early is None and size >= self.PIPELINE_MIN_CHARS and '\n' in chunk:
+                    text = ''.join(parts)
+                    cut = text.rfind('\n\n')
+                    if cut >= self.PIPELINE_MIN_CHARS:
+                        early_plan_size = cut
+                        early = self._worker_pool().submit(
+                            self._execute_with_model,
+                            self._build_executor_messages(messages, text[:cut]),
+                            self.executor_config
+                        )
+                        logger.debug("Executor started on partial plan (%d chars)", cut)
+        except Exception as e:
+            if early is not None:
+                early.cancel()
+            logger.warning("Planner failed, falling back to executor: %s", e)
+            return self._execute_with_model(messages, self.executor_config)
+        
+        plan = ''.join(parts)
+        logger.info("Plan streamed by %s", self.planner_config.name)
+        
+        if early is not None:
+            if len(plan) <= early_plan_size * (1 + self.PIPELINE_TOLERANCE):
+                try:
+                    return early.result()
+                except Exception as e:
+                    logger.warning("Pipelined executor failed, rerunning: %s", e)
+            else:
+                early.cancel()
+                logger.debug(
+                    "Plan grew from %d to %d chars, rerunning executor",
+                    early_plan_size, len(plan)
+                )
+        
+        return self._execute_with_model(
+            self._build_executor_messages(messages, plan),
+            self.executor_config
+        )
+    
     def _build_messages(
         self,
         user_prompt: str,
@@ -203,23 +1009,42 @@ class DualModelOrchestrator:
         Returns:
             List of message dicts
         """
-        messages = []
-        
-        # Add conversation history
-        if conversation_history:
-            messages.extend(conversation_history)
-        
         # Build user message with context
         user_message = user_prompt
         if context:
             user_message = f"Context:\n{context}\n\nRequest:\n{user_prompt}"
         
-        messages.append({
-            'role': 'user',
-            'content': user_message
-        })
+        # History dicts are shared, never modified
+        return [*(conversation_history or ()), {'role': 'user', 'content': user_message}]
+    
+    def _build_planner_messages(
+        self,
+        user_prompt: str,
+        context: Optional[str],
+        conversation_history: Optional[List[Dict[str, str]]],
+        messages: List[Dict[str, str]]
+    ) -> List[Dict[str, str]]:
+        """
+        Build the planner's messages, with context compressed to budget
+        
+        Args:
+            user_prompt: User's prompt
+            context: Optional context
+            conversation_history: Previous messages
+            messages: Full messages (returned when nothing is compressed)
+            
+        Returns:
+            Message list for the planner
+        """
+        if not (self.enable_planner and context and self.planner_context_tokens):
+            return messages
         
-        return messages
+        compressed = compress_context(context, self.planner_context_tokens)
+        if compressed is context:
+            return messages
+        
+        logger.debug("Planner context compressed: %d -> %d chars", len(context), len(compressed))
+        return self._build_messages(user_prompt, compressed, conversation_history)
     
     def _create_plan(self, messages: List[Dict[str, str]]) -> str:
         """
@@ -231,25 +1056,28 @@ class DualModelOrchestrator:
         Returns:
             Plan as string
         """
-        # Add planning instruction
-        planning_messages = messages.copy()
-        planning_messages[-1]['content'] = (
-            f"{planning_messages[-1]['content']}\n\n"
-            "Analyze this request and create a detailed execution plan. "
-            "Break down the task into clear steps."
-        )
+        # Caller's messages are left untouched (they prefix the executor call)
+        planning_messages = [PLANNER_SYSTEM_MSG, *messages]
         
-        logger.debug(f"Calling planner: {self.planner_config.name}")
+        logger.debug("Calling planner: %s", self.planner_config.name)
         
-        response = self.client.chat_completion(
-            messages=planning_messages,
-            model=self.planner_config.name,
-            temperature=self.planner_config.temperature,
-            max_tokens=self.planner_config.max_tokens
-        )
-        
-        plan = response.choices[0].message.content
-        logger.info(f"Plan created by {self.planner_config.name}")
+        if self.response_cache is not None:
+            plan = self.response_cache.complete(
+                self.client,
+                messages=planning_messages,
+                model=self.planner_config.name,
+                temperature=self.planner_config.temperature,
+                max_tokens=self.planner_config.max_tokens
+            )
+        else:
+            response = self.client.chat_completion(
+                messages=planning_messages,
+                model=self.planner_config.name,
+                temperature=self.planner_config.temperature,
+                max_tokens=self.planner_config.max_tokens
+            )
+            plan = response.choices[0].message.content
+        logger.info("Plan created by %s", self.planner_config.name)
         
         return plan
     
@@ -261,6 +1089,10 @@ class DualModelOrchestrator:
         """
         Build messages for executor with plan
         
+        Returns a new list; `original_messages` and its dicts are never
+        modified, since they are shared with the caller's history and any
+        cache keys derived from it.
+        
         Args:
             original_messages: Original user messages
             plan: Plan from planner
@@ -268,21 +1100,12 @@ class DualModelOrchestrator:
         Returns:
             Messages for executor
         """
-        executor_messages = original_messages.copy()
-        
-        # Add plan as assistant message
-        executor_messages.append({
-            'role': 'assistant',
-            'content': f"Plan:\n{plan}"
-        })
-        
-        # Add execution instruction
-        executor_messages.append({
-            'role': 'user',
-            'content': "Now implement this plan. Provide the complete solution."
-        })
-        
-        return executor_messages
+        return [
+            *original_messages,
+            # Plan as assistant message
+            {'role': 'assistant', 'content': f"Plan:\n{plan}"},
+            EXECUTOR_INSTRUCTION_MSG
+        ]
     
     def _execute_with_model(
         self,
@@ -301,7 +1124,7 @@ class DualModelOrchestrator:
         Returns:
             API response or stream iterator
         """
-        logger.debug(f"Executing with {config}")
+        logger.debug("Executing with %s", config)
         
         if stream:
             return self.client.stream_completion(
@@ -310,6 +1133,14 @@ class DualModelOrchestrator:
                 temperature=config.temperature,
                 max_tokens=config.max_tokens
             )
+        elif self.response_cache is not None:
+            return self.response_cache.complete(
+                self.client,
+                messages=messages,
+                model=config.name,
+                temperature=config.temperature,
+                max_tokens=config.max_tokens
+            )
         else:
             response = self.client.chat_completion(
                 messages=messages,
@@ -329,23 +1160,24 @@ class DualModelOrchestrator:
         """
         Stream response for user request
         
+        The planner (if enabled) runs before this returns; the executor's
+        stream is handed back as-is rather than re-yielded through another
+        generator frame per chunk.
+        
         Args:
             user_prompt: User's request
             context: Optional context
             conversation_history: Previous messages
             
-        Yields:
-            Response chunks
+        Returns:
+            Iterator of response chunks
         """
-        result = self.process_request(
+        return self.process_request(
             user_prompt=user_prompt,
             context=context,
             conversation_history=conversation_history,
             stream=True
         )
-        
-        # Result is already an iterator from stream_completion
-        yield from result
     
     def switch_planner(self, model_name: str) -> None:
         """
@@ -355,8 +1187,9 @@ class DualModelOrchestrator:
             model_name: New planner model name
         """
         self.client.validate_model(model_name)
-        self.planner_config.name = model_name
-        logger.info(f"Switched planner to: {model_name}")
+        self.planner_config = replace(self.planner_config, name=model_name)
+        self._clear_semantic_cache()
+        logger.info("Switched planner to: %s", model_name)
     
     def switch_executor(self, model_name: str) -> None:
         """
@@ -366,19 +1199,27 @@ class DualModelOrchestrator:
             model_name: New executor model name
         """
         self.client.validate_model(model_name)
-        self.executor_config.name = model_name
-        logger.info(f"Switched executor to: {model_name}")
+        self.executor_config = replace(self.executor_config, name=model_name)
+        self._clear_semantic_cache()
+        logger.info("Switched executor to: %s", model_name)
     
     def disable_planner(self) -> None:
         """Disable planner (executor only mode)"""
         self.enable_planner = False
+        self._clear_semantic_cache()
         logger.info("Planner disabled, using executor only")
     
     def enable_planner_mode(self) -> None:
         """Enable planner mode"""
         self.enable_planner = True
+        self._clear_semantic_cache()
         logger.info("Planner enabled")
     
+    def _clear_semantic_cache(self) -> None:
+        """Drop semantically cached responses (they came from the old setup)"""
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
+    
     def get_config_info(self) -> Dict[str, Any]:
         """
         Get current configuration
@@ -412,7 +1253,8 @@ class SimpleExecutor:
         self,
         api_client: Optional[GrokAPIClient] = None,
         model: str = 'grok-4-fast',
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        response_cache: Optional[LLMCache] = None
     ):
         """
         Initialize simple executor
@@ -421,13 +1263,15 @@ class SimpleExecutor:
             api_client: API client
             model: Model to use
             temperature: Sampling temperature
+            response_cache: Cache for non-streaming requests
         """
         self.client = api_client or get_api_client()
         self.model = model
         self.temperature = temperature
+        self.response_cache = response_cache
         
         self.client.validate_model(model)
-        logger.info(f"SimpleExecutor initialized: model={model}")
+        logger.info("SimpleExecutor initialized: model=%s", model)
     
     def execute(
         self,
@@ -446,10 +1290,8 @@ class SimpleExecutor:
         Returns:
             Response or stream iterator
         """
-        messages = [{'role': 'user', 'content': prompt}]
-        
-        if context:
-            messages[0]['content'] = f"Context:\n{context}\n\nRequest:\n{prompt}"
+        content = f"Context:\n{context}\n\nRequest:\n{prompt}" if context else prompt
+        messages = [{'role': 'user', 'content': content}]
         
         if stream:
             return self.client.stream_completion(
@@ -457,6 +1299,13 @@ class SimpleExecutor:
                 model=self.model,
                 temperature=self.temperature
             )
+        elif self.response_cache is not None:
+            return self.response_cache.complete(
+                self.client,
+                messages=messages,
+                model=self.model,
+                temperature=self.temperature
+            )
         else:
             response = self.client.chat_completion(
                 messages=messages,
@@ -464,10 +1313,35 @@ class SimpleExecutor:
                 temperature=self.temperature
             )
             return response.choices[0].message.content
+    
+    def process_batch(
+        self,
+        prompts: List[str],
+        context: Optional[str] = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        max_concurrency: int = 8
+    ) -> List[Optional[str]]:
+        """
+        Answer many independent prompts with few API calls
+        
+        Args:
+            prompts: Independent prompts
+            context: Optional context shared by every prompt
+            batch_rows: Prompts per API call (1 = no packing)
+            max_concurrency: Maximum API calls in flight
+            
+        Returns:
+            Responses in prompt order
+        """
+        return _run_batch(
+            lambda content: self.execute(content, context=context),
+            prompts, batch_rows, max_concurrency
+        )
 
 
 # Global orchestrator instance
 _global_orchestrator: Optional[DualModelOrchestrator] = None
+_global_orchestrator_lock = threading.Lock()
 
 
 def get_orchestrator(
@@ -490,7 +1364,14 @@ def get_orchestrator(
     """
     global _global_orchestrator
     
-    if _global_orchestrator is None or force_new:
+    if _global_orchestrator is not None and not force_new:
+        return _global_orchestrator
+    
+    with _global_orchestrator_lock:
+        # Another thread may have built it while we waited
+        if _global_orchestrator is not None and not force_new:
+            return _global_orchestrator
+        
         planner_config = None
         if planner_model:
             planner_config = ModelConfig(
@@ -5,6 +5,41 @@ Provides specific exception types for better error handling and debugging.
 All exceptions inherit from GrokFlowError for easy catching.
 """
 
+__all__ = [
+    'GrokFlowError',
+    'APIError',
+    'RateLimitError',
+    'ContextError',
+    'AuthenticationError',
+    'ModelNotAvailableError',
+    'APITimeoutError',
+    'FileOperationError',
+    'BinaryFileError',
+    'FileNotFoundError',
+    'FileReadError',
+    'FileWriteError',
+    'SessionError',
+    'SessionCorruptedError',
+    'SessionLockError',
+    'ValidationError',
+    'PathValidationError',
+    'ImageValidationError',
+    'TemplateValidationError',
+    'GitError',
+    'GitNotFoundError',
+    'GitCommandError',
+    'NotInGitRepoError',
+    'KnowledgeBaseError',
+    'KnowledgeBaseNotAvailableError',
+    'KnowledgeBaseInitError',
+    'TemplateError',
+    'TemplateNotFoundError',
+    'TemplateRenderError',
+    'UndoError',
+    'NoUndoHistoryError',
+    'UndoRestoreError',
+]
+
 
 class GrokFlowError(Exception):
     """Base exception for all GrokFlow errors"""
@@ -22,21 +57,11 @@ class RateLimitError(GrokFlowError):
     pass
 
 
-class KnowledgeBaseError(GrokFlowError):
-    """Knowledge base operation failed"""
-    pass
-
-
 class ContextError(GrokFlowError):
     """Context building or management failed"""
     pass
 
 
-class UndoError(GrokFlowError):
-    """Undo/redo operation failed"""
-    pass
-
-
 class AuthenticationError(APIError):
     """API authentication failed (invalid API key)"""
     pass
@@ -22,8 +22,34 @@ Usage:
     constraints = analytics.suggest_constraint_rules()
 """
 
-from .embeddings import EnhancedGUKS, GUKSEmbeddingEngine
-from .analytics import GUKSAnalytics
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 __version__ = "1.0.0"
 __all__ = ['EnhancedGUKS', 'GUKSEmbeddingEngine', 'GUKSAnalytics']
+
+# Submodules are imported on first attribute access (PEP 562): embeddings
+# pulls in sentence-transformers/torch and faiss, which `import grokflow.guks`
+# alone shouldn't pay for
+_LAZY_ATTRS = {
+    'EnhancedGUKS': '.embeddings',
+    'GUKSEmbeddingEngine': '.embeddings',
+    'GUKSAnalytics': '.analytics',
+}
+
+if TYPE_CHECKING:
+    from .embeddings import EnhancedGUKS, GUKSEmbeddingEngine
+    from .analytics import GUKSAnalytics
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
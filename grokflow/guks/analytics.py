@@ -17,10 +17,115 @@ Use cases:
 from typing import List, Dict, Optional, Tuple
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
+import bisect
+import functools
+import operator
 import re
 from pathlib import Path
 import json
 
+# RE2 (optional) gives linear-time matching for the category keyword scan
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+# Error normalization patterns (see _normalize_error)
+_RE_QUOTED = re.compile(r'["\'].*?["\']')
+_RE_NUM = re.compile(r'\d+')
+# Unix and Windows paths in one pass (neither run contains the other's
+# separator, so this matches what two separate passes would)
+_RE_PATH = re.compile(r'/[\w/\.]+|\\[\w\\\.]+')
+_RE_VAR = re.compile(r'\b[a-z_][a-z0-9_]*\b')
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_error(error: str) -> str:
+    """
+    Normalize error message to group similar errors
+
+    Removes:
+      - Variable names
+      - File paths
+      - Line numbers
+      - Specific values
+
+    Cached, since the same error text tends to recur across patterns.
+    """
+    # Remove quoted strings
+    normalized = _RE_QUOTED.sub('<string>', error)
+
+    # Remove numbers
+    normalized = _RE_NUM.sub('<num>', normalized)
+
+    # Remove file paths
+    normalized = _RE_PATH.sub('<path>', normalized)
+
+    # Remove common variable patterns
+    normalized = _RE_VAR.sub('<var>', normalized)
+
+    return normalized.strip()
+
+# Category keywords, in priority order (first category with a hit wins)
+_CATEGORY_KEYWORDS = {
+    'null_pointer': [
+        'nullpointerexception', 'cannot read property', 'undefined',
+        'null', 'none type', 'nullreferenceexception'
+    ],
+    'type_error': [
+        'typeerror', 'type mismatch', 'expected', 'type error',
+        'cannot convert', 'invalid type'
+    ],
+    'async_error': [
+        'promise', 'async', 'await', 'unhandledpromiserejection',
+        'timeout', 'async function', 'callback'
+    ],
+    'api_error': [
+        'api', 'http', 'rest', 'graphql', 'fetch', 'request',
+        'response', 'status code', '404', '500'
+    ],
+    'validation_error': [
+        'validation', 'schema', 'invalid', 'required field',
+        'missing parameter', 'constraint'
+    ],
+    'import_error': [
+        'import', 'module not found', 'cannot find module',
+        'circular import', 'dependency'
+    ],
+    'state_error': [
+        'race condition', 'stale', 'state', 'concurrent',
+        'lock', 'mutex'
+    ],
+    'security': [
+        'auth', 'authentication', 'authorization', 'xss',
+        'injection', 'sql injection', 'csrf', 'sanitize'
+    ]
+}
+
+# One alternation per category, so each category is a single C-level scan.
+# A single combined regex would return the leftmost keyword rather than the
+# highest-priority category, so categories stay separate patterns.
+# These are plain literals, so RE2 matches exactly what re would; the
+# normalization patterns stay on re (RE2's \w, \d and \b are ASCII-only).
+_CATEGORY_ENGINE = re2 if RE2_AVAILABLE else re
+_CATEGORY_RES = [
+    (category, _CATEGORY_ENGINE.compile('|'.join(re.escape(kw) for kw in keywords)))
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+]
+
+# Sort rank for recurring bugs (medium and low rank equally, by count only)
+_URGENCY_RANK = {'critical': 2, 'high': 1, 'medium': 0, 'low': 0}
+
+
+def _classify_text(text: str) -> str:
+    """Category of a lowercased 'error fix' text ('other' if none matches)"""
+    for category, regex in _CATEGORY_RES:
+        if regex.search(text):
+            return category
+    return 'other'
+
 
 class GUKSAnalytics:
     """
@@ -41,8 +146,22 @@ class GUKSAnalytics:
             patterns: List of GUKS patterns from EnhancedGUKS
         """
         self.patterns = patterns
+
+        # Per-pattern columns (parallel to patterns)
+        self._search_texts = [
+            f"{p.get('error', '').lower()} {p.get('fix', '').lower()}"
+            for p in patterns
+        ]
+        self._pattern_categories: List[str] = []
         self.categories = self._categorize_patterns()
 
+        # Results are derived from the patterns snapshot, so compute them
+        # once (generate_report and get_team_insights both need them)
+        self._recurring_cache: Dict[Tuple[int, float], List[Dict]] = {}
+        self._rules_cache: Optional[List[Dict]] = None
+        self._timestamps: Optional[List[datetime]] = None
+        self._timestamps_ordered = False
+
     def _categorize_patterns(self) -> Dict[str, List[Dict]]:
         """
         Categorize patterns by error type
@@ -60,59 +179,13 @@ class GUKSAnalytics:
         Returns:
             Dict mapping category to patterns
         """
-        categories = defaultdict(list)
+        # Columnar pass: search text column -> category column
+        self._pattern_categories = list(map(_classify_text, self._search_texts))
 
-        category_keywords = {
-            'null_pointer': [
-                'nullpointerexception', 'cannot read property', 'undefined',
-                'null', 'none type', 'nullreferenceexception'
-            ],
-            'type_error': [
-                'typeerror', 'type mismatch', 'expected', 'type error',
-                'cannot convert', 'invalid type'
-            ],
-            'async_error': [
-                'promise', 'async', 'await', 'unhandledpromiserejection',
-                'timeout', 'async function', 'callback'
-            ],
-            'api_error': [
-                'api', 'http', 'rest', 'graphql', 'fetch', 'request',
-                'response', 'status code', '404', '500'
-            ],
-            'validation_error': [
-                'validation', 'schema', 'invalid', 'required field',
-                'missing parameter', 'constraint'
-            ],
-            'import_error': [
-                'import', 'module not found', 'cannot find module',
-                'circular import', 'dependency'
-            ],
-            'state_error': [
-                'race condition', 'stale', 'state', 'concurrent',
-                'lock', 'mutex'
-            ],
-            'security': [
-                'auth', 'authentication', 'authorization', 'xss',
-                'injection', 'sql injection', 'csrf', 'sanitize'
-            ]
-        }
-
-        for pattern in self.patterns:
-            error = pattern.get('error', '').lower()
-            fix = pattern.get('fix', '').lower()
-            text = f"{error} {fix}"
-
-            # Match to categories
-            matched = False
-            for category, keywords in category_keywords.items():
-                if any(kw in text for kw in keywords):
-                    categories[category].append(pattern)
-                    matched = True
-                    break
-
-            # Catch-all for unmatched
-            if not matched:
-                categories['other'].append(pattern)
+        # Group patterns by their category label
+        categories = defaultdict(list)
+        for pattern, category in zip(self.patterns, self._pattern_categories):
+            categories[category].append(pattern)
 
         return dict(categories)
 
@@ -144,74 +217,68 @@ class GUKSAnalytics:
                 }
             ]
         """
-        # Group similar errors
-        error_groups = defaultdict(list)
+        cache_key = (min_count, similarity_threshold)
+        cached = self._recurring_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        # Group similar errors, aggregating each group as we go
+        error_groups = defaultdict(lambda: {
+            'count': 0,
+            'projects': set(),
+            'fixes': Counter(),
+            'examples': [],
+        })
 
         for pattern in self.patterns:
             error = pattern.get('error', '')
 
             # Normalize error message
-            normalized = self._normalize_error(error)
+            normalized = _normalize_error(error)
 
-            error_groups[normalized].append(pattern)
+            group = error_groups[normalized]
+            group['count'] += 1
+            group['projects'].add(pattern.get('project', 'unknown'))
+            group['fixes'][pattern.get('fix', '')] += 1
+            if len(group['examples']) < 3:
+                group['examples'].append(pattern)
 
         # Find recurring patterns
         recurring = []
 
-        for normalized_error, instances in error_groups.items():
-            if len(instances) >= min_count:
-                # Analyze this recurring pattern
-                projects = set(p.get('project', 'unknown') for p in instances)
-                fixes = [p.get('fix', '') for p in instances]
+        for normalized_error, group in error_groups.items():
+            count = group['count']
+            if count >= min_count:
+                projects = group['projects']
+                first = group['examples'][0]
 
-                # Check if fixes are consistent
-                fix_consensus = Counter(fixes).most_common(1)[0]
-                fix_agreement = fix_consensus[1] / len(fixes)
+                # Check if fixes are consistent (max keeps the first-seen
+                # fix on ties, like most_common(1))
+                fix_consensus = max(group['fixes'].items(), key=operator.itemgetter(1))
+                fix_agreement = fix_consensus[1] / count
 
                 recurring.append({
-                    'pattern': instances[0].get('error', ''),
+                    'pattern': first.get('error', ''),
                     'normalized': normalized_error,
-                    'count': len(instances),
+                    'count': count,
                     'projects': sorted(projects),
                     'fix': fix_consensus[0],
                     'fix_agreement': fix_agreement,
-                    'urgency': self._calculate_urgency(len(instances), len(projects)),
-                    'suggested_action': self._suggest_action(instances[0]),
-                    'examples': instances[:3]  # Sample instances
+                    'urgency': self._calculate_urgency(count, len(projects)),
+                    'suggested_action': self._suggest_action(first),
+                    'examples': group['examples']  # Sample instances
                 })
 
         # Sort by urgency and count
-        recurring.sort(key=lambda x: (x['urgency'] == 'critical',
-                                       x['urgency'] == 'high',
-                                       x['count']),
+        recurring.sort(key=lambda x: (_URGENCY_RANK[x['urgency']], x['count']),
                        reverse=True)
 
-        return recurring
+        self._recurring_cache[cache_key] = recurring
+        return list(recurring)
 
     def _normalize_error(self, error: str) -> str:
-        """
-        Normalize error message to group similar errors
-
-        Removes:
-          - Variable names
-          - File paths
-          - Line numbers
-          - Specific values
-        """
-        # Remove quoted strings
-        normalized = re.sub(r'["\'].*?["\']', '<string>', error)
-
-        # Remove numbers
-        normalized = re.sub(r'\d+', '<num>', normalized)
-
-        # Remove file paths
-        normalized = re.sub(r'/[\w/\.]+', '<path>', normalized)
-        normalized = re.sub(r'\\[\w\\\.]+', '<path>', normalized)
-
-        # Remove common variable patterns
-        normalized = re.sub(r'\b[a-z_][a-z0-9_]*\b', '<var>', normalized)
-
-        return normalized.strip()
+        """Normalize error message to group similar errors"""
+        return _normalize_error(error)
 
     def _calculate_urgency(self, count: int, num_projects: int) -> str:
         """
@@ -287,6 +354,9 @@ class GUKSAnalytics:
                 }
             ]
         """
+        if self._rules_cache is not None:
+            return list(self._rules_cache)
+
         rules = []
 
         # Analyze categories for rule opportunities
@@ -338,7 +408,26 @@ class GUKSAnalytics:
                     'recommendation': 'Use Zod or ajv for runtime validation'
                 })
 
-        return rules
+        self._rules_cache = rules
+        return list(rules)
+
+    def _pattern_timestamps(self) -> List[datetime]:
+        """
+        Parse pattern timestamps once (parallel to self.patterns)
+
+        Parsed on first use rather than in __init__, so a malformed
+        timestamp only affects the time-window queries.
+        """
+        if self._timestamps is None:
+            timestamps = [
+                datetime.fromisoformat(p.get('timestamp', '2000-01-01T00:00:00'))
+                for p in self.patterns
+            ]
+            self._timestamps_ordered = all(
+                a <= b for a, b in zip(timestamps, timestamps[1:])
+            )
+            self._timestamps = timestamps
+        return self._timestamps
 
     def get_team_insights(self, days: int = 30) -> Dict:
         """
@@ -363,10 +452,16 @@ class GUKSAnalytics:
         cutoff_date = datetime.now() - timedelta(days=days)
 
         # Filter recent patterns
-        recent_patterns = [
-            p for p in self.patterns
-            if datetime.fromisoformat(p.get('timestamp', '2000-01-01T00:00:00')) > cutoff_date
-        ]
+        timestamps = self._pattern_timestamps()
+        if self._timestamps_ordered:
+            # Chronological (append-order) corpus: recent patterns are a suffix
+            start = bisect.bisect_right(timestamps, cutoff_date)
+            recent_patterns = self.patterns[start:]
+        else:
+            recent_patterns = [
+                p for p, timestamp in zip(self.patterns, timestamps)
+                if timestamp > cutoff_date
+            ]
 
         # Category distribution
         category_counts = {
@@ -408,14 +503,14 @@ class GUKSAnalytics:
         if len(patterns) < 10:
             return 'insufficient_data'
 
-        # Split into two halves
+        # Split into two halves (sizes only, no need to copy the list)
         mid = len(patterns) // 2
-        first_half = patterns[:mid]
-        second_half = patterns[mid:]
+        first_count = mid
+        second_count = len(patterns) - mid
 
         # Compare bug rates
-        first_rate = len(first_half) / (days / 2)
-        second_rate = len(second_half) / (days / 2)
+        first_rate = first_count / (days / 2)
+        second_rate = second_count / (days / 2)
 
         if second_rate < first_rate * 0.8:
             return 'improving'
@@ -157,7 +157,7 @@ async def record_fix(
     """
     Record a successful fix in GUKS
 
-    Runs index rebuild in background for zero latency.
+    Runs the index update in background for zero latency.
     """
     try:
         guks = get_guks()
@@ -12,21 +12,49 @@ Performance Target: <100ms queries for real-time IDE integration
 
 from sentence_transformers import SentenceTransformer
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import faiss
 from pathlib import Path
+import hashlib
 import json
+import os
 import pickle
+import threading
 from datetime import datetime
 
 
+# Index selection: exact scan is faster than graph traversal for small
+# knowledge bases, HNSW keeps queries sub-linear as they grow
+INDEX_TYPES = ('auto', 'flat', 'hnsw')
+HNSW_MIN_PATTERNS = 10_000  # 'auto' switches to HNSW at this size
+HNSW_M = 32                 # Graph neighbors per node
+HNSW_EF_CONSTRUCTION = 200  # Build-time search depth
+HNSW_EF_SEARCH = 64         # Minimum query-time search depth
+
+# EnhancedGUKS persists the index after this many incremental adds
+# (unsaved patterns are re-added from patterns.json on the next start)
+INDEX_SAVE_INTERVAL = 10
+
+
+def _pattern_text(pattern: Dict) -> str:
+    """Text embedded for a pattern: error, fix, context and file combined"""
+    # Combine error, fix, and context for rich semantic matching
+    text_parts = [
+        pattern.get('error', ''),
+        pattern.get('fix', ''),
+        pattern.get('context', {}).get('description', ''),
+        pattern.get('file', ''),  # File type helps with similarity
+    ]
+    return ' '.join(filter(None, text_parts))
+
+
 class GUKSEmbeddingEngine:
     """
     Semantic search for GUKS patterns using embeddings
 
     Architecture:
       - Sentence transformer: all-MiniLM-L6-v2 (384-dim, fast)
-      - Vector index: FAISS (approximate nearest neighbors)
+      - Vector index: FAISS flat (exact) or HNSW (approximate nearest neighbors)
       - Similarity metric: Cosine similarity (via inner product)
 
     Performance:
@@ -38,7 +66,8 @@ class GUKSEmbeddingEngine:
     def __init__(
         self,
         model_name: str = "all-MiniLM-L6-v2",
-        cache_dir: Optional[str] = None
+        cache_dir: Optional[str] = None,
+        index_type: str = "auto"
     ):
         """
         Initialize embedding engine
@@ -46,8 +75,16 @@ class GUKSEmbeddingEngine:
         Args:
             model_name: SentenceTransformer model (default: all-MiniLM-L6-v2)
             cache_dir: Directory to cache index (default: ~/.grokflow/guks/embeddings)
+            index_type: 'flat' (exact), 'hnsw' (approximate), or 'auto'
+                (flat below HNSW_MIN_PATTERNS patterns, HNSW above)
         """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(
+                f"Unknown index_type '{index_type}' (expected one of {', '.join(INDEX_TYPES)})"
+            )
+
         self.model_name = model_name
+        self.index_type = index_type
         self.model = SentenceTransformer(model_name)
 
         self.cache_dir = Path(cache_dir or "~/.grokflow/guks/embeddings").expanduser()
@@ -57,6 +94,15 @@ class GUKSEmbeddingEngine:
         self.patterns: List[Dict] = []
         self.dimension = 384  # all-MiniLM-L6-v2 dimension
 
+        # Guards index/patterns: adds may run in a background task while
+        # searches are served
+        self._lock = threading.Lock()
+
+        # Embeddings keyed by model + text hash, so restarts and rebuilds
+        # only encode patterns that changed (loaded on first use)
+        self.embedding_cache_path = self.cache_dir / "emb_cache.npz"
+        self._embedding_cache: Optional[Dict[str, np.ndarray]] = None
+
     def build_index(self, guks_patterns: List[Dict]) -> None:
         """
         Build FAISS index from GUKS knowledge base
@@ -78,41 +124,152 @@ class GUKSEmbeddingEngine:
             return
 
         # Extract text for embedding
-        texts = []
-        for p in guks_patterns:
-            # Combine error, fix, and context for rich semantic matching
-            text_parts = [
-                p.get('error', ''),
-                p.get('fix', ''),
-                p.get('context', {}).get('description', ''),
-                p.get('file', ''),  # File type helps with similarity
-            ]
-            text = ' '.join(filter(None, text_parts))
-            texts.append(text)
-
-        # Generate embeddings
-        print(f"Generating embeddings for {len(texts)} patterns...")
-        embeddings = self.model.encode(
-            texts,
-            show_progress_bar=len(texts) > 100,
-            batch_size=32
-        )
+        texts = [_pattern_text(p) for p in guks_patterns]
+
+        # Generate embeddings (only for texts not already cached)
+        embeddings, keys = self._encode(texts)
+
+        # Keep the cache to the indexed patterns so it doesn't grow forever
+        cache = self._load_embedding_cache()
+        self._embedding_cache = {key: cache[key] for key in keys}
+        self._save_embedding_cache()
 
         # Build FAISS index
         print("Building FAISS index...")
-        self.index = faiss.IndexFlatIP(self.dimension)  # Inner product (cosine sim)
-
-        # Normalize embeddings for cosine similarity
-        faiss.normalize_L2(embeddings)
+        index = self._create_index(len(texts))
 
         # Add to index
-        self.index.add(embeddings.astype('float32'))
+        index.add(embeddings)
 
-        # Store patterns for retrieval
-        self.patterns = guks_patterns
+        # Store patterns for retrieval (own copy, so callers appending to
+        # their list don't shift result positions)
+        with self._lock:
+            self.index = index
+            self.patterns = list(guks_patterns)
 
         print(f"✅ Index built: {len(self.patterns)} patterns indexed")
 
+    def add_patterns(self, new_patterns: List[Dict]) -> None:
+        """
+        Add patterns to the index without re-encoding existing ones
+
+        Args:
+            new_patterns: Patterns to append (same shape as build_index)
+        """
+        if not new_patterns:
+            return
+
+        # Encode outside the lock; this is the expensive part
+        embeddings, _ = self._encode([_pattern_text(p) for p in new_patterns])
+
+        with self._lock:
+            if self.index is None:
+                self.index = self._create_index(len(new_patterns))
+            self.index.add(embeddings)
+            self.patterns.extend(new_patterns)
+
+    def add_pattern(self, pattern: Dict) -> None:
+        """
+        Add a single pattern to the index
+
+        Args:
+            pattern: Pattern with 'error', 'fix', 'context'
+        """
+        self.add_patterns([pattern])
+
+    def _encode(self, texts: List[str]) -> Tuple[np.ndarray, List[str]]:
+        """
+        Embed texts, encoding only those missing from the embedding cache
+
+        Args:
+            texts: Pattern texts to embed
+
+        Returns:
+            Tuple of (L2-normalized float32 embeddings, cache keys)
+        """
+        cache = self._load_embedding_cache()
+        keys = [
+            hashlib.sha256(f"{self.model_name}\0{text}".encode('utf-8')).hexdigest()
+            for text in texts
+        ]
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in cache}
+        if missing:
+            print(
+                f"Generating embeddings for {len(missing)} patterns "
+                f"({len(texts) - len(missing)} cached)..."
+            )
+            encoded = np.asarray(
+                self.model.encode(
+                    list(missing.values()),
+                    show_progress_bar=len(missing) > 100,
+                    batch_size=32
+                ),
+                dtype='float32'
+            )
+
+            # Normalize embeddings for cosine similarity
+            faiss.normalize_L2(encoded)
+            cache.update(zip(missing, encoded))
+
+        embeddings = np.empty((len(texts), self.dimension), dtype='float32')
+        for i, key in enumerate(keys):
+            embeddings[i] = cache[key]
+        return embeddings, keys
+
+    def _load_embedding_cache(self) -> Dict[str, np.ndarray]:
+        """Load cached embeddings from disk (empty if missing or unreadable)"""
+        if self._embedding_cache is None:
+            self._embedding_cache = {}
+            if self.embedding_cache_path.exists():
+                try:
+                    with np.load(self.embedding_cache_path) as data:
+                        keys, vectors = data['keys'], data['vectors']
+                    if vectors.ndim == 2 and vectors.shape[1] == self.dimension:
+                        self._embedding_cache = dict(zip(keys.tolist(), vectors))
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"Warning: Ignoring unreadable embedding cache: {e}")
+        return self._embedding_cache
+
+    def _save_embedding_cache(self) -> None:
+        """Write cached embeddings to disk (atomically replaces the file)"""
+        entries = list((self._embedding_cache or {}).items())
+        if not entries:
+            return
+
+        keys = np.array([key for key, _ in entries])
+        vectors = np.stack([vector for _, vector in entries])
+
+        tmp_path = self.embedding_cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, keys=keys, vectors=vectors)
+            os.replace(tmp_path, self.embedding_cache_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _create_index(self, num_patterns: int) -> faiss.Index:
+        """
+        Create an empty inner-product (cosine similarity) index
+
+        Args:
+            num_patterns: Number of patterns about to be indexed
+
+        Returns:
+            IndexFlatIP or IndexHNSWFlat, depending on index_type
+        """
+        use_hnsw = (
+            self.index_type == 'hnsw'
+            or (self.index_type == 'auto' and num_patterns >= HNSW_MIN_PATTERNS)
+        )
+        if not use_hnsw:
+            return faiss.IndexFlatIP(self.dimension)
+
+        index = faiss.IndexHNSWFlat(self.dimension, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        return index
+
     def search(
         self,
         query: str,
@@ -150,17 +307,24 @@ class GUKSEmbeddingEngine:
         query_embedding = self.model.encode([query])
         faiss.normalize_L2(query_embedding)
 
-        # Search
-        scores, indices = self.index.search(
-            query_embedding.astype('float32'),
-            min(top_k, len(self.patterns))
-        )
+        with self._lock:
+            # Search (HNSW needs a search depth of at least top_k)
+            if isinstance(self.index, faiss.IndexHNSW):
+                self.index.hnsw.efSearch = max(top_k * 4, HNSW_EF_SEARCH)
+
+            scores, indices = self.index.search(
+                query_embedding.astype('float32'),
+                min(top_k, len(self.patterns))
+            )
+            patterns = self.patterns
 
         # Build results
         results = []
         for score, idx in zip(scores[0], indices[0]):
+            if idx < 0:
+                break  # Fewer neighbors found than requested
             if score >= min_similarity:
-                pattern = self.patterns[idx].copy()
+                pattern = patterns[idx].copy()
                 pattern['similarity'] = float(score)
                 results.append(pattern)
 
@@ -180,19 +344,23 @@ class GUKSEmbeddingEngine:
         index_dir = self.cache_dir / name
         index_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save FAISS index
-        index_path = index_dir / "index.faiss"
-        faiss.write_index(self.index, str(index_path))
+        # Save FAISS index and patterns as one consistent snapshot
+        with self._lock:
+            index_path = index_dir / "index.faiss"
+            faiss.write_index(self.index, str(index_path))
 
-        # Save patterns
-        patterns_path = index_dir / "patterns.pkl"
-        with open(patterns_path, 'wb') as f:
-            pickle.dump(self.patterns, f)
+            patterns_path = index_dir / "patterns.pkl"
+            with open(patterns_path, 'wb') as f:
+                pickle.dump(self.patterns, f)
+            num_patterns = len(self.patterns)
+
+            # Embeddings of incrementally added patterns
+            self._save_embedding_cache()
 
         # Save metadata
         metadata = {
             'model_name': self.model_name,
-            'num_patterns': len(self.patterns),
+            'num_patterns': num_patterns,
             'dimension': self.dimension,
             'created_at': datetime.now().isoformat()
         }
@@ -245,7 +413,7 @@ class GUKSEmbeddingEngine:
             'num_patterns': len(self.patterns),
             'dimension': self.dimension,
             'model': self.model_name,
-            'index_type': 'FAISS IndexFlatIP (cosine similarity)'
+            'index_type': f'FAISS {type(self.index).__name__} (cosine similarity)'
         }
 
 
@@ -278,6 +446,10 @@ class EnhancedGUKS:
         # Initialize embedding engine
         self.embedding_engine = GUKSEmbeddingEngine()
 
+        # Serializes record_fix (may run as concurrent background tasks)
+        self._record_lock = threading.Lock()
+        self._unsaved_adds = 0
+
         # Load existing GUKS patterns
         self.patterns = self.load_patterns()
 
@@ -288,9 +460,29 @@ class EnhancedGUKS:
                 # Build new index
                 self.embedding_engine.build_index(self.patterns)
                 self.embedding_engine.save_index()
+            else:
+                self._sync_index()
         else:
             print("No GUKS patterns found. Index will be built when patterns are added.")
 
+    def _sync_index(self) -> None:
+        """
+        Bring a cached index up to date with patterns.json
+
+        Patterns recorded after the last index save are appended to the
+        file but not to the cached index; add those. Anything else that
+        doesn't line up gets a full rebuild.
+        """
+        indexed = len(self.embedding_engine.patterns)
+        if indexed == len(self.patterns):
+            return
+
+        if indexed < len(self.patterns):
+            self.embedding_engine.add_patterns(self.patterns[indexed:])
+        else:
+            self.embedding_engine.build_index(self.patterns)
+        self.embedding_engine.save_index()
+
     def load_patterns(self) -> List[Dict]:
         """
         Load GUKS patterns from storage
@@ -475,17 +667,22 @@ class EnhancedGUKS:
         # Add timestamp
         pattern['timestamp'] = datetime.now().isoformat()
 
-        # Add to patterns
-        self.patterns.append(pattern)
+        with self._record_lock:
+            # Add to patterns
+            self.patterns.append(pattern)
 
-        # Save to disk
-        patterns_file = self.data_dir / "patterns.json"
-        with open(patterns_file, 'w') as f:
-            json.dump(self.patterns, f, indent=2)
+            # Save to disk
+            patterns_file = self.data_dir / "patterns.json"
+            with open(patterns_file, 'w') as f:
+                json.dump(self.patterns, f, indent=2)
 
-        # Rebuild index (incremental update in future)
-        self.embedding_engine.build_index(self.patterns)
-        self.embedding_engine.save_index()
+            # Embed just the new pattern; the index file is only rewritten
+            # every INDEX_SAVE_INTERVAL adds (_sync_index covers the gap)
+            self.embedding_engine.add_pattern(pattern)
+            self._unsaved_adds += 1
+            if self._unsaved_adds >= INDEX_SAVE_INTERVAL:
+                self.embedding_engine.save_index()
+                self._unsaved_adds = 0
 
         print(f"✅ Pattern recorded and index updated")
 
@@ -132,12 +132,38 @@ class PatternAlertManager:
         self.on_alert = on_alert
 
         self.alerts: Dict[str, PatternAlert] = {}
+        self._storage_version: Optional[tuple] = None
         self._load_alerts()
 
         logger.info("PatternAlertManager initialized")
 
+    def _stat_storage(self) -> Optional[tuple]:
+        """Get (mtime_ns, size) of the storage file, or None if missing"""
+        try:
+            stat = self.storage_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def refresh(self) -> bool:
+        """
+        Reload alerts if the storage file changed since it was last read or written
+
+        A long-lived manager (e.g. in the daemon) calls this before use so
+        it sees, and does not overwrite, changes made by other processes.
+
+        Returns:
+            True if alerts were reloaded
+        """
+        if self._stat_storage() == self._storage_version:
+            return False
+        self.alerts = {}
+        self._load_alerts()
+        return True
+
     def _load_alerts(self) -> None:
         """Load alerts from storage"""
+        self._storage_version = self._stat_storage()
         if self.storage_path.exists():
             try:
                 with open(self.storage_path, 'r') as f:
@@ -158,6 +184,7 @@ class PatternAlertManager:
                 json.dump({
                     'alerts': [a.to_dict() for a in self.alerts.values()]
                 }, f, indent=2)
+            self._storage_version = self._stat_storage()
             logger.debug(f"Saved {len(self.alerts)} alerts")
         except Exception as e:
             logger.error(f"Failed to save alerts: {e}")
@@ -7,11 +7,13 @@ Intelligent rate limiting for:
 - Cost tracking
 - Usage statistics
 - Persistent state
+- Adaptive per-model throttling (token buckets with AIMD backoff)
 
 Prevents abuse and tracks resource usage across sessions.
 """
 
 import json
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Optional, List
@@ -107,6 +109,9 @@ class RateLimiter:
         # In-memory usage records
         self.usage_records: Dict[str, List[UsageRecord]] = defaultdict(list)
         
+        # check_and_record() may be called from concurrent API requests
+        self._lock = threading.Lock()
+        
         # Load persistent state
         self._load_state()
         
@@ -129,43 +134,44 @@ class RateLimiter:
         Raises:
             RateLimitError: If rate limit exceeded
         """
-        # Check all limits for this operation
-        limits = self.DEFAULT_LIMITS.get(operation, [])
-        
-        for limit in limits:
-            if not self._check_limit(operation, limit):
-                # Calculate wait time
-                wait_seconds = self._calculate_wait_time(operation, limit)
+        with self._lock:
+            # Check all limits for this operation
+            limits = self.DEFAULT_LIMITS.get(operation, [])
+            
+            for limit in limits:
+                if not self._check_limit(operation, limit):
+                    # Calculate wait time
+                    wait_seconds = self._calculate_wait_time(operation, limit)
                 
-                logger.warning(
-                    f"Rate limit exceeded for {operation}: {limit}. "
-                    f"Wait {wait_seconds:.0f}s"
-                )
+                    logger.warning(
+                        f"Rate limit exceeded for {operation}: {limit}. "
+                        f"Wait {wait_seconds:.0f}s"
+                    )
                 
-                raise RateLimitError(
-                    f"Rate limit exceeded for {operation}: {limit}. "
-                    f"Please wait {self._format_wait_time(wait_seconds)}."
-                )
-        
-        # Record usage
-        if cost is None:
-            cost = self.OPERATION_COSTS.get(operation, 0.0)
-        
-        record = UsageRecord(
-            timestamp=time.time(),
-            operation=operation,
-            cost=cost,
-            metadata=metadata
-        )
-        
-        self.usage_records[operation].append(record)
-        logger.debug(f"Recorded usage: {operation} (cost: ${cost:.4f})")
-        
-        # Cleanup old records
-        self._cleanup_old_records()
-        
-        # Save state
-        self._save_state()
+                    raise RateLimitError(
+                        f"Rate limit exceeded for {operation}: {limit}. "
+                        f"Please wait {self._format_wait_time(wait_seconds)}."
+                    )
+            
+            # Record usage
+            if cost is None:
+                cost = self.OPERATION_COSTS.get(operation, 0.0)
+            
+            record = UsageRecord(
+                timestamp=time.time(),
+                operation=operation,
+                cost=cost,
+                metadata=metadata
+            )
+            
+            self.usage_records[operation].append(record)
+            logger.debug(f"Recorded usage: {operation} (cost: ${cost:.4f})")
+            
+            # Cleanup old records
+            self._cleanup_old_records()
+            
+            # Save state
+            self._save_state()
     
     def _check_limit(self, operation: str, limit: RateLimit) -> bool:
         """
@@ -489,6 +495,7 @@ class RateLimiter:
 
 # Global rate limiter instance
 _global_limiter: Optional[RateLimiter] = None
+_global_limiter_lock = threading.Lock()
 
 
 def get_rate_limiter(state_file: Optional[Path] = None) -> RateLimiter:
@@ -504,8 +511,186 @@ def get_rate_limiter(state_file: Optional[Path] = None) -> RateLimiter:
     global _global_limiter
     
     if _global_limiter is None:
-        if state_file is None:
-            state_file = Path.home() / '.grokflow' / 'rate_limits.json'
-        _global_limiter = RateLimiter(state_file)
+        with _global_limiter_lock:
+            if _global_limiter is None:
+                if state_file is None:
+                    state_file = Path.home() / '.grokflow' / 'rate_limits.json'
+                _global_limiter = RateLimiter(state_file)
     
     return _global_limiter
+
+
+# ==============================================================================
+# Adaptive API Throttling
+# ==============================================================================
+
+# Per-model ceilings; the AIMD controller backs off below them on 429s
+DEFAULT_API_RPM = 480
+DEFAULT_API_TPM = 2_000_000
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+    
+    Refills at `rate` tokens per second up to `capacity`; acquire() blocks
+    until enough tokens are available.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize token bucket (starts full)
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens, waiting for the bucket to refill if needed
+        
+        Args:
+            tokens: Tokens to take (capped at capacity)
+            timeout: Maximum seconds to wait (None = wait as long as needed)
+            
+        Returns:
+            True if acquired, False if it would take longer than `timeout`
+        """
+        tokens = min(tokens, self.capacity)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+    
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate (tokens accrued so far keep the old rate)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+    
+    def drain(self) -> None:
+        """Empty the bucket (the next request waits for a refill)"""
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+
+
+class AIMDLimiter:
+    """
+    Request (RPM) and token (TPM) buckets for one model, with AIMD control
+    
+    The request rate is halved (and the burst drained) on every 429 and
+    grows back by `increase` RPM per second since the last adjustment,
+    applied on each successful call, up to the ceiling. Recovery thus
+    depends on elapsed time, not on how many calls the throttle let
+    through (which is few right after a backoff).
+    Keeps bursty batch traffic just under the provider limit instead of
+    bouncing off it.
+    
+    Example:
+        >>> limiter = AIMDLimiter(rpm=60, tpm=100_000)
+        >>> limiter.acquire(estimated_tokens=1200)
+        >>> limiter.on_success()
+    """
+    
+    def __init__(
+        self,
+        rpm: float = DEFAULT_API_RPM,
+        tpm: float = DEFAULT_API_TPM,
+        min_rpm: float = 1.0,
+        increase: float = 1.0
+    ):
+        """
+        Initialize limiter
+        
+        Args:
+            rpm: Requests per minute ceiling
+            tpm: Tokens per minute ceiling
+            min_rpm: Floor for the request rate after backoffs
+            increase: RPM added back per second of recovery
+        """
+        self.max_rpm = rpm
+        self.rpm = rpm
+        self.min_rpm = min_rpm
+        self.increase = increase
+        self._adjusted = time.monotonic()
+        
+        # Bursts of up to 10 seconds' worth
+        self.requests = TokenBucket(rpm / 60, max(1.0, rpm / 6))
+        self.tokens = TokenBucket(tpm / 60, max(1.0, tpm / 6))
+        self._lock = threading.Lock()
+    
+    def acquire(self, estimated_tokens: float = 0, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for room for one request of `estimated_tokens`
+        
+        Args:
+            estimated_tokens: Prompt + completion token estimate
+            timeout: Maximum seconds to wait per bucket (None = no limit)
+            
+        Returns:
+            True if the request may proceed
+        """
+        if not self.requests.acquire(1, timeout):
+            return False
+        return estimated_tokens <= 0 or self.tokens.acquire(estimated_tokens, timeout)
+    
+    def on_success(self) -> None:
+        """Additive increase (by time since the last adjustment) after a successful call"""
+        with self._lock:
+            now = time.monotonic()
+            if self.rpm < self.max_rpm:
+                elapsed = now - self._adjusted
+                self.rpm = min(self.max_rpm, self.rpm + self.increase * elapsed)
+                self.requests.set_rate(self.rpm / 60)
+            self._adjusted = now
+    
+    def on_rate_limited(self) -> None:
+        """Multiplicative decrease after a 429"""
+        with self._lock:
+            self.rpm = max(self.min_rpm, self.rpm / 2)
+            self.requests.set_rate(self.rpm / 60)
+            self._adjusted = time.monotonic()
+        self.requests.drain()
+        logger.warning(f"API rate limited, throttling to {self.rpm:.0f} RPM")
+
+
+_api_throttles: Dict[str, AIMDLimiter] = {}
+_api_throttles_lock = threading.Lock()
+
+
+def get_api_throttle(model: str) -> AIMDLimiter:
+    """
+    Get the process-wide throttle for a model
+    
+    Args:
+        model: Model name
+        
+    Returns:
+        AIMDLimiter shared by every client calling `model`
+    """
+    throttle = _api_throttles.get(model)
+    if throttle is None:
+        with _api_throttles_lock:
+            throttle = _api_throttles.setdefault(model, AIMDLimiter())
+    return throttle
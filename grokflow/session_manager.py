@@ -17,7 +17,7 @@ import shutil
 import fcntl
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from datetime import datetime
 from contextlib import contextmanager
 
@@ -362,32 +362,25 @@ class SessionManager:
 
         return info
 
-    def export_session(
+    def _build_export_data(
         self,
-        export_path: Path,
-        include_conversation: bool = True,
-        include_context: bool = True,
-        include_metadata: bool = True
+        session: Dict,
+        include_conversation: bool,
+        include_context: bool,
+        include_metadata: bool
     ) -> Dict:
         """
-        Export session to a portable format for sharing
+        Build the export document for a loaded session
 
         Args:
-            export_path: Path to export file
+            session: Session dictionary
             include_conversation: Include conversation history
             include_context: Include context file paths
             include_metadata: Include session metadata
 
         Returns:
-            Dictionary with export info
-
-        Example:
-            >>> manager.export_session(Path("~/shared_session.json"))
-            {'exported_at': '2024-01-01T00:00:00', 'items_exported': 5}
+            Export dictionary (conversation list is shared, not copied)
         """
-        # Load session first (this acquires its own lock)
-        session = self.load()
-
         export_data = {
             'export_version': '1.0',
             'exported_at': datetime.now().isoformat(),
@@ -424,12 +417,49 @@ class SessionManager:
                 'image_analyses_count': len(session.get('image_analyses', []))
             }
 
+        return export_data
+
+    def export_session(
+        self,
+        export_path: Path,
+        include_conversation: bool = True,
+        include_context: bool = True,
+        include_metadata: bool = True,
+        dumps: Optional[Callable[[Any], bytes]] = None
+    ) -> Dict:
+        """
+        Export session to a portable format for sharing
+
+        Args:
+            export_path: Path to export file
+            include_conversation: Include conversation history
+            include_context: Include context file paths
+            include_metadata: Include session metadata
+            dumps: Serializer returning UTF-8 JSON bytes (default: stdlib
+                json, indent=2)
+
+        Returns:
+            Dictionary with export info
+
+        Example:
+            >>> manager.export_session(Path("~/shared_session.json"))
+            {'exported_at': '2024-01-01T00:00:00', 'items_exported': 5}
+        """
+        # Load session first (this acquires its own lock)
+        session = self.load()
+        export_data = self._build_export_data(
+            session, include_conversation, include_context, include_metadata
+        )
+
         # Write export file
         export_path = Path(export_path).expanduser().resolve()
         export_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(export_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        if dumps is None:
+            data = json.dumps(export_data, indent=2, ensure_ascii=False).encode('utf-8')
+        else:
+            data = dumps(export_data)
+        export_path.write_bytes(data)
 
         logger.info(f"Session exported to {export_path}")
 
@@ -442,11 +472,82 @@ class SessionManager:
             }
         }
 
+    def export_session_stream(
+        self,
+        export_path: Path,
+        include_conversation: bool = True,
+        include_context: bool = True,
+        include_metadata: bool = True,
+        dumps: Optional[Callable[[Any], bytes]] = None
+    ) -> Dict:
+        """
+        Export session, writing the conversation one item at a time
+
+        Produces the same document as export_session(). The session is
+        still loaded whole (through load(), for validation and backup
+        recovery); what is saved is the serialized copy: each top-level
+        field and each conversation item is serialized and written
+        separately, one item per line, so peak memory is the loaded
+        session plus one item rather than the session plus the whole
+        JSON text.
+
+        Args:
+            export_path: Path to export file
+            include_conversation: Include conversation history
+            include_context: Include context file paths
+            include_metadata: Include session metadata
+            dumps: Compact serializer returning UTF-8 JSON bytes (default:
+                stdlib json)
+
+        Returns:
+            Dictionary with export info (same shape as export_session())
+        """
+        if dumps is None:
+            def dumps(obj: Any) -> bytes:
+                return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+        # Load session first (this acquires its own lock)
+        session = self.load()
+        export_data = self._build_export_data(
+            session, include_conversation, include_context, include_metadata
+        )
+
+        export_path = Path(export_path).expanduser().resolve()
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(export_path, 'wb') as f:
+            f.write(b'{')
+            for n, (key, value) in enumerate(export_data.items()):
+                f.write(b'\n  ' if n == 0 else b',\n  ')
+                f.write(dumps(key))
+                f.write(b': ')
+                if key == 'conversation':
+                    f.write(b'[')
+                    for i, item in enumerate(value):
+                        f.write(b'\n    ' if i == 0 else b',\n    ')
+                        f.write(dumps(item))
+                    f.write(b'\n  ]' if value else b']')
+                else:
+                    f.write(dumps(value))
+            f.write(b'\n}\n')
+
+        logger.info(f"Session exported (streamed) to {export_path}")
+
+        return {
+            'exported_at': export_data['exported_at'],
+            'export_path': str(export_path),
+            'items_exported': {
+                'conversation': len(export_data.get('conversation', [])),
+                'context_files': len(export_data.get('context_files', []))
+            }
+        }
+
     def import_session(
         self,
         import_path: Path,
         merge: bool = False,
-        workspace_override: Optional[Path] = None
+        workspace_override: Optional[Path] = None,
+        loads: Optional[Callable[[bytes], Any]] = None
     ) -> Dict:
         """
         Import session from an exported file
@@ -455,6 +556,7 @@ class SessionManager:
             import_path: Path to import file
             merge: If True, merge with current session; if False, replace
             workspace_override: Override workspace path for imported session
+            loads: Deserializer taking raw JSON bytes (default: json.loads)
 
         Returns:
             Dictionary with import info
@@ -472,9 +574,9 @@ class SessionManager:
             raise SessionCorruptedError(f"Import file not found: {import_path}")
 
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
-        except json.JSONDecodeError as e:
+            import_data = (loads or json.loads)(import_path.read_bytes())
+        except ValueError as e:
+            # json/orjson decode errors and bad UTF-8 are all ValueErrors
             raise SessionCorruptedError(f"Invalid import file format: {e}") from e
 
         # Validate export version
@@ -61,6 +61,9 @@ from grokflow.undo_manager import get_undo_manager, FileWriteCommand
 console = Console()
 logger = None  # Will be initialized in main()
 
+# Bytes that count as text when sniffing for binary files
+_TEXT_CHARS = bytes(sorted({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f}))
+
 
 class WorkspaceContext:
     """Smart workspace context manager"""
@@ -298,9 +301,9 @@ class GrokFlowV2:
                 # Check for null bytes (common in binary files)
                 if b'\x00' in chunk:
                     return True
-                # Check if mostly non-text characters
-                text_chars = bytearray({7,8,9,10,12,13,27} | set(range(0x20, 0x100)) - {0x7f})
-                non_text = sum(1 for byte in chunk if byte not in text_chars)
+                # Check if mostly non-text characters (translate() deletes
+                # the text bytes in C, leaving only the non-text ones)
+                non_text = len(chunk.translate(None, _TEXT_CHARS))
                 return non_text / len(chunk) > 0.3 if chunk else False
         except PermissionError as e:
             logger.warning(f"Permission denied reading {file_path}: {e}")
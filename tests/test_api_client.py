@@ -0,0 +1,44 @@
+"""Tests for the x.ai API client"""
+
+import pytest
+
+from grokflow.api_client import GrokAPIClient
+
+
+@pytest.fixture
+def client():
+    """Client with a dummy key (no requests are made)"""
+    return GrokAPIClient(api_key='test-key', enable_rate_limiting=False)
+
+
+class TestBudgetMaxTokens:
+    """Tests for capping max_tokens to the context window"""
+
+    def test_lowered_to_fit_window(self, client):
+        """Should lower max_tokens to what the window has left"""
+        window = client.CONTEXT_WINDOWS['grok-3']
+        input_tokens = window - client.CONTEXT_SAFETY_TOKENS - 500
+
+        assert client._budget_max_tokens('grok-3', input_tokens, 4000) == 500
+
+    def test_unchanged_when_it_fits(self, client):
+        """Should keep max_tokens when prompt + completion fit"""
+        assert client._budget_max_tokens('grok-3', 1000, 4000) == 4000
+
+    def test_unknown_model(self, client):
+        """Should keep max_tokens for a model without a known window"""
+        assert client._budget_max_tokens('other-model', 10**9, 4000) == 4000
+
+    def test_prompt_too_large(self, client):
+        """Should keep max_tokens (and let the API reject) when the prompt alone overflows"""
+        window = client.CONTEXT_WINDOWS['grok-3']
+        assert client._budget_max_tokens('grok-3', window, 4000) == 4000
+
+
+class TestEstimateTokens:
+    """Tests for the prompt size estimate"""
+
+    def test_four_characters_per_token(self):
+        """Should count about one token per four characters of content"""
+        messages = [{'role': 'system', 'content': 'x' * 40}, {'role': 'user', 'content': 'y' * 8}]
+        assert GrokAPIClient._estimate_tokens(messages) == 12
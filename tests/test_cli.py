@@ -0,0 +1,174 @@
+"""Tests for GrokFlow CLI utilities"""
+
+import io
+import sys
+import pytest
+
+from grokflow.cli import CLI, get_cli
+
+
+def _stdout(line_buffering=False, write_through=False):
+    """Text stream over a BytesIO, like sys.stdout on a pipe or terminal"""
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(
+        raw, encoding='utf-8', line_buffering=line_buffering,
+        write_through=write_through
+    )
+    return stream, raw
+
+
+@pytest.fixture
+def cli():
+    """Plain CLI (stdout is not a terminal under pytest)"""
+    return CLI(use_colors=False)
+
+
+class TestWrite:
+    """Tests for '<icon> <message>' line output"""
+
+    @pytest.mark.parametrize('line_buffering,write_through', [
+        (False, False), (True, False), (False, True)
+    ])
+    def test_keeps_order_with_print(self, cli, monkeypatch, line_buffering, write_through):
+        """Should interleave correctly with print() output"""
+        stream, raw = _stdout(line_buffering, write_through)
+        monkeypatch.setattr(sys, 'stdout', stream)
+
+        print("first", end='')
+        cli.success("done")
+        print("last")
+        cli.bullet("item", indent=1)
+        stream.flush()
+
+        assert raw.getvalue().decode('utf-8') == "first✓ done\nlast\n  • item\n"
+
+    def test_does_not_reconfigure_stdout(self, cli, monkeypatch):
+        """Should leave the caller's stream settings alone"""
+        stream, _ = _stdout(line_buffering=True)
+        monkeypatch.setattr(sys, 'stdout', stream)
+
+        cli.info("hello")
+
+        assert stream.write_through is False
+        assert stream.line_buffering is True
+
+    def test_text_only_stream(self, cli, monkeypatch):
+        """Should fall back to text writes without a binary buffer"""
+        stream = io.StringIO()
+        monkeypatch.setattr(sys, 'stdout', stream)
+
+        cli.warning("careful")
+        cli.arrow("next")
+
+        assert stream.getvalue() == "⚠ careful\n→ next\n"
+
+    def test_rebinds_when_stdout_changes(self, cli, monkeypatch):
+        """Should write to whichever stream is sys.stdout now"""
+        first, second = io.StringIO(), io.StringIO()
+        monkeypatch.setattr(sys, 'stdout', first)
+        cli.info("one")
+        monkeypatch.setattr(sys, 'stdout', second)
+        cli.info("two")
+
+        assert first.getvalue() == "ℹ one\n"
+        assert second.getvalue() == "ℹ two\n"
+
+
+class TestFormatters:
+    """Tests for header/bullet/table formatting"""
+
+    def test_header(self, cli):
+        """Should underline the title with '='"""
+        assert cli.format_header("Title") == "\nTitle\n=====\n"
+
+    def test_subheader(self, cli):
+        """Should underline the title with '-'"""
+        assert cli.format_subheader("Sub") == "\nSub\n---\n"
+
+    def test_bullet(self, cli):
+        """Should indent two spaces per level"""
+        assert cli.format_bullet("item") == "• item\n"
+        assert cli.format_bullet("item", indent=2) == "    • item\n"
+
+    def test_colored(self):
+        """Should wrap headers in bold codes when colors are on"""
+        colored = CLI(use_colors=False)
+        colored.use_colors = True
+        assert colored.format_header("T") == "\n\033[1mT\033[0m\n=\n"
+
+    def test_table(self, cli):
+        """Should align columns to the widest cell"""
+        text = cli.format_table(['Name', 'N'], [['a', '1'], ['long', '22']])
+        lines = text.splitlines()
+
+        assert lines == ["Name | N ", "---------", "a    | 1 ", "long | 22"]
+        assert text.endswith("\n")
+
+    def test_table_short_rows(self, cli):
+        """Should pad rows with fewer cells than headers"""
+        text = cli.format_table(['A', 'B', 'C'], [['x'], ['y', 'z'], []])
+        assert text.splitlines()[2:] == ["x |   |  ", "y | z |  ", "  |   |  "]
+
+        # Same padding when the widths are passed in
+        text = cli.format_table(['A', 'B', 'C'], [['x']], col_widths=[1, 1, 1])
+        assert text.splitlines()[2] == "x |   |  "
+
+    def test_table_output(self, cli, capsys):
+        """Should print the formatted table"""
+        cli.table(['A'], [['x']])
+        assert capsys.readouterr().out == cli.format_table(['A'], [['x']])
+
+
+class TestErrorBatching:
+    """Tests for buffered error output"""
+
+    def test_batches_until_exit(self, cli, capsys):
+        """Should hold errors until the outermost block exits"""
+        with cli.error_batching():
+            cli.error("one")
+            with cli.error_batching():
+                cli.error("two")
+            assert capsys.readouterr().err == ""
+            cli.error_batch(["three", "four"])
+
+        assert capsys.readouterr().err == "✗ one\n✗ two\n✗ three\n✗ four\n"
+
+    def test_flushes_on_exception(self, cli, capsys):
+        """Should still write buffered errors when the block raises"""
+        with pytest.raises(RuntimeError):
+            with cli.error_batching():
+                cli.error("before")
+                raise RuntimeError
+
+        assert capsys.readouterr().err == "✗ before\n"
+
+    def test_unbatched(self, cli, capsys):
+        """Should write errors immediately outside a batch"""
+        cli.error("now")
+        cli.error_batch([])
+        assert capsys.readouterr().err == "✗ now\n"
+
+
+class TestGetCli:
+    """Tests for the shared CLI instance"""
+
+    def test_reused_for_same_stdout(self):
+        """Should return the same instance while stdout is unchanged"""
+        assert get_cli() is get_cli()
+
+    def test_rebuilt_for_new_stdout(self, monkeypatch):
+        """Should decide colors again when stdout is replaced"""
+        class Tty(io.StringIO):
+            def isatty(self):
+                return True
+
+        monkeypatch.delenv('NO_COLOR', raising=False)
+        monkeypatch.setattr(sys, 'stdout', Tty())
+        assert get_cli().use_colors is True
+
+        monkeypatch.setattr(sys, 'stdout', io.StringIO())
+        assert get_cli().use_colors is False
+
+        monkeypatch.setenv('NO_COLOR', '1')
+        monkeypatch.setattr(sys, 'stdout', Tty())
+        assert get_cli().use_colors is False
@@ -2,13 +2,22 @@
 
 import pytest
 import json
+import os
+import sys
 from pathlib import Path
-from grokflow.commands import GrokFlowCommands, create_parser, main
+from grokflow.commands import (
+    GrokFlowCommands, create_parser, load_parser, main, _sniff_subcommand,
+    _fast_path_args
+)
+import grokflow.commands as commands_module
+from grokflow import daemon
 from grokflow.undo_manager import (
     get_undo_manager, FileWriteCommand, UndoManager
 )
 from grokflow.session_manager import SessionManager
-from grokflow.pattern_alerts import PatternAlertManager, AlertSeverity
+from grokflow.pattern_alerts import (
+    PatternAlertManager, PatternAlert, AlertSeverity, AlertStatus
+)
 
 
 @pytest.fixture
@@ -236,6 +245,68 @@ class TestAlertCommands:
         result = commands.cmd_alerts_list()
         assert result == 0
 
+    def test_alerts_list_table(self, commands, temp_workspace, capsys):
+        """Should render alerts as an aligned table"""
+        manager = PatternAlertManager(
+            storage_path=temp_workspace / 'alerts.json'
+        )
+        for i, severity in enumerate([AlertSeverity.HIGH, AlertSeverity.INFO]):
+            alert = PatternAlert(
+                id=f"alert_{i}_0123456789",
+                pattern_type=f"pattern_{i}",
+                pattern_description="desc",
+                severity=severity,
+                status=AlertStatus.NEW,
+                frequency=10 + i,
+                affected_projects=['proj'],
+                recommended_action=None,
+                solution_available=False,
+                solution_success_rate=0.0
+            )
+            manager.alerts[alert.id] = alert
+        commands._alert_manager = manager
+
+        result = commands.cmd_alerts_list()
+        assert result == 0
+
+        lines = capsys.readouterr().out.splitlines()
+        header = next(line for line in lines if line.startswith('ID'))
+        rows = [line for line in lines if line.startswith('alert_')]
+        assert len(rows) == 2
+        assert 'HIGH' in rows[0] and 'pattern_0' in rows[0]
+        # Columns are aligned to the same widths as the header
+        assert all(len(row.rstrip()) <= len(header) for row in rows)
+        assert [row.index('new') for row in rows] == [header.index('Status')] * 2
+
+    def test_alert_manager_reloads_external_changes(self, temp_workspace):
+        """Should pick up alerts saved by another process before reuse"""
+        path = temp_workspace / 'alerts.json'
+        ours = PatternAlertManager(storage_path=path)
+        theirs = PatternAlertManager(storage_path=path)
+
+        alert = PatternAlert(
+            id="alert_external",
+            pattern_type="pattern",
+            pattern_description="desc",
+            severity=AlertSeverity.HIGH,
+            status=AlertStatus.NEW,
+            frequency=5,
+            affected_projects=['proj'],
+            recommended_action=None,
+            solution_available=False,
+            solution_success_rate=0.0
+        )
+        theirs.alerts[alert.id] = alert
+        theirs._save_alerts()
+
+        assert ours.refresh() is True
+        assert "alert_external" in ours.alerts
+        assert ours.refresh() is False
+
+        # Saving no longer drops the other process's alert
+        assert ours.dismiss_alert("alert_external")
+        assert "alert_external" in PatternAlertManager(storage_path=path).alerts
+
     def test_alerts_check(self, commands):
         """Should check for new alerts"""
         result = commands.cmd_alerts_check()
@@ -283,6 +354,55 @@ class TestSuggestTestsCommand:
         result = commands.cmd_suggest_tests(files=[str(src_file)])
         assert result == 0
 
+    def test_git_modified_files(self, commands, temp_workspace, monkeypatch):
+        """Should list modified non-test Python files from git"""
+        import subprocess
+
+        def git(*args):
+            subprocess.run(
+                ['git', '-c', 'user.name=t', '-c', 'user.email=t@t', *args],
+                cwd=temp_workspace, check=True, capture_output=True
+            )
+
+        git('init', '-q')
+        (temp_workspace / 'module.py').write_text("x = 1\n")
+        (temp_workspace / 'test_module.py').write_text("y = 1\n")
+        (temp_workspace / 'notes.txt').write_text("n\n")
+        (temp_workspace / 'tests').mkdir()
+        (temp_workspace / 'tests' / 'test_nested.py').write_text("z = 1\n")
+        (temp_workspace / 'test_pkg').mkdir()
+        (temp_workspace / 'test_pkg' / 'core.py').write_text("c = 1\n")
+        git('add', '.')
+        git('commit', '-q', '-m', 'init')
+
+        (temp_workspace / 'module.py').write_text("x = 2\n")
+        (temp_workspace / 'test_module.py').write_text("y = 2\n")
+        (temp_workspace / 'notes.txt').write_text("m\n")
+        (temp_workspace / 'tests' / 'test_nested.py').write_text("z = 2\n")
+        (temp_workspace / 'test_pkg' / 'core.py').write_text("c = 2\n")
+
+        # Test modules are excluded by basename, not by leading directory
+        expected = [
+            str(temp_workspace / 'module.py'),
+            str(temp_workspace / 'test_pkg' / 'core.py'),
+        ]
+        assert sorted(commands._get_git_modified_files()) == expected
+
+        # Same result through the `git diff` subprocess fallback
+        monkeypatch.setattr(
+            GrokFlowCommands, '_git_diff_names_pygit2', lambda self: None
+        )
+        assert sorted(commands._get_git_modified_files()) == expected
+
+    def test_test_suggester_reused_per_workspace(self, tmp_path):
+        """Should reuse the cached suggester only for the same workspace"""
+        first = GrokFlowCommands(workspace=tmp_path / 'a').test_suggester
+        again = GrokFlowCommands(workspace=tmp_path / 'a').test_suggester
+        other = GrokFlowCommands(workspace=tmp_path / 'b').test_suggester
+
+        assert again is first
+        assert other.workspace_path == tmp_path / 'b'
+
     def test_suggest_coverage(self, commands, temp_workspace):
         """Should show coverage map"""
         # Create source file
@@ -291,6 +411,32 @@ class TestSuggestTestsCommand:
         result = commands.cmd_suggest_coverage()
         assert result == 0
 
+    def test_suggest_coverage_relative_paths(self, commands, temp_workspace,
+                                             monkeypatch, capsys):
+        """Should list untested files relative to the workspace"""
+        untested = [temp_workspace / 'pkg' / 'module.py', Path('/elsewhere/x.py')]
+        monkeypatch.setattr(commands.test_suggester, 'find_untested_files',
+                            lambda: untested)
+
+        assert commands.cmd_suggest_coverage() == 0
+
+        out = capsys.readouterr().out
+        assert os.path.join('pkg', 'module.py') in out
+        assert str(temp_workspace) not in out
+        assert '/elsewhere/x.py' in out
+
+    def test_suggest_coverage_root_workspace(self, commands, monkeypatch, capsys):
+        """Should strip the prefix when the workspace is the filesystem root"""
+        root = Path(os.path.abspath(os.sep))
+        untested = [root / 'pkg' / 'module.py']
+        monkeypatch.setattr(commands.test_suggester, 'find_untested_files',
+                            lambda: untested)
+        monkeypatch.setattr(commands, 'workspace', root)
+
+        assert commands.cmd_suggest_coverage() == 0
+
+        assert f"• {os.path.join('pkg', 'module.py')}\n" in capsys.readouterr().out
+
 
 class TestArgumentParser:
     """Tests for argument parser"""
@@ -367,6 +513,52 @@ class TestArgumentParser:
         args = parser.parse_args(['suggest-tests', '--from-git'])
         assert args.from_git is True
 
+    def test_sniff_subcommand(self):
+        """Should find command and nested subcommand without parsing"""
+        assert _sniff_subcommand(['undo', '--batch', '2']) == ('undo', None)
+        assert _sniff_subcommand(
+            ['-w', 'session', 'session', 'export', 'out.json']
+        ) == ('session', 'export')
+        assert _sniff_subcommand(['--help']) == (None, None)
+        assert _sniff_subcommand(['unknown']) == (None, None)
+        assert _sniff_subcommand([]) == (None, None)
+
+    def test_fast_path_matches_argparse(self):
+        """Fast-path undo/redo parsing should agree with argparse"""
+        parser = create_parser()
+        for argv in (['undo'], ['redo'], ['undo', '--batch', '3'],
+                     ['redo', '-b', '2'], ['undo', '--all'], ['redo', '-a']):
+            assert _fast_path_args(argv) == parser.parse_args(argv)
+
+        assert _fast_path_args(['undo', '--batch', 'x']) is None
+        assert _fast_path_args(['-w', '.', 'undo']) is None
+        assert _fast_path_args(['history']) is None
+
+    def test_alert_choices_match_enums(self):
+        """Parser choices should mirror the alert enums"""
+        assert set(commands_module._STATUS_CHOICES) == {s.value for s in AlertStatus}
+        assert set(commands_module._SEVERITY_CHOICES) == {s.value for s in AlertSeverity}
+
+    def test_partial_parser(self):
+        """Should parse with only the requested subparser built"""
+        parser = create_parser('alerts', 'list')
+        args = parser.parse_args(['alerts', 'list', '--severity', 'high'])
+        assert args.alerts_command == 'list'
+        assert args.severity == 'high'
+
+        with pytest.raises(SystemExit):
+            parser.parse_args(['undo'])
+
+    def test_cached_parser_matches_fresh(self):
+        """Should reuse one parser per command and parse like a fresh one"""
+        argv = ['-w', 'ws', 'session', 'export', 'out.json', '--no-context']
+
+        cached = load_parser('session', 'export')
+        assert load_parser('session', 'export') is cached
+
+        fresh = create_parser('session', 'export')
+        assert vars(cached.parse_args(argv)) == vars(fresh.parse_args(argv))
+
 
 class TestMainFunction:
     """Tests for main entry point"""
@@ -381,3 +573,83 @@ class TestMainFunction:
         get_undo_manager(force_new=True)
         result = main(['history'])
         assert result == 0
+
+
+@pytest.mark.skipif(not daemon.DAEMON_SUPPORTED, reason="requires Unix sockets")
+class TestDaemon:
+    """Tests for daemon mode"""
+
+    def test_forward_roundtrip(self, tmp_path, capfd):
+        """Should run forwarded commands in the daemon and replay output"""
+        import threading
+
+        socket_path = tmp_path / 'daemon.sock'
+        server = daemon.DaemonServer(socket_path, main)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            get_undo_manager(force_new=True)
+            assert daemon.forward(socket_path, ['history'], str(tmp_path)) == 0
+            assert 'No history available' in capfd.readouterr().out
+
+            # argparse errors come back as exit code + stderr
+            assert daemon.forward(socket_path, ['undo', '--bogus'], str(tmp_path)) == 2
+            assert 'unrecognized arguments' in capfd.readouterr().err
+
+            assert daemon.stop(socket_path)
+            thread.join(timeout=5)
+        finally:
+            server.server_close()
+
+        assert not socket_path.exists()
+        assert daemon.forward(socket_path, ['history'], str(tmp_path)) is None
+
+    def test_forward_uses_client_env(self, tmp_path, capfd, monkeypatch):
+        """Should run forwarded commands with the client's env and tty state"""
+        import threading
+
+        def entry(argv):
+            print(os.environ.get('GROKFLOW_TEST_VAR'), sys.stdout.isatty())
+            return 0
+
+        socket_path = tmp_path / 'daemon.sock'
+        server = daemon.DaemonServer(socket_path, entry)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            # A raw request with an env unlike the daemon's own
+            monkeypatch.setenv('GROKFLOW_TEST_VAR', 'daemon')
+            with daemon._connect(socket_path) as sock:
+                daemon._send_message(sock, {
+                    'argv': [], 'cwd': str(tmp_path),
+                    'env': {'GROKFLOW_TEST_VAR': 'client'}, 'isatty': True,
+                })
+                reply = daemon._recv_message(sock)
+            assert reply['stdout'] == 'client True\n'
+            assert os.environ['GROKFLOW_TEST_VAR'] == 'daemon'
+
+            # forward() sends the calling process's environment
+            monkeypatch.setenv('GROKFLOW_TEST_VAR', 'forwarded')
+            capfd.readouterr()
+            assert daemon.forward(socket_path, [], str(tmp_path)) == 0
+            assert capfd.readouterr().out.startswith('forwarded ')
+
+            assert daemon.stop(socket_path)
+            thread.join(timeout=5)
+        finally:
+            server.server_close()
+
+    def test_find_daemon_socket(self, tmp_path, monkeypatch):
+        """Should only forward when a socket exists and not disabled"""
+        socket_path = tmp_path / 'daemon.sock'
+        monkeypatch.setattr(commands_module, '_DAEMON_SOCKET', socket_path)
+        monkeypatch.delenv('GROKFLOW_NO_DAEMON', raising=False)
+
+        assert commands_module._find_daemon_socket(['history']) is None
+
+        socket_path.touch()
+        assert commands_module._find_daemon_socket(['history']) == socket_path
+        assert commands_module._find_daemon_socket(['daemon', 'stop']) is None
+
+        monkeypatch.setenv('GROKFLOW_NO_DAEMON', '1')
+        assert commands_module._find_daemon_socket(['history']) is None
@@ -0,0 +1,363 @@
+"""
+Tests for context management
+"""
+
+import os
+import random
+import pytest
+from pathlib import Path
+
+from grokflow.context_manager import (
+    ContextManager, FileContext, WorkspaceContext, _BinaryCache, get_context_manager
+)
+from grokflow.exceptions import ContextError
+
+
+LARGE = ContextManager.POOLED_READ_BYTES
+
+
+def _write(path: Path, data: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+class TestBinaryClassification:
+    """Binary/text decisions on both sides of POOLED_READ_BYTES"""
+
+    @pytest.mark.parametrize('size', [100, LARGE + 100])
+    def test_text_unknown_extension(self, temp_dir, size):
+        """Test text with an unknown extension is read as text"""
+        data = (b'line of text\n' * (size // 13 + 1))[:size]
+        path = _write(temp_dir / 'notes.cfg', data)
+
+        ctx = ContextManager().build_file_context(path)
+
+        assert not ctx.is_binary
+        assert ctx.content == data.decode('utf-8')
+        assert ctx.size == size
+
+    @pytest.mark.parametrize('size', [100, LARGE + 100])
+    def test_binary_unknown_extension(self, temp_dir, size):
+        """Test NUL bytes in an unknown extension give the placeholder"""
+        data = b'\x00\x01\x02\x03' * (size // 4)
+        path = _write(temp_dir / 'blob.xyz', data)
+
+        ctx = ContextManager().build_file_context(path)
+
+        assert ctx.is_binary
+        assert ctx.content == '<binary file: blob.xyz>'
+
+    def test_large_binary_reads_only_sniff_window(self, temp_dir, monkeypatch):
+        """Test a large unknown-type binary is classified from the sniff window alone"""
+        data = b'\x00' * (LARGE * 4)
+        path = _write(temp_dir / 'blob.xyz', data)
+
+        import grokflow.context_manager as cm_module
+
+        def no_full_read(*args, **kwargs):
+            raise AssertionError("whole file read")
+
+        monkeypatch.setattr(cm_module, '_read_file_bytes', no_full_read)
+        monkeypatch.setattr(cm_module, '_readinto_file', no_full_read)
+        monkeypatch.setattr(ContextManager, '_read_and_classify', no_full_read)
+
+        sniffed = []
+        real_sniff = cm_module._sniff_binary
+
+        def counting_sniff(head, n=None):
+            sniffed.append(len(head))
+            return real_sniff(head, n)
+
+        monkeypatch.setattr(cm_module, '_sniff_binary', counting_sniff)
+
+        ctx = ContextManager().build_file_context(path)
+
+        assert ctx.is_binary
+        assert ctx.content == '<binary file: blob.xyz>'
+        assert sniffed == [ContextManager.SNIFF_BYTES]
+
+    @pytest.mark.parametrize('size', [100, LARGE + 100])
+    def test_known_text_extension(self, temp_dir, size):
+        """Test known text extensions are read without sniffing"""
+        data = (b'x = 1\r\n' * (size // 7 + 1))[:size]
+        path = _write(temp_dir / 'mod.py', data)
+
+        ctx = ContextManager().build_file_context(path)
+
+        assert not ctx.is_binary
+        assert ctx.content == data.decode('utf-8').replace('\r\n', '\n')
+
+    def test_known_binary_extension(self, temp_dir):
+        """Test known binary extensions are never decoded"""
+        path = _write(temp_dir / 'image.png', b'not really a png')
+
+        ctx = ContextManager().build_file_context(path)
+
+        assert ctx.is_binary
+        assert ctx.content == '<binary file: image.png>'
+
+    def test_is_binary_file(self, temp_dir):
+        """Test is_binary_file agrees with build_file_context"""
+        cm = ContextManager()
+        assert cm.is_binary_file(_write(temp_dir / 'a.xyz', b'\x00abc'))
+        assert not cm.is_binary_file(_write(temp_dir / 'b.xyz', b'abc'))
+        assert cm.is_binary_file(_write(temp_dir / 'c.pdf', b'abc'))
+        assert not cm.is_binary_file(_write(temp_dir / 'd.py', b'\x00'))
+
+    def test_too_large(self, temp_dir):
+        """Test files over max_file_size are rejected"""
+        path = _write(temp_dir / 'big.txt', b'a' * 2048)
+
+        with pytest.raises(ContextError, match='too large'):
+            ContextManager(max_file_size=1024).build_file_context(path)
+
+
+class TestEncodingFallback:
+    """Non-UTF-8 text files"""
+
+    @pytest.mark.parametrize('size', [100, LARGE + 100])
+    def test_strict_encoding_uses_latin1(self, temp_dir, size):
+        """Test strict_encoding decodes with latin-1"""
+        data = b'caf\xe9 ' * (size // 5)
+        path = _write(temp_dir / 'legacy.txt', data)
+
+        ctx = ContextManager(strict_encoding=True).build_file_context(path)
+
+        assert not ctx.is_binary
+        assert ctx.content == data.decode('latin-1')
+        assert ctx.encoding == 'latin-1'
+
+    def test_default_replaces_bad_bytes(self, temp_dir):
+        """Test the default decode replaces undecodable bytes"""
+        path = _write(temp_dir / 'legacy.txt', b'caf\xe9')
+
+        ctx = ContextManager().build_file_context(path)
+
+        assert ctx.content == 'caf�'
+        assert ctx.encoding == 'utf-8-replace'
+
+
+class TestDirectoryScan:
+    """Directory walking, filters and ordering"""
+
+    @pytest.fixture
+    def tree(self, temp_dir):
+        _write(temp_dir / 'main.py', b'print(1)\n')
+        _write(temp_dir / 'cache.pyc', b'\x00')
+        _write(temp_dir / 'node_modules' / 'dep' / 'index.js', b'x\n')
+        _write(temp_dir / 'pkg' / '__pycache__' / 'mod.cpython-311.pyc', b'\x00')
+        _write(temp_dir / 'pkg' / 'mod.py', b'y = 2\n')
+        _write(temp_dir / 'pkg' / 'notes.txt', b'notes\n')
+        _write(temp_dir / 'docs' / 'readme.md', b'# hi\n')
+        return temp_dir
+
+    def _rel(self, ctx: WorkspaceContext, root: Path):
+        return sorted(os.path.relpath(f.path_str, root) for f in ctx.files)
+
+    def test_default_excludes_prune_directories(self, tree):
+        """Test excluded directories and names are skipped"""
+        ctx = ContextManager().build_directory_context(tree)
+
+        assert self._rel(ctx, tree) == [
+            'docs/readme.md', 'main.py', 'pkg/mod.py', 'pkg/notes.txt'
+        ]
+
+    def test_path_and_include_patterns(self, tree):
+        """Test '/' patterns and include patterns"""
+        cm = ContextManager()
+
+        ctx = cm.build_directory_context(tree, exclude_patterns=['pkg/*.txt', 'node_modules'])
+        assert 'pkg/notes.txt' not in self._rel(ctx, tree)
+        assert 'pkg/mod.py' in self._rel(ctx, tree)
+
+        ctx = cm.build_directory_context(tree, include_patterns=['*.py'])
+        assert self._rel(ctx, tree) == ['main.py', 'pkg/mod.py']
+
+    def test_non_recursive(self, tree):
+        """Test recursive=False only reads the top level"""
+        ctx = ContextManager().build_directory_context(tree, recursive=False)
+        assert self._rel(ctx, tree) == ['main.py']
+
+    def test_parallel_scan_matches_serial(self, temp_dir):
+        """Test threaded reads yield the same files in the same order"""
+        for i in range(300):
+            _write(temp_dir / f'd{i % 7}' / f'f{i}.txt', f'file {i}\n'.encode())
+
+        serial = ContextManager(max_workers=1).build_directory_context(temp_dir)
+        parallel = ContextManager(max_workers=8).build_directory_context(temp_dir)
+
+        assert [f.path_str for f in parallel.files] == [f.path_str for f in serial.files]
+        assert [f.content for f in parallel.files] == [f.content for f in serial.files]
+        assert parallel.file_count == 300
+
+    def test_large_files_hold_no_descriptors(self, temp_dir):
+        """Test scanning more large files than the open-file limit allows"""
+        resource = pytest.importorskip('resource')
+        count = 120
+        for i in range(count):
+            _write(temp_dir / f'big{i}.txt', bytes([97 + i % 26]) * (LARGE + 100))
+
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        in_use = len(os.listdir('/proc/self/fd')) if os.path.isdir('/proc/self/fd') else 32
+        limit = in_use + 32
+        if limit >= count or (hard != resource.RLIM_INFINITY and limit > hard):
+            pytest.skip("can't lower RLIMIT_NOFILE below the file count")
+
+        resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+        try:
+            ctx = ContextManager(max_workers=4).build_directory_context(temp_dir)
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+        assert ctx.file_count == count
+        for f in ctx.files:
+            i = int(os.path.basename(f.path_str)[3:-4])
+            assert f.content == chr(97 + i % 26) * (LARGE + 100)
+
+    def test_root_path_kept_as_given(self, tree, monkeypatch):
+        """Test file paths keep the root as passed (like Path.glob)"""
+        monkeypatch.chdir(tree)
+
+        ctx = ContextManager().build_directory_context(Path('pkg/..'), include_patterns=['*.md'])
+        assert [f.path_str for f in ctx.files] == [os.path.join('pkg', '..', 'docs', 'readme.md')]
+
+        ctx = ContextManager().build_directory_context(Path('.'), include_patterns=['*.md'])
+        assert [f.path_str for f in ctx.files] == [os.path.join('docs', 'readme.md')]
+
+    def test_missing_directory(self, temp_dir):
+        """Test scanning a missing directory raises ContextError"""
+        with pytest.raises(ContextError):
+            ContextManager().build_directory_context(temp_dir / 'missing')
+
+
+class TestFileCache:
+    """File context cache"""
+
+    def test_cache_hit(self, temp_file):
+        """Test an unchanged file is served from the cache"""
+        cm = ContextManager()
+        first = cm.build_file_context(temp_file)
+        assert cm.build_file_context(temp_file) is first
+        assert cm.get_cache_stats()['cached_files'] == 1
+
+    def test_invalidated_on_size_change(self, temp_file):
+        """Test a size change re-reads the file"""
+        cm = ContextManager()
+        cm.build_file_context(temp_file)
+
+        temp_file.write_text("longer test content")
+        assert cm.build_file_context(temp_file).content == "longer test content"
+
+    def test_invalidated_on_mtime_change(self, temp_file):
+        """Test a same-size change with a new mtime re-reads the file"""
+        cm = ContextManager()
+        cm.build_file_context(temp_file)
+        st = temp_file.stat()
+
+        temp_file.write_text("TEST CONTENT")
+        os.utime(temp_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert cm.build_file_context(temp_file).content == "TEST CONTENT"
+
+    def test_lru_bound(self, temp_dir):
+        """Test the cache keeps at most max_cached_files entries"""
+        cm = ContextManager(max_cached_files=4)
+        for i in range(10):
+            cm.build_file_context(_write(temp_dir / f'f{i}.txt', b'x'))
+
+        assert cm.get_cache_stats()['cached_files'] == 4
+        cm.clear_cache()
+        assert cm.get_cache_stats() == {'cached_files': 0, 'cache_size': 0}
+
+    def test_large_file_read_after_change(self, temp_dir):
+        """Test a large file changed after the scan is read as it is now"""
+        path = _write(temp_dir / 'big.txt', b'a' * (LARGE + 10))
+        ctx = ContextManager().build_file_context(path)
+
+        _write(path, b'b' * 10)
+        assert ctx.content == 'b' * 10
+
+
+def _baseline_optimize(files, max_size, threshold):
+    """optimize_context as originally written (sort, then take until full)"""
+    relevant = [f for f in files if f.relevance_score >= threshold]
+    relevant.sort(key=lambda f: f.relevance_score, reverse=True)
+    kept, total = [], 0
+    for f in relevant:
+        if total + f.size > max_size:
+            break
+        kept.append(f)
+        total += f.size
+    return kept
+
+
+class TestOptimizeContext:
+    """Relevance-based context selection"""
+
+    def test_matches_baseline_selection(self):
+        """Test the streaming selection equals sort-and-take"""
+        rng = random.Random(7)
+        cm = ContextManager()
+
+        for _ in range(200):
+            ws = WorkspaceContext(workspace_path=Path('.'))
+            for i in range(rng.randint(0, 30)):
+                ws.add_file(FileContext(
+                    path=f'f{i}.py',
+                    content='',
+                    size=rng.randint(0, 100),
+                    relevance_score=rng.choice([0.2, 0.5, 0.7, 0.9, 1.0])
+                ))
+            max_size = rng.randint(1, 800)
+
+            expected = _baseline_optimize(ws.files, max_size, 0.5)
+            optimized = cm.optimize_context(ws, max_size=max_size)
+
+            assert optimized.files == expected
+            assert optimized.total_size == sum(f.size for f in expected)
+
+
+class TestBinaryCache:
+    """Persisted binary/text verdicts"""
+
+    def test_off_by_default(self):
+        """Test get_context_manager() does not persist verdicts"""
+        assert get_context_manager(force_new=True)._binary_cache is None
+
+    def test_shared_per_path(self, tmp_path):
+        """Test managers using the same file share one cache"""
+        path = tmp_path / 'binary_cache.json'
+        first = ContextManager(binary_cache_path=path)
+        second = ContextManager(binary_cache_path=path)
+        assert first._binary_cache is second._binary_cache
+
+    def test_verdict_reused(self, tmp_path, monkeypatch):
+        """Test a saved binary verdict skips reading the file"""
+        cache_path = tmp_path / 'binary_cache.json'
+        blob = _write(tmp_path / 'blob.xyz', b'\x00' * 100)
+
+        cm = ContextManager(binary_cache_path=cache_path)
+        assert cm.build_file_context(blob).is_binary
+        cm.clear_cache()
+
+        def no_read(*args, **kwargs):
+            raise AssertionError("file read")
+
+        monkeypatch.setattr(ContextManager, '_read_and_classify', no_read)
+        assert cm.build_file_context(blob).is_binary
+
+    def test_save_merges_with_disk(self, tmp_path):
+        """Test saving keeps verdicts written by another process"""
+        path = tmp_path / 'binary_cache.json'
+        ours = _BinaryCache(path)
+        theirs = _BinaryCache(path)
+
+        theirs.record('/a', (1, 2), True)
+        theirs.save()
+        ours.record('/b', (3, 4), False)
+        ours.save()
+
+        merged = _BinaryCache(path)
+        assert merged.lookup('/a', (1, 2)) is True
+        assert merged.lookup('/b', (3, 4)) is False
+        assert merged.lookup('/a', (1, 3)) is None
@@ -0,0 +1,410 @@
+"""Tests for the dual-model orchestrator and its caches (stub API client)"""
+
+import json
+import threading
+import time
+import pytest
+from dataclasses import replace
+from types import SimpleNamespace
+
+np = pytest.importorskip('numpy')
+
+from grokflow.dual_model import (
+    DualModelOrchestrator, LLMCache, SemanticCache, compress_context
+)
+
+PLANNER = DualModelOrchestrator.DEFAULT_PLANNER_CONFIG.name
+EXECUTOR = DualModelOrchestrator.DEFAULT_EXECUTOR_CONFIG.name
+
+
+def _response(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeClient:
+    """
+    Stand-in for GrokAPIClient
+
+    `reply(model, messages)` produces each completion; `stream_reply` the
+    chunks of a streamed one. Every call is recorded.
+    """
+
+    def __init__(self, reply=None, stream_reply=None):
+        self.reply = reply or (lambda model, messages: f"{model} reply")
+        self.stream_reply = stream_reply
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def validate_model(self, model):
+        pass
+
+    def validate_models(self, models):
+        pass
+
+    def chat_completion(self, messages, model, temperature=0.7, max_tokens=None, stream=False):
+        with self._lock:
+            self.calls.append((model, list(messages)))
+        return _response(self.reply(model, messages))
+
+    def stream_completion(self, messages, model, temperature=0.7, max_tokens=None):
+        with self._lock:
+            self.calls.append((model, list(messages)))
+        return iter(self.stream_reply(model, messages))
+
+    def calls_to(self, model):
+        return [messages for m, messages in self.calls if m == model]
+
+
+class FakeEngine:
+    """Embedding engine with fixed vectors per text"""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.encoded = []
+        self.model = self
+
+    def encode(self, texts, normalize_embeddings=True):
+        self.encoded.extend(texts)
+        return [np.asarray(self.vectors[t], dtype=np.float32) for t in texts]
+
+
+def _has_plan(messages):
+    return any(m['role'] == 'assistant' and m['content'].startswith('Plan:') for m in messages)
+
+
+class TestLLMCache:
+    """Tests for the exact-match response cache"""
+
+    def test_hit_and_miss(self):
+        """Should call the API once for repeated deterministic requests"""
+        client = FakeClient()
+        cache = LLMCache()
+        messages = [{'role': 'user', 'content': 'hi'}]
+
+        first = cache.complete(client, messages, 'm', temperature=0)
+        second = cache.complete(client, messages, 'm', temperature=0)
+
+        assert first == second == 'm reply'
+        assert len(client.calls) == 1
+        assert cache.stats() == {'hits': 1, 'misses': 1}
+
+        cache.complete(client, messages, 'm', temperature=0, max_tokens=10)
+        assert len(client.calls) == 2
+
+    def test_temperature_bypass(self):
+        """Should not cache sampled requests unless asked to"""
+        client = FakeClient()
+        messages = [{'role': 'user', 'content': 'hi'}]
+
+        cache = LLMCache()
+        cache.complete(client, messages, 'm', temperature=0.7)
+        cache.complete(client, messages, 'm', temperature=0.7)
+        assert len(client.calls) == 2
+        assert cache.stats() == {'hits': 0, 'misses': 0}
+
+        cache = LLMCache(cache_nondeterministic=True)
+        cache.complete(client, messages, 'm', temperature=0.7)
+        cache.complete(client, messages, 'm', temperature=0.7)
+        assert len(client.calls) == 3
+
+
+class TestSemanticCache:
+    """Tests for the similarity cache"""
+
+    VECTORS = {
+        'a': [1.0, 0.0, 0.0],
+        'a-ish': [0.95, 0.3122499, 0.0],   # cosine 0.95 with 'a'
+        'a-far': [0.8, 0.6, 0.0],          # cosine 0.80 with 'a'
+        'b': [0.0, 1.0, 0.0],
+        'c': [0.0, 0.0, 1.0],
+    }
+
+    def test_threshold(self):
+        """Should hit only above the similarity threshold"""
+        cache = SemanticCache(engine=FakeEngine(self.VECTORS), threshold=0.92)
+        cache.set('a', 'answer')
+
+        assert cache.get('a-ish') == 'answer'
+        assert cache.get('a-far') is None
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+    def test_lru_eviction(self):
+        """Should replace the least recently used entry when full"""
+        cache = SemanticCache(engine=FakeEngine(self.VECTORS), max_entries=2)
+        cache.set('a', 'A')
+        cache.set('b', 'B')
+        assert cache.get('a') == 'A'
+
+        cache.set('c', 'C')
+
+        assert cache.get('a') == 'A'
+        assert cache.get('b') is None
+        assert cache.get('c') == 'C'
+
+    def test_last_query_embedding_reused(self):
+        """Should embed a missed query once for get() and set()"""
+        engine = FakeEngine(self.VECTORS)
+        cache = SemanticCache(engine=engine)
+
+        assert cache.get('a') is None
+        cache.set('a', 'A')
+
+        assert engine.encoded == ['a']
+
+    def test_scope_must_match(self):
+        """Should only hit entries stored under the same scope"""
+        cache = SemanticCache(engine=FakeEngine(self.VECTORS))
+        cache.set('a', 'A1', scope='ctx1')
+        cache.set('a', 'A2', scope='ctx2')
+
+        assert cache.get('a-ish', scope='ctx2') == 'A2'
+        assert cache.get('a', scope='ctx1') == 'A1'
+        assert cache.get('a') is None
+
+    def test_clear(self):
+        """Should drop every entry"""
+        cache = SemanticCache(engine=FakeEngine(self.VECTORS))
+        cache.set('a', 'A')
+        cache.clear()
+        assert cache.get('a') is None
+
+
+class TestOrchestratorCaching:
+    """Tests for cache use in DualModelOrchestrator"""
+
+    def _orchestrator(self, client, **kwargs):
+        engine = FakeEngine({
+            'fix bug': [1.0, 0.0],
+            'debug it': [0.99, 0.1410674],
+        })
+        return DualModelOrchestrator(
+            api_client=client, semantic_cache=SemanticCache(engine=engine), **kwargs
+        )
+
+    def test_semantic_hit_skips_models(self):
+        """Should answer a near-duplicate request from the cache"""
+        client = FakeClient()
+        orchestrator = self._orchestrator(client)
+
+        first = orchestrator.process_request('fix bug')
+        calls = len(client.calls)
+        assert orchestrator.process_request('debug it') == first
+        assert len(client.calls) == calls
+
+    def test_context_matched_exactly(self):
+        """Should not share responses between contexts, however long"""
+        client = FakeClient(
+            reply=lambda model, messages: messages[-1]['content'].split('version=')[1][0]
+        )
+        orchestrator = self._orchestrator(client, enable_planner=False)
+        preamble = "shared file header\n" * 2000
+
+        first = orchestrator.process_request('fix bug', context=preamble + "version=1")
+        second = orchestrator.process_request('fix bug', context=preamble + "version=2")
+        again = orchestrator.process_request('debug it', context=preamble + "version=1")
+
+        assert first != second
+        assert again == first
+        assert len(client.calls) == 2
+
+    def test_history_and_stream_bypass(self):
+        """Should not use the cache with history or streaming"""
+        client = FakeClient(stream_reply=lambda model, messages: ['x'])
+        orchestrator = self._orchestrator(client, enable_planner=False)
+        orchestrator.process_request('fix bug')
+
+        history = [{'role': 'user', 'content': 'earlier'}]
+        orchestrator.process_request('fix bug', conversation_history=history)
+        list(orchestrator.process_request('fix bug', stream=True))
+
+        assert len(client.calls) == 3
+        assert orchestrator.semantic_cache.stats()['hits'] == 0
+
+    def test_response_cache_used_for_plan_and_execution(self):
+        """Should serve repeated deterministic calls from the response cache"""
+        client = FakeClient()
+        orchestrator = DualModelOrchestrator(
+            api_client=client,
+            response_cache=LLMCache(),
+            planner_config=replace(DualModelOrchestrator.DEFAULT_PLANNER_CONFIG, temperature=0),
+            executor_config=replace(DualModelOrchestrator.DEFAULT_EXECUTOR_CONFIG, temperature=0)
+        )
+
+        orchestrator.process_request('task')
+        orchestrator.process_request('task')
+
+        assert len(client.calls) == 2
+
+
+class TestBatch:
+    """Tests for process_batch()"""
+
+    @staticmethod
+    def _reply(model, messages):
+        content = messages[-1]['content']
+        if not content.startswith('Process the following'):
+            return f"single:{content}"
+        rows = [line for line in content.splitlines() if line.startswith('[')]
+        if len(rows) > 2:
+            return "Sorry, I can't do that as JSON."
+        return json.dumps({str(i): f"batched:{row[4:]}" for i, row in enumerate(rows, 1)})
+
+    def test_packed_replies(self):
+        """Should answer prompts in order with one call per group"""
+        client = FakeClient(self._reply)
+        orchestrator = DualModelOrchestrator(api_client=client)
+
+        results = orchestrator.process_batch(['p1', 'p2', 'p3', 'p4'], batch_rows=2)
+
+        assert results == ['batched:p1', 'batched:p2', 'batched:p3', 'batched:p4']
+        assert len(client.calls) == 2
+
+    def test_unparseable_reply_splits(self):
+        """Should split a group whose reply breaks the JSON contract"""
+        client = FakeClient(self._reply)
+        orchestrator = DualModelOrchestrator(api_client=client)
+
+        results = orchestrator.process_batch(
+            ['p1', 'p2', 'p3'], batch_rows=3, max_concurrency=1
+        )
+
+        # 3 rows fail, then [p1] alone and [p2, p3] packed
+        assert results == ['single:p1', 'batched:p2', 'batched:p3']
+        assert len(client.calls) == 3
+
+
+class TestSpeculative:
+    """Tests for speculative execution"""
+
+    def test_plan_wins(self):
+        """Should rerun the executor with the plan when it arrives first"""
+        def reply(model, messages):
+            if model == PLANNER:
+                return "the plan"
+            if _has_plan(messages):
+                return "planned answer"
+            time.sleep(0.3)
+            return "draft answer"
+
+        client = FakeClient(reply)
+        orchestrator = DualModelOrchestrator(api_client=client, speculative=True)
+
+        assert orchestrator.process_request('task') == "planned answer"
+        assert any(_has_plan(m) for m in client.calls_to(EXECUTOR))
+
+    def test_draft_wins(self):
+        """Should return the draft when it finishes before the plan"""
+        def reply(model, messages):
+            if model == PLANNER:
+                time.sleep(0.3)
+                return "the plan"
+            return "planned answer" if _has_plan(messages) else "draft answer"
+
+        client = FakeClient(reply)
+        orchestrator = DualModelOrchestrator(api_client=client, speculative=True)
+
+        assert orchestrator.process_request('task') == "draft answer"
+        assert not any(_has_plan(m) for m in client.calls_to(EXECUTOR))
+
+    def test_planner_failure_uses_draft(self):
+        """Should fall back to the draft when the planner fails"""
+        def reply(model, messages):
+            if model == PLANNER:
+                raise RuntimeError("planner down")
+            time.sleep(0.05)
+            return "draft answer"
+
+        client = FakeClient(reply)
+        orchestrator = DualModelOrchestrator(api_client=client, speculative=True)
+
+        assert orchestrator.process_request('task') == "draft answer"
+
+
+class TestPipelined:
+    """Tests for planner/executor pipelining"""
+
+    FIRST = "step one " * 30  # past PIPELINE_MIN_CHARS
+
+    @staticmethod
+    def _reply(model, messages):
+        plan = next(m['content'] for m in messages if m['role'] == 'assistant')
+        return f"executed {len(plan) - len('Plan:' + chr(10))} chars"
+
+    def test_keeps_early_result(self):
+        """Should keep the early executor result if the plan barely grows"""
+        chunks = [self.FIRST, "\n\n", "done."]
+        client = FakeClient(self._reply, stream_reply=lambda model, messages: chunks)
+        orchestrator = DualModelOrchestrator(api_client=client, pipeline_planner=True)
+
+        result = orchestrator.process_request('task')
+
+        assert result == f"executed {len(self.FIRST)} chars"
+        assert len(client.calls_to(EXECUTOR)) == 1
+
+    def test_reruns_when_plan_grows(self):
+        """Should rerun the executor on the full plan if it grew past tolerance"""
+        chunks = [self.FIRST, "\n\n", "step two " * 30]
+        client = FakeClient(self._reply, stream_reply=lambda model, messages: chunks)
+        orchestrator = DualModelOrchestrator(api_client=client, pipeline_planner=True)
+
+        result = orchestrator.process_request('task')
+
+        assert result == f"executed {len(''.join(chunks))} chars"
+        assert len(client.calls_to(EXECUTOR)) in (1, 2)
+        assert client.calls_to(EXECUTOR)[-1][-2]['content'] == "Plan:\n" + ''.join(chunks)
+
+    def test_planner_stream_failure(self):
+        """Should fall back to the executor alone if the plan stream fails"""
+        def broken(model, messages):
+            yield "partial"
+            raise RuntimeError("stream dropped")
+
+        client = FakeClient(stream_reply=broken)
+        orchestrator = DualModelOrchestrator(api_client=client, pipeline_planner=True)
+
+        assert orchestrator.process_request('task') == f"{EXECUTOR} reply"
+
+
+class TestCompressContext:
+    """Tests for planner context compression"""
+
+    def test_small_context_unchanged(self):
+        """Should return context within budget as-is"""
+        context = "x = 1\n"
+        assert compress_context(context, max_tokens=100) is context
+
+    def test_python_outline(self):
+        """Should reduce Python source to imports and signatures"""
+        body = "    value = compute()\n" * 50
+        source = (
+            f"import os\n\n\ndef run(a, b):\n{body}\n\n"
+            f"class Thing:\n    def go(self):\n    {body.replace(chr(10), chr(10) + '    ')}"
+        )
+
+        outline = compress_context(source, max_tokens=50)
+
+        assert "import os" in outline
+        assert "def run(a, b):" in outline
+        assert "class Thing:" in outline
+        assert "compute()" not in outline
+
+    def test_head_and_tail(self):
+        """Should keep head and tail of non-Python text"""
+        text = "a" * 1000 + "b" * 1000
+
+        compressed = compress_context(text, max_tokens=100)
+
+        assert compressed.startswith("a" * 266)
+        assert compressed.endswith("b" * 134)
+        assert "[1600 characters omitted]" in compressed
+
+    def test_planner_sees_compressed_context(self):
+        """Should compress context for the planner only"""
+        client = FakeClient()
+        orchestrator = DualModelOrchestrator(api_client=client, planner_context_tokens=10)
+        context = "z" * 1000
+
+        orchestrator.process_request('task', context=context)
+
+        assert context not in client.calls_to(PLANNER)[0][-1]['content']
+        assert context in client.calls_to(EXECUTOR)[0][0]['content']
@@ -343,6 +343,44 @@ class TestGUKSAnalytics:
         assert len(recurring) == 1, f"Expected 1 recurring pattern, got {len(recurring)}"
         assert recurring[0]['count'] == 3
 
+    def test_results_computed_once(self):
+        """Test recurring bugs and rules are cached per instance"""
+        analytics = GUKSAnalytics(generate_test_patterns_with_recurring())
+
+        recurring = analytics.detect_recurring_bugs()
+        recurring.clear()  # Callers get their own list
+        rules = analytics.suggest_constraint_rules()
+
+        assert analytics.detect_recurring_bugs() == analytics.detect_recurring_bugs()
+        assert len(analytics.detect_recurring_bugs()) > 0
+        assert analytics.detect_recurring_bugs(min_count=1) != analytics.detect_recurring_bugs()
+        assert analytics.suggest_constraint_rules() == rules
+
+        insights = analytics.get_team_insights()
+        assert insights['recurring_bugs'] == len(analytics.detect_recurring_bugs())
+        assert insights['constraint_rules_suggested'] == len(rules)
+
+    def test_recent_window_chronological(self):
+        """Test time-window filtering on patterns stored oldest-first"""
+        now = datetime.now()
+        patterns = [
+            {
+                'error': f'Error {i}',
+                'fix': 'Fixed',
+                'timestamp': (now - timedelta(days=59.5 - i)).isoformat()
+            }
+            for i in range(60)
+        ]
+        analytics = GUKSAnalytics(patterns)
+
+        assert analytics.get_team_insights(days=7)['recent_patterns'] == 7
+        assert analytics.get_team_insights(days=30)['recent_patterns'] == 30
+        assert analytics.get_team_insights(days=90)['recent_patterns'] == 60
+
+        # Out-of-order patterns give the same counts
+        shuffled = GUKSAnalytics(patterns[::2] + patterns[1::2])
+        assert shuffled.get_team_insights(days=30)['recent_patterns'] == 30
+
     def test_empty_patterns(self):
         """Test analytics with empty patterns (graceful handling)"""
         analytics = GUKSAnalytics([])
@@ -0,0 +1,236 @@
+"""
+GUKS Embedding Tests
+
+Validates incremental index maintenance with a stub sentence model:
+  - Single pattern adds
+  - Syncing a cached index with patterns.json
+  - Periodic index saves
+  - The on-disk embedding cache
+"""
+
+import hashlib
+import json
+import pytest
+import numpy as np
+
+pytest.importorskip('faiss')
+pytest.importorskip('sentence_transformers')
+
+from grokflow.guks import embeddings
+from grokflow.guks.embeddings import EnhancedGUKS, GUKSEmbeddingEngine, _pattern_text
+
+
+class StubModel:
+    """Stand-in for SentenceTransformer: hashed bag-of-words vectors"""
+
+    def __init__(self, encoded, dimension=384):
+        self.encoded = encoded
+        self.dimension = dimension
+
+    def encode(self, texts, **kwargs):
+        self.encoded.extend(texts)
+        vectors = np.zeros((len(texts), self.dimension), dtype='float32')
+        for i, text in enumerate(texts):
+            for word in text.lower().split():
+                digest = hashlib.sha256(word.encode('utf-8')).digest()
+                vectors[i, int.from_bytes(digest[:4], 'little') % self.dimension] += 1.0
+        return vectors
+
+
+@pytest.fixture
+def encoded(monkeypatch):
+    """Texts passed to the (stubbed) sentence model"""
+    texts = []
+    monkeypatch.setattr(embeddings, 'SentenceTransformer', lambda name: StubModel(texts))
+    return texts
+
+
+@pytest.fixture
+def guks_dir(temp_dir, monkeypatch):
+    """GUKS data directory; the default embedding cache goes under temp_dir"""
+    monkeypatch.setenv('HOME', str(temp_dir))
+    data_dir = temp_dir / 'guks'
+    data_dir.mkdir()
+    return data_dir
+
+
+def make_patterns(n: int, start: int = 0) -> list:
+    """Distinct patterns with no words in common"""
+    return [
+        {
+            'error': f'Error{i} in module{i}',
+            'fix': f'fixed{i} by patch{i}',
+            'file': f'file{i}.py',
+            'project': 'demo'
+        }
+        for i in range(start, start + n)
+    ]
+
+
+def write_patterns(data_dir, patterns: list) -> None:
+    with open(data_dir / 'patterns.json', 'w') as f:
+        json.dump(patterns, f)
+
+
+class TestIncrementalIndex:
+    """Tests for adding patterns to a built index"""
+
+    def test_added_pattern_is_searchable(self, temp_dir, encoded):
+        """Test add_pattern results appear in search"""
+        engine = GUKSEmbeddingEngine(cache_dir=str(temp_dir))
+        engine.build_index(make_patterns(3))
+
+        new = make_patterns(1, start=3)[0]
+        engine.add_pattern(new)
+
+        results = engine.search(_pattern_text(new), top_k=1)
+        assert results[0]['error'] == new['error']
+        assert results[0]['similarity'] == pytest.approx(1.0)
+        assert engine.index.ntotal == 4
+        # Existing patterns were not encoded again
+        assert encoded[:4] == [_pattern_text(p) for p in make_patterns(4)]
+
+    def test_add_to_empty_engine(self, temp_dir, encoded):
+        """Test add_patterns creates the index when none was built"""
+        engine = GUKSEmbeddingEngine(cache_dir=str(temp_dir))
+        engine.add_patterns(make_patterns(2))
+
+        assert engine.index.ntotal == 2
+        assert engine.search(_pattern_text(make_patterns(1)[0]))[0]['fix'] == 'fixed0 by patch0'
+
+
+class TestSyncIndex:
+    """Tests for EnhancedGUKS keeping the cached index in step"""
+
+    def test_appends_patterns_recorded_after_save(self, guks_dir, encoded, monkeypatch):
+        """Test patterns recorded since the last save are added, not rebuilt"""
+        write_patterns(guks_dir, make_patterns(3))
+        guks = EnhancedGUKS(data_dir=str(guks_dir))
+        for pattern in make_patterns(2, start=3):
+            guks.record_fix(pattern)
+
+        def no_rebuild(self, patterns):
+            raise AssertionError("index rebuilt")
+
+        monkeypatch.setattr(GUKSEmbeddingEngine, 'build_index', no_rebuild)
+        encoded.clear()
+        reloaded = EnhancedGUKS(data_dir=str(guks_dir))
+
+        engine = reloaded.embedding_engine
+        assert encoded == [_pattern_text(p) for p in reloaded.patterns[3:]]
+        assert engine.index.ntotal == 5
+        assert [p['error'] for p in engine.patterns] == [p['error'] for p in reloaded.patterns]
+
+    def test_rebuilds_when_index_is_ahead(self, guks_dir, encoded):
+        """Test an index holding more patterns than the file is rebuilt"""
+        write_patterns(guks_dir, make_patterns(5))
+        EnhancedGUKS(data_dir=str(guks_dir))
+
+        write_patterns(guks_dir, make_patterns(2, start=10))
+        reloaded = EnhancedGUKS(data_dir=str(guks_dir))
+
+        engine = reloaded.embedding_engine
+        assert engine.index.ntotal == 2
+        assert [p['error'] for p in engine.patterns] == ['Error10 in module10', 'Error11 in module11']
+
+    def test_in_sync_index_untouched(self, guks_dir, encoded, monkeypatch):
+        """Test a matching index is used as loaded"""
+        write_patterns(guks_dir, make_patterns(3))
+        EnhancedGUKS(data_dir=str(guks_dir))
+
+        saves = []
+        monkeypatch.setattr(GUKSEmbeddingEngine, 'save_index', lambda self, name='default': saves.append(name))
+        encoded.clear()
+        EnhancedGUKS(data_dir=str(guks_dir))
+
+        assert encoded == []
+        assert saves == []
+
+
+class TestRecordFix:
+    """Tests for recording fixes"""
+
+    def test_index_saved_every_interval(self, guks_dir, encoded, monkeypatch):
+        """Test save_index runs once per INDEX_SAVE_INTERVAL recorded fixes"""
+        write_patterns(guks_dir, make_patterns(1))
+        guks = EnhancedGUKS(data_dir=str(guks_dir))
+
+        monkeypatch.setattr(embeddings, 'INDEX_SAVE_INTERVAL', 3)
+        saves = []
+        save_index = GUKSEmbeddingEngine.save_index
+        monkeypatch.setattr(
+            GUKSEmbeddingEngine, 'save_index',
+            lambda self, name='default': (saves.append(len(self.patterns)), save_index(self, name))
+        )
+
+        for pattern in make_patterns(7, start=1):
+            guks.record_fix(pattern)
+
+        assert saves == [4, 7]
+        with open(guks_dir / 'patterns.json') as f:
+            assert len(json.load(f)) == 8
+
+
+class TestEmbeddingCache:
+    """Tests for the emb_cache.npz embedding cache"""
+
+    def test_rebuild_encodes_only_new_texts(self, temp_dir, encoded):
+        """Test a rebuild in a new engine reuses cached embeddings"""
+        GUKSEmbeddingEngine(cache_dir=str(temp_dir)).build_index(make_patterns(3))
+
+        encoded.clear()
+        engine = GUKSEmbeddingEngine(cache_dir=str(temp_dir))
+        engine.build_index(make_patterns(4))
+
+        assert encoded == [_pattern_text(make_patterns(1, start=3)[0])]
+        assert engine.search(_pattern_text(make_patterns(1)[0]), top_k=1)[0]['error'] == 'Error0 in module0'
+
+    def test_build_prunes_cache(self, temp_dir, encoded):
+        """Test build_index keeps only the indexed patterns' embeddings"""
+        engine = GUKSEmbeddingEngine(cache_dir=str(temp_dir))
+        engine.build_index(make_patterns(4))
+        engine.build_index(make_patterns(2))
+
+        assert len(engine._embedding_cache) == 2
+        with np.load(engine.embedding_cache_path) as data:
+            assert len(data['keys']) == 2
+
+    @pytest.mark.parametrize('write_cache', [
+        lambda path: path.write_bytes(b'not an npz file'),
+        lambda path: np.savez(path, keys=np.array(['k']), vectors=np.zeros((1, 8))),
+    ], ids=['unreadable', 'wrong-dimension'])
+    def test_bad_cache_ignored(self, temp_dir, encoded, write_cache):
+        """Test an unreadable or wrong-dimension cache is ignored"""
+        engine = GUKSEmbeddingEngine(cache_dir=str(temp_dir))
+        write_cache(engine.embedding_cache_path)
+
+        engine.build_index(make_patterns(2))
+
+        assert encoded == [_pattern_text(p) for p in make_patterns(2)]
+        assert engine.index.ntotal == 2
+        with np.load(engine.embedding_cache_path) as data:
+            assert data['vectors'].shape == (2, engine.dimension)
+
+    def test_save_leaves_no_tmp_file(self, temp_dir, encoded):
+        """Test the cache file is replaced in one step"""
+        engine = GUKSEmbeddingEngine(cache_dir=str(temp_dir))
+        engine.build_index(make_patterns(2))
+
+        assert sorted(p.name for p in temp_dir.iterdir()) == ['emb_cache.npz']
+
+    def test_failed_save_keeps_previous_cache(self, temp_dir, encoded, monkeypatch):
+        """Test a failed write leaves the old cache and no .tmp file"""
+        engine = GUKSEmbeddingEngine(cache_dir=str(temp_dir))
+        engine.build_index(make_patterns(2))
+        before = engine.embedding_cache_path.read_bytes()
+
+        def failing_savez(f, **arrays):
+            f.write(b'partial')
+            raise OSError("disk full")
+
+        monkeypatch.setattr(np, 'savez', failing_savez)
+        with pytest.raises(OSError):
+            engine.build_index(make_patterns(3))
+
+        assert engine.embedding_cache_path.read_bytes() == before
+        assert sorted(p.name for p in temp_dir.iterdir()) == ['emb_cache.npz']
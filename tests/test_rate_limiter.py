@@ -0,0 +1,146 @@
+"""Tests for API throttling (TokenBucket, AIMDLimiter)"""
+
+import pytest
+
+import grokflow.rate_limiter as rate_limiter
+from grokflow.rate_limiter import AIMDLimiter, TokenBucket
+
+
+class FakeClock:
+    """Stand-in for the time module: sleep() advances monotonic()"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Patch the rate limiter's clock"""
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, 'time', fake)
+    return fake
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket"""
+
+    def test_burst_then_wait(self, clock):
+        """Should allow a full burst, then wait for the refill"""
+        bucket = TokenBucket(rate=2.0, capacity=4)
+
+        for _ in range(4):
+            assert bucket.acquire()
+        assert clock.slept == []
+
+        assert bucket.acquire()
+        assert clock.slept == [pytest.approx(0.5)]
+
+    def test_refill_capped_at_capacity(self, clock):
+        """Should not accumulate past capacity while idle"""
+        bucket = TokenBucket(rate=1.0, capacity=2)
+        bucket.acquire(2)
+        clock.advance(100)
+
+        assert bucket.acquire(2)
+        assert not bucket.acquire(1, timeout=0.5)
+        assert clock.slept == []
+
+    def test_timeout(self, clock):
+        """Should give up when the wait exceeds the timeout"""
+        bucket = TokenBucket(rate=1.0, capacity=1)
+        bucket.acquire()
+
+        assert not bucket.acquire(timeout=0.5)
+        assert bucket.acquire(timeout=1.0)
+
+    def test_oversized_request_capped(self, clock):
+        """Should treat requests above capacity as a full bucket"""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+        assert bucket.acquire(10)
+        assert clock.slept == []
+
+    def test_drain(self, clock):
+        """Should make the next request wait a full token's refill"""
+        bucket = TokenBucket(rate=4.0, capacity=8)
+        bucket.drain()
+
+        assert bucket.acquire()
+        assert clock.slept == [pytest.approx(0.25)]
+
+    def test_set_rate_keeps_accrued_tokens(self, clock):
+        """Should accrue time before the change at the old rate"""
+        bucket = TokenBucket(rate=1.0, capacity=10)
+        bucket.drain()
+        clock.advance(2)
+        bucket.set_rate(0.1)
+
+        assert bucket.acquire(2, timeout=0)
+
+
+class TestAIMDLimiter:
+    """Tests for AIMDLimiter"""
+
+    def test_halves_on_rate_limit(self, clock):
+        """Should halve the rate per 429, down to the floor"""
+        limiter = AIMDLimiter(rpm=60, tpm=1000, min_rpm=10)
+
+        limiter.on_rate_limited()
+        assert limiter.rpm == 30
+        assert limiter.requests.rate == pytest.approx(0.5)
+
+        for _ in range(5):
+            limiter.on_rate_limited()
+        assert limiter.rpm == 10
+
+    def test_recovers_with_time(self, clock):
+        """Should regain `increase` RPM per elapsed second, not per call"""
+        limiter = AIMDLimiter(rpm=600, tpm=1000, min_rpm=1, increase=1.0)
+        for _ in range(20):
+            limiter.on_rate_limited()
+        assert limiter.rpm == 1
+
+        # Many successes in the same instant add nothing
+        for _ in range(10):
+            limiter.on_success()
+        assert limiter.rpm == 1
+
+        clock.advance(30)
+        limiter.on_success()
+        assert limiter.rpm == pytest.approx(31)
+        assert limiter.requests.rate == pytest.approx(31 / 60)
+
+        clock.advance(10_000)
+        limiter.on_success()
+        assert limiter.rpm == 600
+
+    def test_recovery_restarts_after_backoff(self, clock):
+        """Should count recovery time from the latest 429"""
+        limiter = AIMDLimiter(rpm=100, tpm=1000, increase=1.0)
+        clock.advance(60)
+        limiter.on_rate_limited()
+
+        clock.advance(5)
+        limiter.on_success()
+        assert limiter.rpm == pytest.approx(55)
+
+    def test_acquire_checks_both_buckets(self, clock):
+        """Should wait on the token bucket as well as the request bucket"""
+        limiter = AIMDLimiter(rpm=600, tpm=600)
+
+        assert limiter.acquire(estimated_tokens=100)
+        assert clock.slept == []
+        assert not limiter.acquire(estimated_tokens=100, timeout=1.0)
@@ -303,6 +303,37 @@ class TestSessionExportImport:
         assert 'context_files' in exported
         assert len(exported['context_files']) == 2
 
+    def test_export_stream_matches_export(self, temp_dir, mock_session):
+        """Test streamed export produces the same document as export_session"""
+        session_file = temp_dir / "session.json"
+        manager = SessionManager(session_file)
+
+        mock_session['conversation'] = [
+            {'role': 'user', 'content': 'Hello \u00e9'},
+            {'role': 'assistant', 'content': 'Hi there'}
+        ]
+        mock_session['context_files'] = [str(temp_dir / "file1.py")]
+        manager.save(mock_session)
+
+        manager.export_session(temp_dir / "plain.json")
+        result = manager.export_session_stream(temp_dir / "stream.json")
+
+        with open(temp_dir / "plain.json", 'r') as f:
+            plain = json.load(f)
+        with open(temp_dir / "stream.json", 'r') as f:
+            streamed = json.load(f)
+
+        plain.pop('exported_at')
+        streamed.pop('exported_at')
+        assert streamed == plain
+        assert result['items_exported']['conversation'] == 2
+
+        manager.export_session_stream(
+            temp_dir / "empty.json", include_conversation=False
+        )
+        with open(temp_dir / "empty.json", 'r') as f:
+            assert 'conversation' not in json.load(f)
+
     def test_export_without_conversation(self, temp_dir, mock_session):
         """Test export can exclude conversation"""
         session_file = temp_dir / "session.json"
@@ -430,6 +461,33 @@ class TestSessionExportImport:
         with pytest.raises(SessionCorruptedError, match="Invalid import file"):
             manager.import_session(export_file)
 
+    def test_export_import_custom_serializer(self, temp_dir, mock_session):
+        """Test export/import use the supplied dumps/loads callables"""
+        session_file = temp_dir / "session.json"
+        export_file = temp_dir / "export.json"
+        manager = SessionManager(session_file)
+
+        mock_session['conversation'] = [{'role': 'user', 'content': 'héllo'}]
+        manager.save(mock_session)
+
+        calls = []
+
+        def dumps(obj):
+            calls.append('dumps')
+            return json.dumps(obj).encode('utf-8')
+
+        def loads(data):
+            calls.append('loads')
+            assert isinstance(data, bytes)
+            return json.loads(data)
+
+        manager.export_session(export_file, dumps=dumps)
+        result = manager.import_session(export_file, loads=loads)
+
+        assert calls == ['dumps', 'loads']
+        assert result['items_imported']['conversation'] == 1
+        assert manager.load()['conversation'][0]['content'] == 'héllo'
+
     def test_import_unsupported_version_raises_error(self, temp_dir):
         """Test importing unsupported export version raises error"""
         session_file = temp_dir / "session.json"